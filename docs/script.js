@@ -1,10 +1,16 @@
 // Use a relative path so the page works when served from GitHub Pages under
 // https://<user>.github.io/<repo>/ (absolute paths starting with '/' break
 // when the site is hosted under a repo subpath).
-const DATA_PATH = 'scraper_flask/data/hackathons.json';
+const DATA_DIR = 'scraper_flask/data/';
+const DATA_PATH = DATA_DIR + 'hackathons.json';
+const MANIFEST_PATH = DATA_DIR + 'manifest.json';
 const RAW_FALLBACK = `https://raw.githubusercontent.com/JaiAnshSB26/hackathon_Scraper/main/scraper_flask/data/hackathons.json`;
+const CACHE_KEY = 'hackathons:data';
 
 let ALL = [];
+let HAYSTACKS = [];
+let ALPHA = null; // indexes of ALL in title order, built on first use
+let BY_START = null; // indexes of ALL by start date, built on first use
 let VISIBLE = [];
 let PAGE = 0;
 const PAGE_SIZE = 24;
@@ -13,14 +19,113 @@ function $id(id){return document.getElementById(id)}
 
 function setStatus(text){$id('status').textContent = text}
 
+// Mirrors record_key() in scraper_flask/flaskr/artifacts.py, i.e. url_key()
+// and canonical_url() in scraper_flask/flaskr/dedupe.py: the link without
+// scheme, `www.`, fragment, tracking parameters or trailing slash, with the
+// remaining query parameters sorted.
+const TRACKING_PARAMS = new Set(['ref', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'igshid', 'source', 'src']);
+
+function isTracking(param){
+  param = param.toLowerCase();
+  return TRACKING_PARAMS.has(param) || param.startsWith('utm_') || param.startsWith('ref_');
+}
+
+function recordKey(h){
+  const url = (h.link || '').trim();
+  const sep = url.indexOf('://');
+  if(!url) return h.title || '';
+  if(sep < 0) return url.startsWith('www.') ? url.slice(4) : url;
+  let base = url.split('#')[0];
+  const q = base.indexOf('?');
+  const query = q < 0 ? '' : base.slice(q + 1);
+  if(q >= 0) base = base.slice(0, q);
+  const rest = base.slice(sep + 3);
+  const slash = rest.indexOf('/');
+  let host = slash < 0 ? rest : rest.slice(0, slash);
+  host = host.slice(host.lastIndexOf('@') + 1).toLowerCase();
+  if(host.endsWith(':80') || host.endsWith(':443')) host = host.slice(0, host.lastIndexOf(':'));
+  const path = slash < 0 ? '' : ('/' + rest.slice(slash + 1)).replace(/\/+$/, '');
+  const params = query.split('&').filter(p => p && !isTracking(p.split('=')[0])).sort();
+  const key = host + path + (params.length ? '?' + params.join('&') : '');
+  return key.startsWith('www.') ? key.slice(4) : key;
+}
+
+function readCache(){
+  try{ return JSON.parse(localStorage.getItem(CACHE_KEY)); }catch(e){ return null; }
+}
+
+function writeCache(version, data){
+  try{ localStorage.setItem(CACHE_KEY, JSON.stringify({version, data})); }catch(e){ /* quota or private mode */ }
+}
+
+// Rebuilds the new version in the same order as its full data file: added
+// records go back to their indexes, or `order` lists every key when the kept
+// records moved relative to each other.
+function applyDelta(records, delta){
+  const removed = new Set(delta.removed);
+  const changed = new Map(delta.changed.map(h => [recordKey(h), h]));
+  const out = [];
+  records.forEach(h => {
+    const k = recordKey(h);
+    if(removed.has(k)) return;
+    out.push(changed.has(k) ? changed.get(k) : h);
+  });
+  if(delta.order){
+    const byKey = new Map(out.concat(delta.added).map(h => [recordKey(h), h]));
+    return delta.order.map(k => byKey.get(k));
+  }
+  delta.added.forEach((h, i) => out.splice(delta.added_at[i], 0, h));
+  return out;
+}
+
+async function getJSON(url, cache){
+  const res = await fetch(url, {cache});
+  if(!res.ok) throw new Error('HTTP '+res.status);
+  return res.json();
+}
+
+// manifest.json is the only file that has to be revalidated: the hashed data
+// and delta files it points to never change once published.
+async function loadFromManifest(){
+  const manifest = await getJSON(MANIFEST_PATH, 'no-cache');
+  const cached = readCache();
+  if(cached && cached.version === manifest.version) return cached.data;
+  let data = null;
+  const deltaFile = cached && manifest.deltas && manifest.deltas[cached.version];
+  if(deltaFile){
+    try{
+      data = applyDelta(cached.data, await getJSON(DATA_DIR + deltaFile, 'force-cache'));
+    }catch(err){
+      console.warn('delta unavailable, loading the full data file', err);
+    }
+  }
+  if(!data) data = await getJSON(DATA_DIR + manifest.data, 'force-cache');
+  writeCache(manifest.version, data);
+  return data;
+}
+
+async function loadLegacy(){
+  let res = await fetch(DATA_PATH, {cache:'no-store'});
+  if(!res.ok) res = await fetch(RAW_FALLBACK, {cache:'no-store'});
+  if(!res.ok) throw new Error('HTTP '+res.status);
+  return res.json();
+}
+
 async function fetchJSON(){
   setStatus('Fetching data...');
   try{
-    let res = await fetch(DATA_PATH, {cache:'no-store'});
-    if(!res.ok) res = await fetch(RAW_FALLBACK, {cache:'no-store'});
-    if(!res.ok) throw new Error('HTTP '+res.status);
-    const data = await res.json();
+    let data;
+    try{
+      data = await loadFromManifest();
+    }catch(err){
+      console.warn('manifest unavailable, falling back to hackathons.json', err);
+      data = await loadLegacy();
+    }
     ALL = Array.isArray(data) ? data : [];
+    // Lower-case each record's searchable text once instead of per keystroke.
+    HAYSTACKS = ALL.map(h => `${h.title || ''} ${h.date || ''} ${h.link || ''}`.toLowerCase());
+    ALPHA = null;
+    BY_START = null;
     setStatus(`Loaded ${ALL.length} entries`);
     applyFiltersAndRender();
   }catch(err){
@@ -65,15 +170,23 @@ function applyFiltersAndRender(){
   const q = $id('search').value.trim().toLowerCase();
   const sort = $id('sort').value;
 
-  VISIBLE = ALL.filter(h => {
-    if(!q) return true;
-    const hay = `${h.title || ''} ${h.date || ''} ${h.link || ''}`.toLowerCase();
-    return hay.includes(q);
-  });
+  let order;
+  if(sort === 'alpha'){
+    if(!ALPHA) ALPHA = ALL.map((_, i) => i).sort((a,b)=> (ALL[a].title||'').localeCompare(ALL[b].title||''));
+    order = ALPHA;
+  }else{
+    // sort_start is a precomputed YYYYMMDD integer; undated records go last.
+    if(!BY_START){
+      const ids = ALL.map((_, i) => i);
+      const dated = ids.filter(i => ALL[i].sort_start).sort((a,b)=> ALL[a].sort_start - ALL[b].sort_start);
+      BY_START = {oldest: dated.concat(ids.filter(i => !ALL[i].sort_start))};
+      BY_START.newest = dated.slice().reverse().concat(ids.filter(i => !ALL[i].sort_start));
+    }
+    order = BY_START[sort] || BY_START.newest;
+  }
 
-  if(sort === 'alpha') VISIBLE.sort((a,b)=> (a.title||'').localeCompare(b.title||''));
-  else if(sort === 'oldest') VISIBLE.reverse();
-  else VISIBLE = VISIBLE; // newest as-is (data order)
+  VISIBLE = [];
+  order.forEach(i => { if(!q || HAYSTACKS[i].includes(q)) VISIBLE.push(ALL[i]); });
 
   PAGE = 0;
   renderPage();
@@ -1,25 +1,220 @@
-def main():
-    import shutil, os
+"""Build the static site into build/.
+
+The build is incremental: build/.build-state.json remembers the content hash of
+every input and the files produced from it, so a rebuild only rewrites outputs
+whose input changed and removes outputs nothing produces any more.
+
+- style.css / script.js are minified and written as style.<hash>.css /
+  script.<hash>.js, so they can be served with a far-future cache lifetime;
+  index.html is rewritten to point at the current names.
+- data/hackathons.json is split into fixed-size shards,
+  data/shards/hackathons-<n>.<hash>.json (plus .gz, and .br when brotli is
+  installed), listed in data/index.json. The page fetches the index and the
+  first shard, renders, and pulls further shards as the user scrolls.
+  Unchanged shards keep their names, so browsers keep their cached copies.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # only .gz shards without brotli
+    brotli = None
+
+STATIC_SRC = 'src/static'                 # has index.html, css, js, etc.
+DATA_SRC = 'data/hackathons.json'         # produced by your scraper step
+BUILD_DIR = 'build'
+STATE_FILE = os.path.join(BUILD_DIR, '.build-state.json')
+SHARD_DIR = 'data/shards'
+SHARD_SIZE = 50
+
+FINGERPRINTED = ('.js', '.css')
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write(rel, data):
+    """Write build/<rel> unless it already holds exactly `data`; True if written."""
+    path = os.path.join(BUILD_DIR, rel)
+    if os.path.exists(path) and read(path) == data:
+        return False
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def minify_css(text):
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{}:;,>])\s*', r'\1', text)
+    return text.replace(';}', '}').strip()
+
+
+def minify_js(text):
+    # Conservative: drop block comments, whole-line // comments, indentation
+    # and blank lines. Nothing inside a statement is touched, so string
+    # literals and regexes stay intact.
+    text = re.sub(r'^\s*/\*.*?\*/\s*$', '', text, flags=re.S | re.M)
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
 
-    static_src = 'src/static'                 # has index.html, css, js, etc.
-    data_src   = 'data/hackathons.json'       # produced by your scraper step
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
 
-    build_dir = 'build'
-    data_dir  = os.path.join(build_dir, 'data')
 
-    # fresh build
-    if os.path.exists(build_dir):
-        shutil.rmtree(build_dir)
-    os.makedirs(build_dir, exist_ok=True)
+def load_state():
+    try:
+        with open(STATE_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'inputs': {}}
+
+
+def save_state(state):
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def build_asset(rel, data, old):
+    """Outputs for one static file; reuses the previous result if its hash is unchanged."""
+    digest = sha256(data)
+    if old and old['hash'] == digest and all(os.path.exists(os.path.join(BUILD_DIR, o)) for o in old['outputs']):
+        return old, False
+    stem, ext = os.path.splitext(rel)
+    if ext in FINGERPRINTED:
+        minified = MINIFIERS[ext](data.decode('utf-8')).encode('utf-8')
+        out = f'{stem}.{sha256(minified)[:10]}{ext}'
+    else:
+        minified, out = data, rel
+    write(out, minified)
+    return {'hash': digest, 'outputs': [out]}, True
+
+
+def compressed(rel, data):
+    """Write `rel` plus its precompressed siblings; return the names written."""
+    outputs = [rel]
+    write(rel, data)
+    write(rel + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+    outputs.append(rel + '.gz')
+    if brotli is not None:
+        write(rel + '.br', brotli.compress(data, quality=11))
+        outputs.append(rel + '.br')
+    return outputs
+
+
+def build_data(data, old):
+    """Shard the dataset and write data/index.json; returns the state entry."""
+    digest = sha256(data)
+    if old and old['hash'] == digest and all(os.path.exists(os.path.join(BUILD_DIR, o)) for o in old['outputs']):
+        return old, False
+    try:
+        records = json.loads(data)
+        if not isinstance(records, list):
+            raise ValueError('expected a JSON list')
+    except ValueError as e:
+        print(f'Skipping {DATA_SRC}: {e}')
+        # Keep whatever the last good build produced.
+        return (old or {'hash': None, 'outputs': []}), False
+
+    outputs = []
+    shards = []
+    for n, start in enumerate(range(0, len(records), SHARD_SIZE)):
+        chunk = records[start:start + SHARD_SIZE]
+        body = json.dumps(chunk, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        rel = f'{SHARD_DIR}/hackathons-{n}.{sha256(body)[:10]}.json'
+        outputs += compressed(rel, body)
+        shards.append({'file': rel, 'count': len(chunk), 'bytes': len(body)})
+
+    index = {
+        'version': digest[:12],
+        'total': len(records),
+        'shard_size': SHARD_SIZE,
+        'shards': shards,
+    }
+    write('data/index.json', json.dumps(index, separators=(',', ':')).encode('utf-8'))
+    # The unsharded file, for anything that still reads it directly.
+    outputs += compressed('data/hackathons.json', data)
+    outputs.append('data/index.json')
+    print(f'Data: {len(records)} records in {len(shards)} shards of {SHARD_SIZE}')
+    return {'hash': digest, 'outputs': outputs}, True
+
+
+def main():
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    state = load_state()
+    previous = state.get('inputs', {})
+    inputs = {}
+    changed = []
 
     # copy static assets so index.html ends up at build/index.html
-    shutil.copytree(static_src, build_dir, dirs_exist_ok=True)
+    pages = []
+    for dirpath, _, files in os.walk(STATIC_SRC):
+        for name in sorted(files):
+            if name.startswith('.'):
+                continue
+            rel = os.path.relpath(os.path.join(dirpath, name), STATIC_SRC).replace(os.sep, '/')
+            if rel.endswith('.html'):
+                pages.append(rel)
+                continue
+            inputs[rel], did = build_asset(rel, read(os.path.join(dirpath, name)), previous.get(rel))
+            if did:
+                changed.append(rel)
+
+    # Point the pages at the fingerprinted names.
+    renames = {rel: entry['outputs'][0] for rel, entry in inputs.items() if entry['outputs'][0] != rel}
+    for rel in pages:
+        text = read(os.path.join(STATIC_SRC, rel)).decode('utf-8')
+        for src, out in renames.items():
+            text = re.sub(r'(["\'])%s\1' % re.escape(src), lambda m: m.group(1) + out + m.group(1), text)
+        data = text.encode('utf-8')
+        inputs[rel] = {'hash': sha256(data), 'outputs': [rel]}
+        if write(rel, data):
+            changed.append(rel)
+
+    if os.path.exists(DATA_SRC):
+        inputs[DATA_SRC], did = build_data(read(DATA_SRC), previous.get(DATA_SRC))
+        if did:
+            changed.append(DATA_SRC)
+
+    # Remove outputs that no input produces any more (old fingerprints, shards).
+    live = {o for entry in inputs.values() for o in entry['outputs']}
+    removed = 0
+    for entry in previous.values():
+        for out in entry['outputs']:
+            path = os.path.join(BUILD_DIR, out)
+            if out not in live and os.path.exists(path):
+                os.remove(path)
+                removed += 1
+    # Older builds that predate the state file left unfingerprinted copies.
+    if not previous:
+        for src in renames:
+            path = os.path.join(BUILD_DIR, src)
+            if os.path.exists(path):
+                os.remove(path)
 
-    # copy data
-    os.makedirs(data_dir, exist_ok=True)
-    shutil.copy(data_src, os.path.join(data_dir, 'hackathons.json'))
+    state['inputs'] = inputs
+    save_state(state)
+    print(f"Build completed successfully: {len(changed)} changed ({', '.join(changed) or 'nothing'}), "
+          f'{removed} stale files removed.')
 
-    print("Build completed successfully.")
 
 if __name__ == '__main__':
     main()
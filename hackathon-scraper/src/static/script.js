@@ -1,34 +1,78 @@
 document.addEventListener('DOMContentLoaded', function() {
-    const hackathonContainer = document.getElementById('hackathon-container');
+    const hackathonContainer = document.getElementById('hackathon-list');
 
-    fetch('data/hackathons.json')
-        .then(response => response.json())
-        .then(data => {
-            if (data.length === 0) {
-                hackathonContainer.innerHTML = '<p>No hackathons found.</p>';
-                return;
-            }
+    // build.py splits the data into small shards listed in data/index.json:
+    // fetch the index and the first shard, render, then fetch further shards
+    // only as the end of the list scrolls into view.
+    let shards = [];
+    let next = 0;
+    let loading = false;
 
-            data.forEach(hackathon => {
-                const hackathonElement = document.createElement('div');
-                hackathonElement.classList.add('hackathon');
+    const sentinel = document.createElement('li');
+    sentinel.className = 'sentinel';
+    sentinel.setAttribute('aria-hidden', 'true');
 
-                const title = document.createElement('h3');
-                title.textContent = hackathon.title;
+    function render(data) {
+        const fragment = document.createDocumentFragment();
+        data.forEach(hackathon => {
+            const hackathonElement = document.createElement('li');
+            hackathonElement.classList.add('hackathon', 'card');
 
-                const date = document.createElement('p');
-                date.textContent = `Date: ${hackathon.date}`;
+            const title = document.createElement('h3');
+            title.textContent = hackathon.title;
 
-                const link = document.createElement('a');
-                link.href = hackathon.link;
-                link.textContent = 'View Hackathon';
-                link.target = '_blank';
+            const date = document.createElement('p');
+            date.textContent = `Date: ${hackathon.date}`;
+
+            const link = document.createElement('a');
+            link.href = hackathon.link;
+            link.textContent = 'View Hackathon';
+            link.target = '_blank';
+            link.rel = 'noopener noreferrer';
+
+            hackathonElement.appendChild(title);
+            hackathonElement.appendChild(date);
+            hackathonElement.appendChild(link);
+            fragment.appendChild(hackathonElement);
+        });
+        hackathonContainer.insertBefore(fragment, sentinel);
+    }
 
-                hackathonElement.appendChild(title);
-                hackathonElement.appendChild(date);
-                hackathonElement.appendChild(link);
-                hackathonContainer.appendChild(hackathonElement);
-            });
+    function loadNext() {
+        if (loading || next >= shards.length) {
+            return Promise.resolve();
+        }
+        loading = true;
+        // Shard names carry their content hash, so the browser cache can keep them.
+        return fetch(shards[next].file)
+            .then(response => response.json())
+            .then(data => {
+                next += 1;
+                render(data);
+                if (next >= shards.length) {
+                    observer.disconnect();
+                    sentinel.remove();
+                }
+            })
+            .finally(() => { loading = false; });
+    }
+
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadNext().catch(error => console.error('Error fetching hackathon data:', error));
+        }
+    }, { rootMargin: '600px' });
+
+    fetch('data/index.json', { cache: 'no-cache' })
+        .then(response => response.json())
+        .then(index => {
+            shards = index.shards;
+            if (index.total === 0) {
+                hackathonContainer.innerHTML = '<p>No hackathons found.</p>';
+                return;
+            }
+            hackathonContainer.appendChild(sentinel);
+            return loadNext().then(() => observer.observe(sentinel));
         })
         .catch(error => {
             console.error('Error fetching hackathon data:', error);
@@ -1,7 +1,15 @@
+import datetime
+import hashlib
+import json
 import os
-from flask import Flask, render_template
+from flask import Flask, Response, jsonify, request, stream_template
 
-from .scraping import fetch_all_hackathons
+from . import compression, db
+from .compression import PayloadCache, compress_stream, encoded_etag, matching_etag, pick_encoding
+from .metrics import METRICS
+from .search import DEFAULT_PAGE_SIZE, IndexCache
+from .snapshot import SnapshotCache
+from .worker import run_worker
 
 
 def create_app(test_config=None):
@@ -10,6 +18,16 @@ def create_app(test_config=None):
     app.config.from_mapping(
         SECRET_KEY='dev',
         DATABASE=os.path.join(app.instance_path, 'flaskr.sqlite'),
+        # JSON written by scripts/run_scraper.py; seeds the snapshot on startup.
+        SNAPSHOT_PATH=os.path.join(os.path.dirname(app.root_path), 'data', 'hackathons.json'),
+        SNAPSHOT_TTL=3600,
+        # Seconds to wait after a failed or empty refresh before trying again.
+        SNAPSHOT_RETRY_AFTER=300,
+        SNAPSHOT_AUTO_REFRESH=True,
+        # 'inline' scrapes on a background thread of this process (the scraper
+        # stack is imported on the first refresh); 'worker' runs each refresh
+        # in a `python -m flaskr.worker` child, so no web process loads it.
+        SCRAPER_MODE=os.getenv('SCRAPER_MODE', 'inline'),
     )
 
     if test_config is None:
@@ -22,15 +40,148 @@ def create_app(test_config=None):
     except OSError:
         pass
 
+    db.init_app(app)
+    compression.init_app(app)
+
+    worker_mode = app.config['SCRAPER_MODE'] == 'worker'
+    if worker_mode:
+        # The worker saves the run to the store; reading it back is all that is left.
+        def fetcher():
+            records, _ = run_worker(app.config['DATABASE'])
+            return records
+    else:
+        def fetcher():
+            from .scraping import fetch_all_hackathons
+            return fetch_all_hackathons()
+
+    snapshot = SnapshotCache(
+        fetcher,
+        path=app.config['SNAPSHOT_PATH'],
+        ttl=app.config['SNAPSHOT_TTL'],
+        retry_after=app.config['SNAPSHOT_RETRY_AFTER'],
+        auto_refresh=app.config['SNAPSHOT_AUTO_REFRESH'],
+        store=db.HackathonStore(app.config['DATABASE']),
+        save_refreshes=not worker_mode,
+    )
+    app.extensions['snapshot'] = snapshot
+    search_index = IndexCache()
+    payloads = PayloadCache()
+
+    def current_index():
+        data, version = snapshot.get_versioned()
+        return search_index.get(data, version)
+
+    def not_modified(etag):
+        """304 for a request that already holds `etag`, else None."""
+        matched = matching_etag(etag)
+        if matched is None:
+            return None
+        response = Response(status=304)
+        response.set_etag(matched)
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
     @app.route('/')
     def index():
-        """Index route — scrape multiple sources (headless) and render results.
+        """Index route — stream the cached hackathon snapshot.
 
-        The scraping logic lives in `flaskr.scraping`. Devpost uses lazy-loading
-        (more items appear as you scroll), so the scraper scrolls the page to
-        load additional tiles before parsing.
+        Scraping is slow (several headless Chromes), so it never happens on the
+        request thread. `SnapshotCache` serves the last good result and, once it
+        is older than `SNAPSHOT_TTL`, refreshes it in the background. The page
+        only changes with the snapshot, so its ETag is the snapshot version and
+        a revalidation is answered with 304 before anything is rendered.
+        Otherwise the template is streamed, compressed as it goes.
         """
-        hackathons = fetch_all_hackathons()
-        return render_template('hackathons.html', hackathons=hackathons)
+        index = current_index()
+        etag = 'page-%s' % index.version
+        encoding = pick_encoding()
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        first_page = index.search(page_size=DEFAULT_PAGE_SIZE)
+        body = stream_template('hackathons.html', hackathons=first_page['items'], result=first_page)
+        if encoding:
+            body = compress_stream(body, encoding)
+        response = Response(body, mimetype='text/html')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.set_etag(encoded_etag(etag, encoding))
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'no-cache'
+        age = snapshot.age()
+        if age is not None:
+            response.headers['X-Snapshot-Age'] = str(int(age))
+        return response
+
+    @app.route('/hackathons.json')
+    def hackathons_json():
+        """The whole snapshot as compact JSON, for clients that want the raw dataset.
+
+        The body is serialized and compressed once per snapshot version.
+        """
+        data, version = snapshot.get_versioned()
+        etag = 'data-%s' % version
+        encoding = pick_encoding()
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        body = payloads.get(version, encoding, lambda: json.dumps(
+            data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        response = Response(body, mimetype='application/json')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.set_etag(encoded_etag(etag, encoding))
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    @app.route('/api/hackathons')
+    def api_hackathons():
+        """Search and page through the snapshot.
+
+        Query parameters: `q` (every word must prefix-match a word of the title,
+        date or source), `sort` (newest, oldest by start date, or alpha),
+        `source`, `upcoming=1` (hide events that have ended), `page` and
+        `page_size`. The ETag covers the snapshot version and the parameters,
+        so a repeated query is answered with 304 until the data changes.
+        """
+        index = current_index()
+        args = request.args
+        params = (args.get('q', '').strip(), args.get('sort', 'newest'), args.get('source', ''),
+                  args.get('page', '1'), args.get('page_size', str(DEFAULT_PAGE_SIZE)),
+                  datetime.date.today().strftime('%Y%m%d') if args.get('upcoming') == '1' else '')
+        etag = '%s-%s' % (index.version, hashlib.sha1('\0'.join(params).encode('utf-8')).hexdigest()[:12])
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        try:
+            result = index.search(
+                q=params[0], sort=params[1], source=params[2] or None,
+                page=int(params[3]), page_size=int(params[4]),
+                upcoming=int(params[5]) if params[5] else None,
+            )
+        except ValueError:
+            return jsonify(error='page and page_size must be integers'), 400
+        response = jsonify(result)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    @app.route('/snapshot')
+    def snapshot_status():
+        """Report the snapshot's size, age and refresh state."""
+        return jsonify(snapshot.status())
+
+    @app.route('/metrics')
+    def metrics():
+        """Per-source, per-stage scraper timings in the Prometheus text format."""
+        status = snapshot.status()
+        gauges = {
+            'snapshot_age_seconds': status['age_seconds'],
+            'snapshot_records': status['count'],
+            'snapshot_refreshing': int(status['refreshing']),
+        }
+        return Response(METRICS.render_prometheus(gauges), mimetype='text/plain; version=0.0.4')
 
     return app
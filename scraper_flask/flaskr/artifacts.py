@@ -0,0 +1,173 @@
+"""Compact, content-addressed data artifacts for the static frontends.
+
+`write_artifacts()` turns a scrape result into:
+
+    hackathons.json               compact copy at the old path, for old clients
+    hackathons.<version>.json     same bytes under a content-hashed name
+    hackathons.<version>.json.gz  gzip sibling (and .br when brotli is installed),
+                                  unless SCRAPER_PRECOMPRESS=0
+    delta.<old>.<version>.json    added/removed/changed records since <old>
+    manifest.json                 version, file names and the available deltas
+
+`<version>` is a hash of the compact JSON, so hashed files never change and
+can be cached forever; only `manifest.json` has to be revalidated. A client
+holding version `<old>` applies `delta.<old>.<version>.json` instead of
+downloading the full file, and downloads nothing when the version matches;
+the delta carries record positions, so the patched list is in the same
+order as the full file. `SCRAPER_DELTA_HISTORY` bounds how many old versions
+(and their files) are kept.
+Records are keyed by `record_key()`, the same link identity dedupe uses
+(`dedupe.url_key()`: canonical link without scheme, `www.`, tracking
+parameters or trailing slash); `docs/script.js` mirrors that function.
+"""
+import glob
+import gzip
+import hashlib
+import json
+import os
+import time
+
+from .dedupe import url_key
+
+try:
+    import brotli
+except ImportError:  # only the gzip siblings are written without brotli
+    brotli = None
+
+MANIFEST = 'manifest.json'
+LEGACY_FILE = 'hackathons.json'
+# Versions a client may be behind and still receive a delta; 0 writes no deltas.
+DELTA_HISTORY = int(os.getenv('SCRAPER_DELTA_HISTORY', '3'))
+# Write .gz/.br siblings of the hashed files, for hosts that serve them as is.
+PRECOMPRESS = os.getenv('SCRAPER_PRECOMPRESS', '1') == '1'
+
+
+def record_key(record):
+    """Stable identity of a record across snapshots, the store and deltas."""
+    return url_key(record.get('link')) or record.get('title', '')
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write(path, data):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _write_compressed(path, data):
+    """Write `data` plus its precompressed siblings; return their sizes."""
+    _write(path, data)
+    sizes = {'identity': len(data)}
+    if not PRECOMPRESS:
+        return sizes
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    _write(f'{path}.gz', gz)
+    sizes['gzip'] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        _write(f'{path}.br', br)
+        sizes['br'] = len(br)
+    return sizes
+
+
+def compute_delta(old_records, new_records):
+    """Added, removed (keys) and changed records going from old to new.
+
+    `added_at` is each added record's index in the new list. If the records
+    both lists keep are not in the same relative order, `order` lists the
+    keys of the whole new list, so a client can rebuild it exactly.
+    """
+    old = {record_key(r): r for r in old_records}
+    new = {record_key(r): r for r in new_records}
+    new_keys = [record_key(r) for r in new_records]
+    added, added_at = [], []
+    for i, (k, r) in enumerate(zip(new_keys, new_records)):
+        if k not in old:
+            added.append(r)
+            added_at.append(i)
+    delta = {
+        'added': added,
+        'added_at': added_at,
+        'removed': [k for k in old if k not in new],
+        'changed': [r for k, r in new.items() if k in old and old[k] != r],
+    }
+    kept_old = [k for k in old if k in new]
+    kept_new = [k for k in new_keys if k in old]
+    if kept_old != kept_new or len(new) != len(new_records):
+        delta['order'] = new_keys
+    return delta
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _load_version(out_dir, version):
+    try:
+        with open(os.path.join(out_dir, f'hackathons.{version}.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_artifacts(records, out_dir):
+    """Write the data artifacts for `records`; returns the manifest."""
+    os.makedirs(out_dir, exist_ok=True)
+    body = _dumps(records)
+    version = hashlib.sha256(body).hexdigest()[:12]
+
+    previous = _load_manifest(out_dir)
+    if previous and previous.get('version') == version:
+        print(f'Artifacts unchanged (version {version})')
+        return previous
+
+    data_file = f'hackathons.{version}.json'
+    sizes = _write_compressed(os.path.join(out_dir, data_file), body)
+    _write(os.path.join(out_dir, LEGACY_FILE), body)
+
+    history = []
+    if previous:
+        history = [previous['version']] + [v for v in previous.get('history', []) if v != previous['version']]
+    history = [v for v in history if v != version][:DELTA_HISTORY]
+
+    deltas = {}
+    for old_version in history:
+        old_records = _load_version(out_dir, old_version)
+        if old_records is None:
+            continue
+        delta = {'from': old_version, 'to': version, **compute_delta(old_records, records)}
+        delta_file = f'delta.{old_version}.{version}.json'
+        _write_compressed(os.path.join(out_dir, delta_file), _dumps(delta))
+        deltas[old_version] = delta_file
+
+    manifest = {
+        'version': version,
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'count': len(records),
+        'data': data_file,
+        'bytes': sizes,
+        'deltas': deltas,
+        'history': history,
+    }
+    _write(os.path.join(out_dir, MANIFEST), json.dumps(manifest, indent=2).encode('utf-8'))
+
+    # Keep the data files deltas are computed from; drop everything older.
+    keep = {data_file} | {f'hackathons.{v}.json' for v in history} | set(deltas.values())
+    for pattern in ('hackathons.*.json*', 'delta.*.json*'):
+        for path in glob.glob(os.path.join(out_dir, pattern)):
+            name = os.path.basename(path)
+            sibling = name.endswith(('.gz', '.br'))
+            base = name[:-3] if sibling else name
+            if base not in keep or (sibling and not PRECOMPRESS):
+                os.remove(path)
+
+    print(f'Artifacts: version {version}, {sizes} bytes, deltas from {list(deltas)}')
+    return manifest
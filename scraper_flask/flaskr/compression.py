@@ -0,0 +1,144 @@
+"""Response compression for the Flask app.
+
+`init_app()` installs an `after_request` hook that compresses text responses
+with brotli (when installed) or gzip, picked from the client's
+`Accept-Encoding`. Streamed responses are compressed by wrapping their
+generator with `compress_stream()`, which flushes the compressor whenever a
+few kilobytes are pending so the browser can render the start of the page
+before the rest is produced.
+
+Bodies that are the same for every request of a snapshot version, like the
+raw dataset, go through `PayloadCache` so they are serialized and compressed
+once per version, not once per request.
+"""
+import gzip
+import threading
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # gzip only without brotli
+    brotli = None
+
+COMPRESSIBLE = ('text/', 'application/json', 'application/javascript')
+MIN_SIZE = 512
+# Flush a streamed response once this many uncompressed bytes are pending.
+STREAM_FLUSH_BYTES = 4096
+
+
+def pick_encoding(accept_encoding=None):
+    """'br', 'gzip' or None for the request's `Accept-Encoding`."""
+    if accept_encoding is None:
+        accept_encoding = request.headers.get('Accept-Encoding', '')
+    offered = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    if brotli is not None and offered.get('br', 0) > 0:
+        return 'br'
+    if offered.get('gzip', 0) > 0:
+        return 'gzip'
+    return None
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    return data
+
+
+def compress_stream(chunks, encoding):
+    """Compress an iterable of str/bytes chunks, flushing every few kilobytes."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=5)
+        feed, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+        feed = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)  # noqa: E731
+        finish = compressor.flush
+    pending = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        out = feed(chunk)
+        pending += len(chunk)
+        if pending >= STREAM_FLUSH_BYTES:
+            out += flush()
+            pending = 0
+        if out:
+            yield out
+    yield finish()
+
+
+def encoded_etag(etag, encoding):
+    """Strong ETags must differ per content coding."""
+    return f'{etag}-{encoding}' if encoding else etag
+
+
+def matching_etag(etag):
+    """The form of `etag` (plain, or encoded for this client) in If-None-Match, else None."""
+    inm = request.if_none_match
+    for candidate in (encoded_etag(etag, pick_encoding()), etag):
+        if candidate in inm:
+            return candidate
+    return None
+
+
+def _compressible(response):
+    mimetype = response.mimetype or ''
+    return mimetype.startswith(COMPRESSIBLE)
+
+
+def _compress_response(response):
+    if response.status_code != 200 or response.direct_passthrough or response.is_streamed \
+            or 'Content-Encoding' in response.headers or not _compressible(response):
+        return response
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    encoding = pick_encoding()
+    if encoding is None or len(data) < MIN_SIZE:
+        return response
+    response.set_data(compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(encoded_etag(etag, encoding), weak)
+    return response
+
+
+class PayloadCache:
+    """Serialized and compressed bodies for the current snapshot version."""
+
+    def __init__(self):
+        self._version = None
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def get(self, version, encoding, render):
+        """Body for `version` in `encoding`; `render()` produces the raw bytes."""
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._bodies = {}
+            body = self._bodies.get(encoding)
+            if body is None:
+                raw = self._bodies.get(None)
+                if raw is None:
+                    raw = self._bodies[None] = render()
+                body = self._bodies[encoding] = compress(raw, encoding)
+            return body
+
+
+def init_app(app):
+    app.after_request(_compress_response)
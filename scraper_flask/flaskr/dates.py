@@ -0,0 +1,194 @@
+"""Turn each source's free-text `date` into a parsed date range.
+
+The scrapers keep the text the sites show:
+
+    Devpost        "May 19 - Aug 17, 2026", "Oct 24 - 25, 2026", "Dec 31, 2026"
+    Devfolio       "Starts 06/08/26"                 (day/month/year)
+    MLH            "Oct 7th - 9th"                   (no year)
+    Hackathon.com  "start 21 Oct end 23 Oct"         (no year)
+
+`normalize_dates()` adds to every record:
+
+    start, end            ISO dates ("2026-10-24"), or None when unparseable
+    sort_start, sort_end  the same dates as YYYYMMDD integers, for cheap sorting
+    past                  True once `end` is before today
+
+Records are handled a source at a time. The format that last matched a source
+is tried first, and each distinct text is parsed once, so a run costs about
+one regex match per distinct date string.
+
+A missing year comes from a hint when there is one: a single year in the
+record's title ("DevSummit 2026"), else the season of a season listing (MLH's
+`seasons/2025` page runs from August 2024 to July 2025). Only without either
+is it the year that puts the date closest to today, which would otherwise
+turn a finished event from last spring into next year's.
+"""
+import datetime
+import re
+from functools import lru_cache
+
+_MONTHS = {m: i for i, m in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d\d\b')
+
+_DAY = r'(\d{1,2})(?:st|nd|rd|th)?'
+_MONTH = r'([A-Za-z]{3,9})\.?'
+_YEAR = r'(?:,?\s*(\d{4}))?'
+
+FORMATS = {
+    # "May 19 - Aug 17, 2026", "Oct 24 - 25, 2026", "Oct 7th - 9th", "Dec 20, 2025 - Jan 05, 2026"
+    'month_day_range': re.compile(rf'^{_MONTH}\s+{_DAY}{_YEAR}\s*[-–]\s*(?:{_MONTH}\s+)?{_DAY}{_YEAR}$'),
+    # "Dec 31, 2026"
+    'month_day': re.compile(rf'^{_MONTH}\s+{_DAY}{_YEAR}$'),
+    # "Starts 06/08/26"
+    'starts_dmy': re.compile(r'^starts?\s+(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})$', re.I),
+    # "start 21 Oct end 23 Oct"
+    'start_end': re.compile(rf'^start\s+{_DAY}\s+{_MONTH}{_YEAR}\s+end\s+{_DAY}\s+{_MONTH}{_YEAR}$', re.I),
+}
+
+# Source name -> format that matched its last record.
+_detected = {}
+
+
+def _month(name):
+    return _MONTHS.get((name or '')[:3].lower())
+
+
+def _date(year, month, day):
+    try:
+        return datetime.date(year, month, day)
+    except (TypeError, ValueError):
+        return None
+
+
+def _nearest(month, day, today):
+    """`month`/`day` in whichever year puts it closest to `today`."""
+    candidates = [d for d in (_date(today.year + k, month, day) for k in (-1, 0, 1)) if d]
+    return min(candidates, key=lambda d: abs((d - today).days)) if candidates else None
+
+
+def _hinted_year(month, hint):
+    """Year for `month` from a `('year', y)` or `('season', y)` hint."""
+    kind, year = hint
+    if kind == 'season':
+        # A season runs from August of the year before to July.
+        return year - 1 if month >= 8 else year
+    return year
+
+
+def _range(m1, d1, y1, m2, d2, y2, today, hint=None):
+    m1 = _month(m1)
+    m2 = _month(m2) if m2 else m1
+    d1, d2 = int(d1), int(d2)
+    if not m1 or not m2:
+        return None
+    y1 = int(y1) if y1 else None
+    y2 = int(y2) if y2 else None
+    if y2 is None and y1 is None:
+        if hint:
+            y1 = _hinted_year(m1, hint)
+        else:
+            start = _nearest(m1, d1, today)
+            if start is None:
+                return None
+            y1 = start.year
+    if y2 is None:
+        y2 = y1
+    elif y1 is None:
+        y1 = y2 if (m1, d1) <= (m2, d2) else y2 - 1
+    if m2 == m1 and d2 < d1 and y2 == y1:
+        # "Oct 30th - 2nd": the end is in the next month.
+        m2 = m1 % 12 + 1
+    start, end = _date(y1, m1, d1), _date(y2, m2, d2)
+    if start and end and end < start:
+        end = _date(y2 + 1, m2, d2)
+    return (start, end) if start and end else None
+
+
+def _parse(fmt, match, today, hint):
+    g = match.groups()
+    if fmt == 'month_day_range':
+        return _range(g[0], g[1], g[2], g[3], g[4], g[5], today, hint)
+    if fmt == 'month_day':
+        return _range(g[0], g[1], g[2], None, g[1], g[2], today, hint)
+    if fmt == 'starts_dmy':
+        year = int(g[2]) + (2000 if len(g[2]) == 2 else 0)
+        start = _date(year, int(g[1]), int(g[0]))
+        return (start, start) if start else None
+    if fmt == 'start_end':
+        return _range(g[1], g[0], g[2], g[4], g[3], g[5], today, hint)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text, fmt, today, hint):
+    match = FORMATS[fmt].match(text)
+    return _parse(fmt, match, today, hint) if match else None
+
+
+def year_hint(title=None, season=None):
+    """Hint for dates without a year: the title's only year, else the listing's season."""
+    years = set(_YEAR_RE.findall(title or ''))
+    if len(years) == 1:
+        return ('year', int(years.pop()))
+    if season:
+        return ('season', int(season))
+    return None
+
+
+def parse_date_range(text, source=None, today=None, hint=None):
+    """`(start, end)` dates for a listing's date text, or `(None, None)`.
+
+    `hint` (see `year_hint()`) supplies the year when the text has none.
+    """
+    text = ' '.join((text or '').split())
+    if not text:
+        return None, None
+    today = today or datetime.date.today()
+    first = _detected.get(source)
+    order = [first] + [f for f in FORMATS if f != first] if first else list(FORMATS)
+    for fmt in order:
+        parsed = _parse_text(text, fmt, today, hint)
+        if parsed:
+            if source:
+                _detected[source] = fmt
+            return parsed
+    return None, None
+
+
+def _sort_key(d):
+    return d.year * 10000 + d.month * 100 + d.day if d else None
+
+
+def normalize_dates(records, today=None, drop_past=False, seasons=None):
+    """Add parsed date fields to `records`; returns `(records, past count)`.
+
+    `seasons` maps a source to the season year its listing covers. With
+    `drop_past`, events that have already ended are left out of the returned
+    list instead of being flagged.
+    """
+    seasons = seasons or {}
+    today = today or datetime.date.today()
+    by_source = {}
+    for record in records:
+        by_source.setdefault(record.get('source'), []).append(record)
+
+    parsed = 0
+    for source, batch in by_source.items():
+        for record in batch:
+            hint = year_hint(record.get('title'), seasons.get(source))
+            start, end = parse_date_range(record.get('date'), source, today, hint)
+            parsed += start is not None
+            record['start'] = start.isoformat() if start else None
+            record['end'] = end.isoformat() if end else None
+            record['sort_start'] = _sort_key(start)
+            record['sort_end'] = _sort_key(end)
+            record['past'] = bool(end and end < today)
+
+    past = sum(1 for r in records if r['past'])
+    print(f'Dates: parsed {parsed}/{len(records)}, {past} past events'
+          + (' dropped' if drop_past and past else ''))
+    if drop_past:
+        records = [r for r in records if not r['past']]
+    return records, past
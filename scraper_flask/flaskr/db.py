@@ -0,0 +1,283 @@
+"""SQLite store for scraped hackathons.
+
+Each record is stored once, keyed by its canonical link (`artifacts.record_key`),
+and upserted on every run. The table keeps the first time any source reported
+a record and the last time one did; `sightings` keeps the same two timestamps
+per source. `save_hackathons()` writes a whole run in one transaction. The
+database runs in WAL mode, so the web app keeps reading the previous run while
+a scrape is writing the next one.
+
+Titles are also indexed in an FTS5 table (`hackathons_fts`), kept in sync by
+triggers that only rewrite a row's entry when its title changes, for
+`search_titles()` and `flask --app flaskr search-db <words>`. SQLite builds
+without FTS5 still get the rest of the store. The web app's `/api/hackathons`
+searches the in-memory `search.IndexCache` instead: it is built from the
+snapshot, which is served before the store holds a run, and answers a query
+without touching the database.
+
+The Flask side follows the usual pattern: `get_db()` opens one connection per
+app context, `close_db()` closes it on teardown, and the `init-db` and
+`search-db` commands use it.
+"""
+import json
+import sqlite3
+import time
+
+import click
+from flask import current_app, g
+from flask.cli import with_appcontext
+
+from .artifacts import record_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hackathons (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    date TEXT,
+    link TEXT,
+    source TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    position INTEGER,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_hackathons_source ON hackathons (source);
+CREATE INDEX IF NOT EXISTS idx_hackathons_dates ON hackathons (start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_hackathons_last_seen ON hackathons (last_seen, position);
+
+CREATE TABLE IF NOT EXISTS sightings (
+    hackathon_id INTEGER NOT NULL REFERENCES hackathons (id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (hackathon_id, source)
+);
+CREATE INDEX IF NOT EXISTS idx_sightings_source ON sightings (source, last_seen);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS hackathons_fts USING fts5 (
+    title, content='hackathons', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS hackathons_ai AFTER INSERT ON hackathons BEGIN
+    INSERT INTO hackathons_fts (rowid, title) VALUES (new.id, new.title);
+END;
+CREATE TRIGGER IF NOT EXISTS hackathons_ad AFTER DELETE ON hackathons BEGIN
+    INSERT INTO hackathons_fts (hackathons_fts, rowid, title) VALUES ('delete', old.id, old.title);
+END;
+DROP TRIGGER IF EXISTS hackathons_au;
+CREATE TRIGGER hackathons_au AFTER UPDATE OF title ON hackathons
+WHEN old.title IS NOT new.title BEGIN
+    INSERT INTO hackathons_fts (hackathons_fts, rowid, title) VALUES ('delete', old.id, old.title);
+    INSERT INTO hackathons_fts (rowid, title) VALUES (new.id, new.title);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO hackathons (key, title, date, link, source, start_date, end_date, position, data, first_seen, last_seen)
+VALUES (:key, :title, :date, :link, :source, :start_date, :end_date, :position, :data, :seen, :seen)
+ON CONFLICT (key) DO UPDATE SET
+    title = excluded.title,
+    date = excluded.date,
+    link = excluded.link,
+    source = excluded.source,
+    start_date = excluded.start_date,
+    end_date = excluded.end_date,
+    position = excluded.position,
+    data = excluded.data,
+    last_seen = excluded.last_seen
+"""
+
+_UPSERT_SIGHTING = """
+INSERT INTO sightings (hackathon_id, source, first_seen, last_seen)
+SELECT id, :source, :seen, :seen FROM hackathons WHERE key = :key
+ON CONFLICT (hackathon_id, source) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def connect(path, timeout=30):
+    """Open `path` in WAL mode with rows as `sqlite3.Row`."""
+    conn = sqlite3.connect(path, timeout=timeout)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA foreign_keys=ON')
+    return conn
+
+
+def has_fts(conn):
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'hackathons_fts'").fetchone()
+    return row is not None
+
+
+def init_schema(conn):
+    """Create the tables, indexes and (when available) the FTS5 index."""
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+    except sqlite3.OperationalError as e:
+        print(f'Database: full-text search disabled ({e})')
+    conn.commit()
+
+
+def _row_params(record, position, seen):
+    return {
+        'key': record_key(record),
+        'title': record.get('title', ''),
+        'date': record.get('date'),
+        'link': record.get('link'),
+        'source': record.get('source'),
+        'start_date': record.get('start'),
+        'end_date': record.get('end'),
+        'position': position,
+        'data': json.dumps(record, ensure_ascii=False, separators=(',', ':')),
+        'seen': seen,
+    }
+
+
+def _sources(record):
+    sources = record.get('sources') or [record.get('source')]
+    return [s for s in sources if s]
+
+
+def save_hackathons(conn, records, seen_at=None):
+    """Upsert one run's records in a single transaction; returns the run id."""
+    seen = time.time() if seen_at is None else seen_at
+    rows = [_row_params(r, i, seen) for i, r in enumerate(records)]
+    sightings = [
+        {'key': row['key'], 'source': source, 'seen': seen}
+        for row, record in zip(rows, records)
+        for source in _sources(record)
+    ]
+    with conn:
+        conn.executemany(_UPSERT, rows)
+        conn.executemany(_UPSERT_SIGHTING, sightings)
+        cur = conn.execute('INSERT INTO runs (finished_at, count) VALUES (?, ?)', (seen, len(rows)))
+    return cur.lastrowid
+
+
+def last_run(conn):
+    """`(finished_at, count)` of the latest run, or None."""
+    row = conn.execute('SELECT finished_at, count FROM runs ORDER BY id DESC LIMIT 1').fetchone()
+    return None if row is None else (row['finished_at'], row['count'])
+
+
+def load_hackathons(conn, source=None):
+    """Records from the latest run, in the order they were scraped."""
+    run = last_run(conn)
+    if run is None:
+        return []
+    sql = 'SELECT data FROM hackathons WHERE last_seen >= ?'
+    params = [run[0]]
+    if source:
+        sql += ' AND source = ?'
+        params.append(source)
+    sql += ' ORDER BY position'
+    return [json.loads(row['data']) for row in conn.execute(sql, params)]
+
+
+def _fts_query(text):
+    """Turn free text into an FTS5 query of quoted prefix terms."""
+    terms = [t.replace('"', '""') for t in text.split()]
+    return ' '.join(f'"{t}"*' for t in terms if t)
+
+
+def search_titles(conn, text, limit=50):
+    """Current records whose title matches every word of `text` (as prefixes)."""
+    query = _fts_query(text)
+    run = last_run(conn)
+    if not query or run is None:
+        return []
+    if has_fts(conn):
+        rows = conn.execute(
+            'SELECT h.data FROM hackathons_fts f JOIN hackathons h ON h.id = f.rowid '
+            'WHERE hackathons_fts MATCH ? AND h.last_seen >= ? ORDER BY f.rank LIMIT ?',
+            (query, run[0], limit),
+        )
+    else:
+        clauses = ' AND '.join('title LIKE ?' for _ in text.split())
+        rows = conn.execute(
+            f'SELECT data FROM hackathons WHERE {clauses} AND last_seen >= ? ORDER BY position LIMIT ?',
+            [f'%{t}%' for t in text.split()] + [run[0], limit],
+        )
+    return [json.loads(row['data']) for row in rows]
+
+
+class HackathonStore:
+    """Connection-per-call access to the database for background threads."""
+
+    def __init__(self, path):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self):
+        conn = connect(self.path)
+        if not self._initialized:
+            init_schema(conn)
+            self._initialized = True
+        return conn
+
+    def save(self, records, seen_at=None):
+        conn = self._connect()
+        try:
+            return save_hackathons(conn, records, seen_at)
+        finally:
+            conn.close()
+
+    def load(self):
+        """`(records, finished_at)` for the latest run, or `([], None)`."""
+        conn = self._connect()
+        try:
+            run = last_run(conn)
+            if run is None:
+                return [], None
+            return load_hackathons(conn), run[0]
+        finally:
+            conn.close()
+
+
+def get_db():
+    if 'db' not in g:
+        g.db = connect(current_app.config['DATABASE'])
+    return g.db
+
+
+def close_db(e=None):
+    db = g.pop('db', None)
+    if db is not None:
+        db.close()
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create the hackathon tables if they don't exist."""
+    init_schema(get_db())
+    click.echo('Initialized the database.')
+
+
+@click.command('search-db')
+@click.argument('words', nargs=-1, required=True)
+@click.option('--limit', default=20, show_default=True)
+@with_appcontext
+def search_db_command(words, limit):
+    """Search the titles of the stored run."""
+    conn = get_db()
+    init_schema(conn)
+    for record in search_titles(conn, ' '.join(words), limit):
+        click.echo(f"{record.get('title', '')}\t{record.get('date') or ''}\t{record.get('link') or ''}")
+
+
+def init_app(app):
+    app.teardown_appcontext(close_db)
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(search_db_command)
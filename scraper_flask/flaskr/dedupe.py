@@ -0,0 +1,381 @@
+"""Merge records that describe the same event, within and across sources.
+
+Two passes, neither of which compares every pair of records:
+
+1. Exact: records are grouped by `url_key()` of their canonical link, so the
+   same page listed twice, or with different tracking parameters, collapses.
+2. Near-duplicate: records are grouped by normalized title (case,
+   punctuation and years removed), so each distinct title is handled once.
+   Its words, less generic ones like "Hackathon" or "Edition", are cut into
+   character 3-gram shingles and the title gets a MinHash signature, packed
+   into one integer, that is split into LSH bands; only titles sharing a band
+   bucket become candidates. A pair of records is merged when they come from
+   different sources, carry the same event numbers ("#2") and no conflicting
+   years, their estimated title similarity clears the threshold and, when both
+   have parsed `start`/`end` dates, the ranges overlap. Buckets that fill up
+   hold generic titles, not one event, and stop producing candidates.
+
+   Without dates, the title is all there is, so it has to name one event: at
+   least `MIN_UNDATED_WORDS` non-generic words, no source using it for two
+   pages, and a higher similarity. "Global AI Hackathon" from two sources is
+   not merged on its title alone; two generic titles that only look alike
+   ("AI Hack", "AI Jam") are never merged.
+
+Candidate pairs are merged most similar first, and a merge is refused when
+the two groups already share a source, so a record from one source never
+joins two different pages of another source together.
+
+Merged records keep the first record's fields (scrape order), fill gaps from
+the others and list every source in `sources`.
+"""
+import random
+import re
+import zlib
+from functools import lru_cache, reduce
+
+TRACKING_PARAMS = {'ref', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'igshid', 'source', 'src'}
+TRACKING_PREFIXES = ('utm_', 'ref_')
+
+NUM_PERM = 24
+BANDS = 6
+ROWS = NUM_PERM // BANDS
+# Estimated Jaccard similarity needed to merge, with and without a date check.
+THRESHOLD = 0.6
+THRESHOLD_UNDATED = 0.8
+# Non-generic words an undated title needs before it can match on the title
+# alone; "Green AI Hackathon" has two and names no event in particular.
+MIN_UNDATED_WORDS = 3
+# Candidates compared per bucket; huge buckets are generic titles, not events.
+MAX_BUCKET = 16
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(20240917)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+# Signatures are packed into one int, NUM_PERM lanes of 32 bits. Hash values
+# stay below 2**31, which leaves the top bit of every lane as a guard for
+# lane-wise subtraction, so min and equality run as a few big-int operations
+# instead of a Python loop over NUM_PERM values.
+_LANE = 32
+_LANE_MASK = (1 << _LANE) - 1
+_ONES = sum(1 << (_LANE * k) for k in range(NUM_PERM))
+_GUARDS = _ONES << (_LANE - 1)
+_BAND_MASK = (1 << (_LANE * ROWS)) - 1
+
+# Words nearly every listing title has; they are left out of the signature so
+# that two events are not similar just for both being a "Buildathon".
+GENERIC_WORDS = frozenset({
+    'a', 'an', 'and', 'by', 'for', 'in', 'of', 'on', 'the', 'to', 'edition', 'hack', 'hacks',
+    'hackathon', 'hackathons', 'buildathon', 'codefest', 'challenge', 'jam', 'sprint',
+})
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d\d\b')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def _is_tracking(param):
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=1 << 18)
+def canonical_url(url):
+    """`url` with tracking parameters, fragment and trailing slash removed.
+
+    The scheme becomes https, the host is lower-cased without a default port
+    and the remaining query parameters are sorted. String splitting rather
+    than `urllib.parse`, since this runs once per scraped record.
+    """
+    url = (url or '').strip()
+    base = url.partition('#')[0]
+    base, _, query = base.partition('?')
+    _, sep, rest = base.partition('://')
+    if not sep:
+        return url
+    host, slash, path = rest.partition('/')
+    host = host.rpartition('@')[2].lower()
+    if host.endswith((':80', ':443')):
+        host = host.rpartition(':')[0]
+    path = ('/' + path).rstrip('/') if slash else ''
+    params = sorted(p for p in query.split('&') if p and not _is_tracking(p.partition('=')[0]))
+    return f'https://{host}{path}' + ('?' + '&'.join(params) if params else '')
+
+
+def url_key(url):
+    """Identity of a link: canonical URL without scheme or `www.`."""
+    canonical = canonical_url(url)
+    key = canonical.split('://', 1)[-1]
+    return key[4:] if key.startswith('www.') else key
+
+
+@lru_cache(maxsize=1 << 18)
+def normalize_title(title):
+    """Lower-cased title words without punctuation or years."""
+    title = _YEAR_RE.sub(' ', (title or '').casefold())
+    return ' '.join(_NON_WORD_RE.sub(' ', title).split())
+
+
+def _years(title):
+    return frozenset(_YEAR_RE.findall(title or ''))
+
+
+def _shingles(word, k=3):
+    padded = f' {word} '
+    return {padded[i:i + k] for i in range(len(padded) - k + 1)}
+
+
+def _pack(values):
+    return sum(v << (_LANE * k) for k, v in enumerate(values))
+
+
+def _lane_min(a, b):
+    """Lane-wise minimum of two packed signatures."""
+    # A lane's guard bit survives `(a | guards) - b` exactly when a >= b there.
+    take_b = (((a | _GUARDS) - b) & _GUARDS) >> (_LANE - 1)
+    mask = take_b * _LANE_MASK
+    return (b & mask) | (a & ~mask)
+
+
+class _MinHasher:
+    """MinHash signatures built from memoized per-word signatures.
+
+    Shingles never span two words, so a title's signature is the lane-wise
+    minimum of its words' signatures, and each distinct word is hashed once
+    per run however many titles contain it.
+    """
+
+    def __init__(self):
+        self._titles = {}
+        self._words = {}
+        self._shingles = {}
+
+    def _shingle(self, shingle):
+        packed = self._shingles.get(shingle)
+        if packed is None:
+            x = zlib.crc32(shingle.encode('utf-8'))
+            packed = self._shingles[shingle] = _pack((a * x + b) % _PRIME for a, b in _PERMS)
+        return packed
+
+    def _word(self, word):
+        signature = self._words.get(word)
+        if signature is None:
+            known = self._shingles
+            signature = reduce(_lane_min, [known.get(s) or self._shingle(s) for s in _shingles(word)])
+            self._words[word] = signature
+        return signature
+
+    def signature(self, title):
+        # Numbers are matched exactly through the bucket key instead, so titles
+        # that differ only in their numbers share one signature.
+        text = _NUMBER_RE.sub('', title)
+        if text in self._titles:
+            return self._titles[text]
+        known = self._words
+        signatures = [known.get(w) or self._word(w) for w in set(text.split()) - GENERIC_WORDS]
+        signature = reduce(_lane_min, signatures) if signatures else None
+        self._titles[text] = signature
+        return signature
+
+
+def _similarity(sig_a, sig_b):
+    """Share of equal lanes; a lane's guard bit survives `- ones` when it differs."""
+    differing = ((((sig_a ^ sig_b) | _GUARDS) - _ONES) & _GUARDS).bit_count()
+    return (NUM_PERM - differing) / NUM_PERM
+
+
+def _sources(record):
+    if record.get('sources'):
+        return list(record['sources'])
+    return [record['source']] if record.get('source') else []
+
+
+def _merge(group):
+    merged = dict(group[0])
+    sources = []
+    for record in group:
+        for key, value in record.items():
+            if value and not merged.get(key):
+                merged[key] = value
+        for source in _sources(record):
+            if source not in sources:
+                sources.append(source)
+    if sources:
+        merged['sources'] = sources
+    return merged
+
+
+class _UnionFind:
+    """Disjoint sets of records, tracking the sources each set covers."""
+
+    def __init__(self, sources):
+        self.parent = list(range(len(sources)))
+        self.sources = list(sources)
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        """Join the sets of `a` and `b` unless they share a source; True if joined."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return True
+        if self.sources[a] & self.sources[b]:
+            return False
+        # Keep the earlier record as the root so scrape order wins.
+        if b < a:
+            a, b = b, a
+        self.parent[b] = a
+        self.sources[a] |= self.sources[b]
+        self.sources[b] = None
+        return True
+
+
+def _exact_groups(records):
+    """Group records by canonical link (title when there is no link)."""
+    groups = {}
+    for record in records:
+        key = url_key(record.get('link')) or 'title:' + normalize_title(record.get('title'))
+        groups.setdefault(key, []).append(record)
+    return list(groups.values())
+
+
+def _may_merge(a, b, undated_ok):
+    """Whether two `(sources, years, start, end)` entries may be the same event.
+
+    True when both are dated and the ranges overlap, False when either is
+    undated and `undated_ok`, None when they must stay apart.
+    """
+    sources, years, start, end = a
+    other_sources, other_years, other_start, other_end = b
+    if sources & other_sources or (years and other_years and not years & other_years):
+        return None
+    if start and other_start:
+        return True if start <= other_end and other_start <= end else None
+    return False if undated_ok else None
+
+
+def _near_duplicate_pairs(records, sources):
+    """`(similarity, i, j)` with `i < j` for the record pairs that pass the merge checks.
+
+    `sources[i]` is the frozenset of record i's sources. Records are grouped
+    by normalized title first, so a title is hashed, bucketed and compared
+    with its candidates once however many records carry it.
+    """
+    entries = {}
+    titles = {}
+    for i, record in enumerate(records):
+        if not sources[i]:
+            # Cross-source matching needs to know where a record came from.
+            continue
+        title = record.get('title')
+        start = record.get('start') or None
+        end = (record.get('end') or start) if start else None
+        entries[i] = (sources[i], _years(title), start, end)
+        titles.setdefault(normalize_title(title), []).append(i)
+
+    hasher = _MinHasher()
+    groups = {}
+    buckets = {}
+    pairs = []
+    for title, members in titles.items():
+        if len(members) > MAX_BUCKET:
+            # A title so common it names no event in particular.
+            continue
+        # A title one source gives to several pages does not identify an event
+        # on its own, and neither does a short one: such records need dates.
+        covered = set()
+        distinctive = len(set(title.split()) - GENERIC_WORDS) >= MIN_UNDATED_WORDS
+        for i in members:
+            if distinctive and covered & entries[i][0]:
+                distinctive = False
+            covered |= entries[i][0]
+        if len(members) > 1:
+            for n, i in enumerate(members):
+                for j in members[n + 1:]:
+                    if _may_merge(entries[i], entries[j], distinctive) is not None:
+                        pairs.append((1.0, i, j))
+        sig = hasher.signature(title)
+        if sig is None:
+            # Nothing but generic words: only the exact title can match.
+            continue
+        groups[title] = (sig, members, distinctive)
+
+        # Event numbers must match exactly, so they are part of every bucket key.
+        numbers = ' '.join(_NUMBER_RE.findall(title))
+        candidates = set()
+        for band in range(BANDS):
+            key = (band, numbers, (sig >> (band * ROWS * _LANE)) & _BAND_MASK)
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [title]
+            elif len(bucket) < MAX_BUCKET:
+                candidates.update(bucket)
+                bucket.append(title)
+
+        for other in candidates:
+            other_sig, other_members, other_distinctive = groups[other]
+            if not (distinctive or other_distinctive):
+                # Two generic titles that merely look alike ("AI Hack", "AI Jam");
+                # only the exact same title, with dates, is taken as one event.
+                continue
+            undated_ok = distinctive and other_distinctive
+            similarity = None
+            if len(members) > 1 or len(other_members) > 1:
+                # Many record pairs: one title comparison rules them all out first.
+                similarity = _similarity(sig, other_sig)
+                if similarity < THRESHOLD:
+                    continue
+            for i in members:
+                sources, years, start, end = entries[i]
+                for j in other_members:
+                    # Inlined `_may_merge()`: this runs for every candidate pair.
+                    other_sources, other_years, other_start, other_end = entries[j]
+                    if sources & other_sources or (years and other_years and not years & other_years):
+                        continue
+                    if start and other_start:
+                        if start > other_end or other_start > end:
+                            continue
+                        threshold = THRESHOLD
+                    elif undated_ok:
+                        threshold = THRESHOLD_UNDATED
+                    else:
+                        continue
+                    # Single records are checked before their titles are compared.
+                    if similarity is None:
+                        similarity = _similarity(sig, other_sig)
+                    if similarity >= threshold:
+                        pairs.append((similarity, i, j) if i < j else (similarity, j, i))
+    return pairs
+
+
+def dedupe(records):
+    """Merge duplicate records; returns `(unique, duplicate count)`.
+
+    Links in the output are canonical. Within one source, only records with
+    the same canonical link are merged; different pages are kept apart even
+    when their titles look alike, including through a record of another source.
+    """
+    merged = []
+    for group in _exact_groups(records):
+        record = _merge(group) if len(group) > 1 else dict(group[0])
+        if record.get('link'):
+            record['link'] = canonical_url(record['link'])
+        merged.append(record)
+
+    sources = [frozenset(_sources(r)) for r in merged]
+    uf = _UnionFind(sources)
+    pairs = _near_duplicate_pairs(merged, sources)
+    pairs.sort(key=lambda p: (-p[0], p[1], p[2]))
+    for _, i, j in pairs:
+        uf.union(i, j)
+
+    groups = {}
+    for i, record in enumerate(merged):
+        groups.setdefault(uf.find(i), []).append(record)
+    unique = [_merge(group) if len(group) > 1 else group[0] for group in groups.values()]
+    return unique, len(records) - len(unique)
@@ -0,0 +1,175 @@
+import atexit
+import contextlib
+import threading
+import time
+
+from .metrics import METRICS
+from .orchestrator import on_cancel
+
+try:
+    import psutil
+except ImportError:  # memory-based recycling is skipped without psutil
+    psutil = None
+
+
+def _driver_rss_mb(driver):
+    """Resident memory of the chromedriver process and its Chrome children, in MB."""
+    if psutil is None:
+        return None
+    try:
+        proc = psutil.Process(driver.service.process.pid)
+        procs = [proc] + proc.children(recursive=True)
+        total = 0
+        for p in procs:
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """Bounded pool of warm WebDriver sessions.
+
+    At most `max_size` browsers exist at once; `acquire()` blocks when all of
+    them are checked out. A browser is reset (cookies, storage, about:blank)
+    when it is returned, and quit instead once it has served `max_uses` pages
+    or its process tree grows past `max_rss_mb`.
+    """
+
+    def __init__(self, factory, max_size=3, max_uses=20, max_rss_mb=None):
+        self.factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self._idle = []
+        self._created = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @contextlib.contextmanager
+    def driver(self):
+        """Check out a driver for the duration of a `with` block.
+
+        If the scraper holding it is cancelled, the browser is quit on the
+        spot so a hung call fails instead of blocking the worker thread.
+        """
+        with METRICS.timed('driver_acquire'):
+            entry = self._acquire()
+        unregister = on_cancel(lambda: self._quit(entry.driver))
+        ok = False
+        try:
+            yield entry.driver
+            ok = True
+        finally:
+            unregister()
+            self._release(entry, healthy=ok)
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError('driver pool is closed')
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.max_size:
+                    self._created += 1
+                    break
+                self._cond.wait()
+        try:
+            start = time.perf_counter()
+            driver = self.factory()
+            METRICS.observe('driver_startup', time.perf_counter() - start)
+            return _PooledDriver(driver)
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, entry, healthy=True):
+        entry.uses += 1
+        recycle = not healthy or self._closed or entry.uses >= self.max_uses
+        # Measured after every checkout, so each source's browser footprint
+        # shows up in the metrics.
+        rss = _driver_rss_mb(entry.driver) if healthy else None
+        if rss is not None:
+            METRICS.set_gauge('browser_rss_mb', rss)
+        if not recycle and self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            print(f'Driver pool: recycling browser at {rss:.0f}MB')
+            recycle = True
+        if not recycle:
+            recycle = not self._reset(entry.driver)
+
+        if recycle:
+            self._quit(entry.driver)
+        with self._cond:
+            if recycle:
+                self._created -= 1
+            else:
+                self._idle.append(entry)
+            self._cond.notify()
+
+    @staticmethod
+    def _reset(driver):
+        """Return a driver to a clean state; False if the session looks dead."""
+        try:
+            try:
+                # Clears cookies for every domain, not just the current page's.
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}')
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle browser; checked-out ones are quit when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry.driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(factory, **kwargs):
+    """Process-wide pool, created on first use and shut down at interpreter exit."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = DriverPool(factory, **kwargs)
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_pool)
@@ -0,0 +1,385 @@
+"""Fill in event details from each hackathon's own page.
+
+The listings only give title, date and link. `enrich_hackathons()` visits
+every record's link and adds what the detail page says:
+
+    prize      prize pool as shown ("$10,000"), or None
+    location   venue or city, or None
+    online     True for online/virtual events, False for in-person, None if unknown
+    themes     list of theme / track labels
+    deadline   registration or submission deadline as an ISO date, or None
+
+Pages are fetched on a thread pool, with at most `per_host` requests in
+flight per site and `delay` seconds between request starts to the same site.
+A site is the registrable domain, so every `*.devpost.com` event page counts
+against one devpost.com limit.
+Extracted fields are cached on disk, one JSON file per canonical URL, with
+the response's ETag/Last-Modified. An entry younger than `ttl` is used as is;
+an older one is revalidated with a conditional request, so an unchanged page
+costs a 304 and no parsing. The cache keeps the `max_entries` most recently
+used entries (by file mtime) and drops the rest.
+
+Extraction reads schema.org JSON-LD first and falls back to page markup and
+text patterns, so it works on Devpost-style pages and on generic event pages.
+"""
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+from . import parsers
+from .dates import parse_date_range
+from .dedupe import canonical_url, url_key
+from .http_fetch import USER_AGENT, replay_url
+from .metrics import METRICS
+
+# BeautifulSoup's lxml tree builder when lxml is installed.
+_BS_PARSER = 'lxml' if parsers.lxml is not None else 'html.parser'
+
+CACHE_DIR = os.getenv('SCRAPER_ENRICH_CACHE') or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'details')
+CACHE_TTL = int(os.getenv('SCRAPER_ENRICH_TTL', str(24 * 60 * 60)))
+CACHE_MAX_ENTRIES = int(os.getenv('SCRAPER_ENRICH_MAX_ENTRIES', '5000'))
+WORKERS = int(os.getenv('SCRAPER_ENRICH_WORKERS', '8'))
+PER_HOST = int(os.getenv('SCRAPER_ENRICH_PER_HOST', '2'))
+# Seconds between request starts to the same host.
+HOST_DELAY = float(os.getenv('SCRAPER_ENRICH_DELAY', '0.5'))
+
+FIELDS = ('prize', 'location', 'online', 'themes', 'deadline')
+
+_PRIZE_RE = re.compile(r'([$€£₹]\s?\d[\d,.]*\s?[kKmM]?)(?:\s*(?:in\s+)?(?:cash\s+)?prizes?)?', re.I)
+_PRIZE_CONTEXT_RE = re.compile(r'prize', re.I)
+_ONLINE_RE = re.compile(r'\b(online|virtual|remote)\b', re.I)
+_IN_PERSON_RE = re.compile(r'\b(in[- ]person|on[- ]site|offline)\b', re.I)
+_DEADLINE_RE = re.compile(
+    r'(?:registration|submission|application)?s?\s*(?:deadline|closes?|ends?)\s*[:\-–]?\s*'
+    r'(?:on\s+)?([A-Z][a-z]{2,8}\.?\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s*\d{4})?)',
+    re.I,
+)
+
+
+class DetailCache:
+    """On-disk cache of extracted details, keyed by canonical URL."""
+
+    def __init__(self, cache_dir, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        digest = hashlib.sha1(url_key(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest + '.json')
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return entry
+
+    def is_fresh(self, entry, now=None):
+        now = time.time() if now is None else now
+        return now - entry.get('fetched_at', 0) < self.ttl
+
+    def put(self, url, entry):
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def evict(self):
+        """Delete the least recently used entries beyond `max_entries`; returns how many."""
+        entries = []
+        for dirpath, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except OSError:
+                        continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        return excess
+
+
+_SECOND_LEVELS = {'ac', 'co', 'com', 'edu', 'gov', 'net', 'org'}
+
+
+def site_key(netloc):
+    """Registrable domain of `netloc` ("xprize.devpost.com" -> "devpost.com").
+
+    The last two labels, or three under a country code's generic second
+    level ("events.example.co.uk" -> "example.co.uk"). IP
+    addresses and single-label hosts are returned whole, port included.
+    """
+    host = netloc.rpartition('@')[2].lower()
+    name = host.rsplit(':', 1)[0] if host.count(':') == 1 else host
+    labels = name.split('.')
+    if len(labels) <= 2 or name.replace('.', '').isdigit() or ':' in name:
+        return host
+    keep = 3 if len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVELS else 2
+    return '.'.join(labels[-keep:])
+
+
+class _HostGate:
+    """Per-site concurrency limit plus a minimum gap between request starts."""
+
+    def __init__(self, per_host, delay):
+        self.per_host = per_host
+        self.delay = delay
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = {
+                    'slots': threading.BoundedSemaphore(self.per_host),
+                    'lock': threading.Lock(),
+                    'next': 0.0,
+                }
+            return state
+
+    def __call__(self, host):
+        gate = self
+
+        class _Slot:
+            def __enter__(self):
+                state = gate._host(host)
+                state['slots'].acquire()
+                with state['lock']:
+                    wait = state['next'] - time.monotonic()
+                    state['next'] = max(state['next'], time.monotonic()) + gate.delay
+                if wait > 0:
+                    time.sleep(wait)
+                self.state = state
+
+            def __exit__(self, *exc):
+                self.state['slots'].release()
+
+        return _Slot()
+
+
+def _json_ld_events(soup):
+    """schema.org Event-like objects from the page's JSON-LD blocks."""
+    events = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, dict):
+                continue
+            stack.extend(item.get('@graph', []) if isinstance(item.get('@graph'), list) else [])
+            kind = item.get('@type')
+            kinds = kind if isinstance(kind, list) else [kind]
+            if any(isinstance(k, str) and k.endswith('Event') for k in kinds):
+                events.append(item)
+    return events
+
+
+def _location_name(location):
+    if isinstance(location, list):
+        location = next((l for l in location if isinstance(l, dict) and l.get('@type') != 'VirtualLocation'),
+                        location[0] if location else None)
+    if isinstance(location, str):
+        return location
+    if not isinstance(location, dict) or location.get('@type') == 'VirtualLocation':
+        return None
+    address = location.get('address')
+    if isinstance(address, dict):
+        parts = [address.get(k) for k in ('addressLocality', 'addressRegion', 'addressCountry')]
+        address = ', '.join(p if isinstance(p, str) else (p or {}).get('name', '') for p in parts if p)
+    return location.get('name') or address or None
+
+
+def _iso(text):
+    start, _ = parse_date_range(text, source='detail')
+    return start.isoformat() if start else None
+
+
+def extract_details(html):
+    """Pull prize, location, online flag, themes and deadline out of a detail page."""
+    soup = BeautifulSoup(html, _BS_PARSER)
+    details = dict.fromkeys(FIELDS)
+    details['themes'] = []
+
+    for event in _json_ld_events(soup):
+        mode = str(event.get('eventAttendanceMode') or '')
+        if 'Online' in mode:
+            details['online'] = True
+        elif 'Offline' in mode:
+            details['online'] = False
+        details['location'] = details['location'] or _location_name(event.get('location'))
+        keywords = event.get('keywords')
+        if isinstance(keywords, str):
+            keywords = [k.strip() for k in keywords.split(',')]
+        if isinstance(keywords, list) and not details['themes']:
+            details['themes'] = [k for k in keywords if isinstance(k, str) and k]
+        offers = event.get('offers')
+        if isinstance(offers, dict) and offers.get('validThrough') and not details['deadline']:
+            details['deadline'] = str(offers['validThrough'])[:10]
+
+    if not details['themes']:
+        details['themes'] = list(dict.fromkeys(
+            el.get_text(strip=True) for el in soup.select('.theme-label, [data-theme], .themes li, .tags .tag')
+            if el.get_text(strip=True)
+        ))
+
+    text = ' '.join(soup.get_text(' ', strip=True).split())
+
+    if details['prize'] is None:
+        for el in soup.select('.prize-amount, #prize-amount, [data-prize]'):
+            match = _PRIZE_RE.search(el.get_text(' ', strip=True))
+            if match:
+                details['prize'] = match.group(1).strip()
+                break
+    if details['prize'] is None:
+        # The first amount that sits near the word "prize".
+        for match in _PRIZE_RE.finditer(text):
+            window = text[max(0, match.start() - 60):match.end() + 60]
+            if _PRIZE_CONTEXT_RE.search(window):
+                details['prize'] = match.group(1).strip()
+                break
+
+    if details['location'] is None:
+        el = soup.select_one('.location, [itemprop=location], .event-location')
+        if el is not None and el.get_text(strip=True):
+            details['location'] = el.get_text(' ', strip=True)
+    if details['location'] and _ONLINE_RE.fullmatch(details['location'].strip()):
+        details['location'] = None
+        details['online'] = True
+    if details['online'] is None:
+        place = f"{details['location'] or ''} {text[:2000]}"
+        if _ONLINE_RE.search(place):
+            details['online'] = True
+        elif _IN_PERSON_RE.search(place) or details['location']:
+            details['online'] = False
+
+    if details['deadline'] is None:
+        el = soup.select_one('[data-deadline], time.deadline')
+        value = el and (el.get('datetime') or el.get('data-deadline') or el.get_text(strip=True))
+        if value:
+            details['deadline'] = value[:10] if re.match(r'\d{4}-\d\d-\d\d', value) else _iso(value)
+    if details['deadline'] is None:
+        match = _DEADLINE_RE.search(text)
+        if match:
+            details['deadline'] = _iso(match.group(1))
+    return details
+
+
+class Enricher:
+    """Crawl detail pages through the cache with per-host limits."""
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, workers=WORKERS,
+                 per_host=PER_HOST, delay=HOST_DELAY, timeout=15, url_rewriter=None):
+        # url_rewriter maps a canonical link to the URL actually requested;
+        # by default that honours SCRAPER_REPLAY_URL like the scrapers do.
+        self.cache = DetailCache(cache_dir, ttl=ttl, max_entries=max_entries)
+        self.workers = workers
+        self.timeout = timeout
+        self.gate = _HostGate(per_host, delay)
+        self.url_rewriter = url_rewriter or replay_url
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept': 'text/html,*/*;q=0.8'})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=max(per_host, 1) * 4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.stats = {'fresh': 0, 'revalidated': 0, 'fetched': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def details(self, url):
+        """Details for `url`, from the cache when it is fresh or still valid."""
+        url = canonical_url(url)
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            self._count('fresh')
+            return entry['fields']
+
+        target = self.url_rewriter(url)
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        site = site_key(requests.utils.urlparse(url).netloc)
+        try:
+            with self.gate(site), METRICS.timed('detail_fetch', 'enrich'):
+                response = self.session.get(target, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            self._count('failed')
+            print(f'Enrich: {url} failed ({e})')
+            return entry['fields'] if entry else None
+
+        if response.status_code == 304 and entry is not None:
+            entry['fetched_at'] = time.time()
+            self.cache.put(url, entry)
+            self._count('revalidated')
+            return entry['fields']
+        if response.status_code != 200:
+            self._count('failed')
+            return entry['fields'] if entry else None
+
+        with METRICS.timed('detail_parse', 'enrich'):
+            fields = extract_details(response.text)
+        self.cache.put(url, {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'fields': fields,
+        })
+        self._count('fetched')
+        return fields
+
+    def enrich(self, records):
+        """Add the detail fields to every record with a link, in place."""
+        start = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='enrich') as ex:
+            futures = {ex.submit(self.details, r['link']): r for r in records if r.get('link')}
+            for future in concurrent.futures.as_completed(futures):
+                fields = future.result()
+                if fields:
+                    futures[future].update(fields)
+        evicted = self.cache.evict()
+        print(f'Enrich: {len(records)} records in {time.time() - start:.1f}s {self.stats}'
+              + (f', evicted {evicted}' if evicted else ''))
+        return records
+
+
+def enrich_hackathons(records, **kwargs):
+    """Add detail-page fields to `records`; keyword arguments go to `Enricher`."""
+    with METRICS.timed('enrich', 'all'):
+        return Enricher(**kwargs).enrich(records)
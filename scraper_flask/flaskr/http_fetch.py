@@ -0,0 +1,121 @@
+import json
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Same desktop UA the headless browser sends, so servers return the same markup.
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+# Query string Devpost appends to tile links on the listing page.
+DEVPOST_LINK_SUFFIX = '?ref_feature=challenge&ref_medium=discover'
+
+FetchResult = namedtuple('FetchResult', 'url status text not_modified elapsed')
+
+
+def replay_url(url):
+    """Rewrite `url` onto `SCRAPER_REPLAY_URL` when replaying saved pages.
+
+    `https://devpost.com/hackathons` becomes `<replay url>/devpost.com/hackathons`,
+    the layout `replay.ReplayServer` serves.
+    """
+    replay = os.getenv('SCRAPER_REPLAY_URL')
+    if not replay:
+        return url
+    parts = urlsplit(url)
+    rewritten = f"{replay.rstrip('/')}/{parts.netloc}{parts.path}"
+    return f'{rewritten}?{parts.query}' if parts.query else rewritten
+
+
+class HttpFetcher:
+    """Pooled HTTP client for listing pages.
+
+    One `requests.Session` keeps connections alive across fetches and sends
+    `Accept-Encoding` for gzip/deflate (and brotli when a brotli package is
+    installed). Each host gets its own connection pool capped at
+    `max_connections`; callers block rather than open more sockets. Responses
+    with an ETag or Last-Modified header are remembered and revalidated with a
+    conditional GET, so an unchanged page costs a 304 and no download.
+    """
+
+    def __init__(self, cache_dir=None, timeout=15, default_max_connections=2):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.default_max_connections = default_max_connections
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+        self._hosts = set()
+        self._validators = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _mount(self, url, max_connections):
+        parts = urlsplit(url)
+        prefix = f'{parts.scheme}://{parts.netloc}/'
+        with self._lock:
+            if prefix in self._hosts:
+                return
+            self._hosts.add(prefix)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections, pool_block=True)
+            self.session.mount(prefix, adapter)
+
+    def _cache_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _cached(self, url):
+        with self._lock:
+            entry = self._validators.get(url)
+        if entry is None and self.cache_dir:
+            try:
+                with open(self._cache_path(url), encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        return entry
+
+    def _store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        entry = {'etag': etag, 'last_modified': last_modified, 'text': response.text}
+        with self._lock:
+            self._validators[url] = entry
+        if self.cache_dir:
+            try:
+                with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+            except OSError:
+                pass
+
+    def get(self, url, max_connections=None, headers=None):
+        """GET `url`, revalidating a cached copy when one exists."""
+        self._mount(url, max_connections or self.default_max_connections)
+        request_headers = dict(headers or {})
+        cached = self._cached(url)
+        if cached:
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                request_headers['If-Modified-Since'] = cached['last_modified']
+
+        start = time.time()
+        response = self.session.get(url, headers=request_headers, timeout=self.timeout)
+        elapsed = time.time() - start
+        if response.status_code == 304 and cached:
+            return FetchResult(url, 304, cached['text'], True, elapsed)
+        response.raise_for_status()
+        self._store(url, response)
+        return FetchResult(url, response.status_code, response.text, False, elapsed)
+
+    def close(self):
+        self.session.close()
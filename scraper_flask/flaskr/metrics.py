@@ -0,0 +1,178 @@
+"""Per-source, per-stage timing metrics for the scraping pipeline.
+
+Stages time themselves with `METRICS.timed('parse')`; the source is taken from
+the surrounding `METRICS.source('Devpost')` block (a context variable, so it
+follows the scraper's own thread) unless passed explicitly. Durations land in
+histograms and counts in counters, and the whole registry can be rendered in
+the Prometheus text format for the Flask `/metrics` route or dumped as JSON
+for run reports.
+
+Stages recorded by the scrapers:
+    scrape          whole scraper call
+    driver_acquire  waiting for a pooled browser (includes startup)
+    driver_startup  launching a new browser
+    http_fetch      HTTP request for a listing or API page
+    page_load       driver.get() in the browser path
+    wait            event-driven waits for listing items
+    scroll          the Devpost scroll loop
+    dom_serialize   reading page_source / extracting tiles from the DOM
+    parse           turning HTML into records
+    dates           parsing date text into start/end dates
+    dedupe          merging all sources into the final list
+    enrich          the detail-page crawl (source "enrich" also times
+                    detail_fetch and detail_parse per page)
+
+Gauges hold the latest value of a measurement, such as `browser_rss_mb`, the
+memory of the browser a source just used.
+"""
+import contextlib
+import contextvars
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+_current_source = contextvars.ContextVar('scraper_source', default='all')
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+def _labels(**labels):
+    return '{' + ','.join('%s="%s"' % (k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in labels.items()) + '}'
+
+
+class Metrics:
+    """Thread-safe registry of stage histograms and item counters."""
+
+    def __init__(self, prefix='hackathon_scraper', buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._histograms = {}
+        self._counters = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @contextlib.contextmanager
+    def source(name):
+        """Attribute every stage recorded inside the block to `name`."""
+        token = _current_source.set(name)
+        try:
+            yield
+        finally:
+            _current_source.reset(token)
+
+    @staticmethod
+    def current_source():
+        return _current_source.get()
+
+    def observe(self, stage, seconds, source=None):
+        key = (source or _current_source.get(), stage)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name, value=1, source=None):
+        key = (source or _current_source.get(), name)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, source=None):
+        key = (source or _current_source.get(), name)
+        with self._lock:
+            self._gauges[key] = value
+
+    @contextlib.contextmanager
+    def timed(self, stage, source=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, source)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self):
+        """JSON-friendly {source: {'stages': {...}, 'counters': {...}, 'gauges': {...}}} view."""
+        report = {}
+
+        def entry(source):
+            return report.setdefault(source, {'stages': {}, 'counters': {}, 'gauges': {}})
+
+        with self._lock:
+            for (source, stage), h in sorted(self._histograms.items()):
+                entry(source)['stages'][stage] = {
+                    'count': h.count,
+                    'total_seconds': round(h.sum, 4),
+                    'mean_seconds': round(h.sum / h.count, 4) if h.count else 0.0,
+                    'max_seconds': round(h.max, 4),
+                }
+            for (source, name), value in sorted(self._counters.items()):
+                entry(source)['counters'][name] = value
+            for (source, name), value in sorted(self._gauges.items()):
+                entry(source)['gauges'][name] = round(value, 3)
+        return report
+
+    def render_prometheus(self, gauges=None):
+        """Prometheus text exposition of every histogram, counter and `gauges`."""
+        name = f'{self.prefix}_stage_seconds'
+        lines = [
+            f'# HELP {name} Time spent in each scraping stage, per source.',
+            f'# TYPE {name} histogram',
+        ]
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            source_gauges = sorted(self._gauges.items())
+        for (source, stage), h in histograms:
+            cumulative = 0
+            for bound, count in zip(h.buckets, h.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(source=source, stage=stage, le=bound)} {cumulative}')
+            lines.append(f'{name}_bucket{_labels(source=source, stage=stage, le="+Inf")} {h.count}')
+            lines.append(f'{name}_sum{_labels(source=source, stage=stage)} {h.sum:.6f}')
+            lines.append(f'{name}_count{_labels(source=source, stage=stage)} {h.count}')
+
+        name = f'{self.prefix}_items_total'
+        lines += [f'# HELP {name} Items counted by the scrapers, per source.', f'# TYPE {name} counter']
+        for (source, counter), value in counters:
+            lines.append(f'{name}{_labels(source=source, item=counter)} {value}')
+
+        seen = set()
+        for (source, gauge), value in source_gauges:
+            name = f'{self.prefix}_{gauge}'
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name}{_labels(source=source)} {value}')
+
+        for gauge, value in sorted((gauges or {}).items()):
+            if value is None:
+                continue
+            lines += [f'# TYPE {self.prefix}_{gauge} gauge', f'{self.prefix}_{gauge} {value}']
+        return '\n'.join(lines) + '\n'
+
+
+METRICS = Metrics()
@@ -0,0 +1,197 @@
+"""Run the source scrapers concurrently under deadlines.
+
+`run_sources()` starts every source at once on an asyncio loop. The scrapers
+themselves are blocking (Selenium, requests), so each attempt runs on a worker
+thread. Concurrency is capped per resource class, so browser sources share
+the browser limit and HTTP sources the HTTP limit, and no source queues behind
+an unrelated one.
+
+Every source has its own deadline and the run has a global one. When a source
+misses its deadline, or the global deadline arrives first, its `CancelToken`
+fires: callbacks registered through `on_cancel()` run (the driver pool
+registers `driver.quit()` for every checked-out browser, which makes a hung
+Selenium call fail at once) and `check_cancelled()` raises inside loops that
+poll it. The run then returns whatever finished, with a status per source,
+instead of waiting for the slowest site. Failed attempts are retried with
+exponential backoff while the deadlines leave room for it. A scraper that
+raises `Unchanged` has nothing new; it is reported as such, not retried.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import random
+import threading
+import time
+
+from .metrics import METRICS
+
+
+class Cancelled(Exception):
+    """Raised inside a scraper whose source was cancelled."""
+
+
+class Unchanged(Exception):
+    """Raised by a scraper whose listing matches the last fingerprint."""
+
+
+class CancelToken:
+    """Cancellation flag plus callbacks that release what a scraper holds."""
+
+    def __init__(self):
+        self._cancelled = False
+        self._callbacks = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def add(self, callback):
+        """Register `callback` to run on cancellation; returns a handle for `remove()`."""
+        with self._lock:
+            if not self._cancelled:
+                self._next_id += 1
+                self._callbacks[self._next_id] = callback
+                return self._next_id
+        callback()
+        return None
+
+    def remove(self, handle):
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+    def cancel(self):
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = list(self._callbacks.values()), {}
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f'Cancel callback failed: {e}')
+
+
+_current_token = contextvars.ContextVar('scraper_cancel_token', default=None)
+
+
+def on_cancel(callback):
+    """Run `callback` if the current scraper is cancelled; returns an unregister function."""
+    token = _current_token.get()
+    if token is None:
+        return lambda: None
+    handle = token.add(callback)
+    return lambda: token.remove(handle)
+
+
+def check_cancelled():
+    """Raise `Cancelled` if the current scraper has been cancelled."""
+    token = _current_token.get()
+    if token is not None and token.cancelled:
+        raise Cancelled()
+
+
+class SourceTask:
+    """One source to scrape: its function, resource class and deadline."""
+
+    def __init__(self, name, func, resource='http', timeout=120, retries=1):
+        self.name = name
+        self.func = func
+        self.resource = resource
+        self.timeout = timeout
+        self.retries = retries
+
+
+def _status(state, records=0, attempts=0, seconds=0.0, error=None):
+    return {'state': state, 'records': records, 'attempts': attempts,
+            'seconds': round(seconds, 3), 'error': error}
+
+
+async def _run_source(task, limits, executor, run_deadline, results, statuses, backoff):
+    loop = asyncio.get_running_loop()
+    start = time.monotonic()
+    deadline = min(start + task.timeout, run_deadline)
+    attempts = 0
+    error = None
+    statuses[task.name] = _status('running')
+    while True:
+        attempts += 1
+        token = CancelToken()
+        try:
+            async with limits[task.resource]:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                # The worker thread sees the token (and the metrics source) through
+                # a copied context; run_in_executor does not copy it by itself.
+                _current_token.set(token)
+                ctx = contextvars.copy_context()
+                future = loop.run_in_executor(executor, ctx.run, task.func)
+                records = await asyncio.wait_for(future, remaining)
+            results[task.name] = records
+            statuses[task.name] = _status('ok', len(records), attempts, time.monotonic() - start)
+            return
+        except Unchanged:
+            statuses[task.name] = _status('unchanged', 0, attempts, time.monotonic() - start)
+            return
+        except asyncio.TimeoutError:
+            token.cancel()
+            METRICS.inc('timeouts', source=task.name)
+            statuses[task.name] = _status('timeout', 0, attempts, time.monotonic() - start,
+                                          f'no result within {task.timeout}s')
+            print(f'{task.name}: timed out after {time.monotonic() - start:.1f}s, cancelled')
+            return
+        except asyncio.CancelledError:
+            token.cancel()
+            statuses[task.name] = _status('cancelled', 0, attempts, time.monotonic() - start,
+                                          'global deadline reached')
+            raise
+        except Exception as e:
+            token.cancel()
+            error = f'{type(e).__name__}: {e}'
+            print(f'{task.name}: attempt {attempts} failed ({error})')
+
+        delay = backoff * (2 ** (attempts - 1)) * (1 + random.random() * 0.25)
+        if attempts > task.retries or time.monotonic() + delay >= deadline:
+            statuses[task.name] = _status('failed', 0, attempts, time.monotonic() - start, error)
+            return
+        METRICS.inc('retries', source=task.name)
+        await asyncio.sleep(delay)
+
+
+async def _run_all(tasks, limits, deadline, backoff):
+    results = {}
+    statuses = {}
+    run_deadline = time.monotonic() + deadline
+    semaphores = {name: asyncio.Semaphore(n) for name, n in limits.items()}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=sum(limits.values()),
+                                                     thread_name_prefix='scraper')
+    try:
+        pending = [asyncio.create_task(_run_source(t, semaphores, executor, run_deadline,
+                                                   results, statuses, backoff))
+                   for t in tasks]
+        done, pending = await asyncio.wait(pending, timeout=max(0.0, run_deadline - time.monotonic()))
+        for t in pending:
+            t.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            print(f'Global deadline of {deadline}s reached, returning partial results')
+    finally:
+        # Don't wait for threads stuck in cancelled scrapers; their browsers
+        # have been quit, so they unwind on their own.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results, statuses
+
+
+def run_sources(tasks, limits, deadline=180, backoff=2.0):
+    """Scrape every task concurrently; returns `({name: records}, {name: status})`.
+
+    `limits` maps each resource class to how many of its sources may run at
+    once. Sources that fail, time out or are cut off by `deadline` are missing
+    from the results and say why in their status.
+    """
+    for task in tasks:
+        limits.setdefault(task.resource, 1)
+    return asyncio.run(_run_all(tasks, limits, deadline, backoff))
@@ -0,0 +1,318 @@
+"""Listing parsers and the HTML backends they run on.
+
+Each parser reads a source's listing items (Devpost tiles, MLH event cards,
+...) through a small backend interface, so the same parsing code runs on:
+
+* `lxml` -- libxml2 builds the tree in C and only the listing items are ever
+  turned into Python objects, found with XPath compiled once per source.
+* `html.parser` -- BeautifulSoup on the stdlib parser, with a `SoupStrainer`
+  so only the listing items are materialized, and soupsieve selectors
+  compiled once per source.
+
+`SCRAPER_PARSER` picks the backend; it defaults to lxml when it is installed.
+Both backends extract text the way BeautifulSoup's `get_text(strip=True)`
+does, so they produce identical records for the same page.
+"""
+import os
+from functools import lru_cache
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # fall back to the stdlib parser
+    lxml = etree = None
+
+PARSER_BACKEND = os.getenv('SCRAPER_PARSER', 'lxml' if lxml is not None else 'html.parser')
+
+# Tag and class of one listing item per source.
+ITEMS = {
+    'Devpost': ('div', 'hackathon-tile'),
+    'Devfolio': ('div', 'sc-bczRLJ'),
+    'MLH': ('div', 'event'),
+    'Hackathon.com': ('div', 'ht-eb-card'),
+}
+
+# Field selectors, relative to one listing item. Only `tag.class` selectors
+# (optionally comma-separated) are used, so both backends can compile them.
+SELECTORS = {
+    'Devpost': {
+        'title': 'h3.mb-4',
+        'date': 'div.submission-period',
+        'link': 'a.flex-row',
+    },
+    'Devfolio': {
+        'title': 'h3.sc-hKMtZM',
+        'date': 'p.sc-hKMtZM',
+        'link': 'a.bnxtME',
+    },
+    'MLH': {
+        'title': 'h3.event-name',
+        'date': 'p.event-date',
+        'link': 'a.event-link',
+    },
+    'Hackathon.com': {
+        'title': 'a.ht-eb-card__title',
+        'dates': 'div.date--start, div.date--end',
+        'date_title': 'div.date__title',
+        'date_day': 'div.date__day',
+        'date_month': 'div.date__month',
+    },
+}
+
+# BeautifulSoup leaves the contents of these out of get_text().
+_NO_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+
+class _SoupBackend:
+    """BeautifulSoup with a SoupStrainer limited to the listing items."""
+
+    def __init__(self, parser='html.parser'):
+        from bs4 import BeautifulSoup, SoupStrainer
+        import soupsieve
+        self.name = self.parser = parser
+        self._soup = BeautifulSoup
+        self._strainers = {source: SoupStrainer(tag, attrs={'class': self._has_class(cls)})
+                           for source, (tag, cls) in ITEMS.items()}
+        self._selectors = {source: {field: soupsieve.compile(css) for field, css in fields.items()}
+                           for source, fields in SELECTORS.items()}
+
+    @staticmethod
+    def _has_class(name):
+        # The strainer sees the raw attribute: a string while parsing, a list
+        # on some bs4 versions. Match a single class token in either form.
+        def match(value):
+            if value is None:
+                return False
+            return name in (value.split() if isinstance(value, str) else value)
+        return match
+
+    def items(self, html, source):
+        tag, cls = ITEMS[source]
+        soup = self._soup(html, self.parser, parse_only=self._strainers[source])
+        return soup.find_all(tag, class_=cls)
+
+    def selectors(self, source):
+        return self._selectors[source]
+
+    @staticmethod
+    def first(node, selector):
+        return selector.select_one(node)
+
+    @staticmethod
+    def all(node, selector):
+        return selector.select(node)
+
+    @staticmethod
+    def text(node):
+        return node.get_text(strip=True)
+
+    @staticmethod
+    def attr(node, name):
+        return node.get(name)
+
+
+def _class_xpath(css, axis='descendant'):
+    """Compile a `tag.class[, tag.class]` selector into an XPath expression."""
+    parts = []
+    for part in css.split(','):
+        tag, _, cls = part.strip().partition('.')
+        if not tag or not cls or '.' in cls:
+            raise ValueError(f'unsupported selector: {css!r}')
+        parts.append(f"{axis}::{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]")
+    return ' | '.join(parts)
+
+
+class _LxmlBackend:
+    """libxml2 tree with XPath lookups; only listing items reach Python."""
+
+    name = 'lxml'
+
+    def __init__(self):
+        self._items = {source: etree.XPath(_class_xpath(f'{tag}.{cls}'))
+                       for source, (tag, cls) in ITEMS.items()}
+        self._selectors = {source: {field: etree.XPath(_class_xpath(css)) for field, css in fields.items()}
+                           for source, fields in SELECTORS.items()}
+
+    def items(self, html, source):
+        try:
+            try:
+                doc = lxml.html.document_fromstring(html)
+            except ValueError:
+                # str input with an XML encoding declaration
+                doc = lxml.html.document_fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            return []
+        return self._items[source](doc)
+
+    def selectors(self, source):
+        return self._selectors[source]
+
+    @staticmethod
+    def first(node, selector):
+        found = selector(node)
+        return found[0] if found else None
+
+    @staticmethod
+    def all(node, selector):
+        return selector(node)
+
+    @staticmethod
+    def text(node):
+        parts = []
+        _LxmlBackend._collect_text(node, parts, True)
+        return ''.join(parts)
+
+    @staticmethod
+    def _collect_text(node, parts, top):
+        # Every text node is stripped and empty ones dropped, as in
+        # get_text(strip=True); comments and script/style bodies are skipped
+        # but the text after them (their tail) still belongs to the parent.
+        if isinstance(node.tag, str) and node.tag not in _NO_TEXT_TAGS:
+            if node.text:
+                text = node.text.strip()
+                if text:
+                    parts.append(text)
+            for child in node:
+                _LxmlBackend._collect_text(child, parts, False)
+        if not top and node.tail:
+            tail = node.tail.strip()
+            if tail:
+                parts.append(tail)
+
+    @staticmethod
+    def attr(node, name):
+        return node.get(name)
+
+
+@lru_cache(maxsize=None)
+def get_backend(name=None):
+    """Backend instance for `name` (default `SCRAPER_PARSER`), built once."""
+    name = name or PARSER_BACKEND
+    if name == 'lxml':
+        if lxml is None:
+            raise RuntimeError('lxml parser backend requested but lxml is not installed')
+        return _LxmlBackend()
+    return _SoupBackend(name)
+
+
+def parse_devpost(html, backend=None):
+    """Optimized parsing with batch processing"""
+    b = get_backend(backend)
+    hackathons = []
+    tiles = b.items(html, 'Devpost')
+    if not tiles:
+        return hackathons
+
+    print(f'Parsing {len(tiles)} tiles...')
+    parsed_count = 0
+    select = b.selectors('Devpost')
+
+    for tile in tiles:
+        try:
+            title_tag = b.first(tile, select['title'])
+            date_tag = b.first(tile, select['date'])
+            link_tag = b.first(tile, select['link'])
+
+            if all([title_tag is not None, date_tag is not None, link_tag is not None]):
+                title = b.text(title_tag)
+                date = b.text(date_tag)
+                link = b.attr(link_tag, 'href')
+
+                if link and link.startswith('/'):
+                    link = f'https://devpost.com{link}'
+
+                hackathons.append({'title': title, 'date': date, 'link': link})
+                parsed_count += 1
+        except Exception:
+            continue
+
+    print(f'Successfully parsed: {parsed_count}/{len(tiles)}')
+    return hackathons
+
+
+def parse_devfolio(html, backend=None):
+    b = get_backend(backend)
+    select = b.selectors('Devfolio')
+    hackathons = []
+    for hackathon in b.items(html, 'Devfolio'):
+        try:
+            title = b.text(b.first(hackathon, select['title']))
+            date = b.text(b.first(hackathon, select['date']))
+            link = b.attr(b.first(hackathon, select['link']), 'href')
+
+            if link.startswith('/'):
+                link = f"https://devfolio.com{link}"
+
+            hackathons.append({'title': title, 'date': date, 'link': link})
+        except:
+            continue
+    return hackathons
+
+
+def parse_mlh(html, backend=None):
+    b = get_backend(backend)
+    select = b.selectors('MLH')
+    hackathons = []
+    for event in b.items(html, 'MLH'):
+        try:
+            title = b.text(b.first(event, select['title']))
+            date = b.text(b.first(event, select['date']))
+            link = b.attr(b.first(event, select['link']), 'href')
+
+            if link.startswith('/'):
+                link = f"https://mlh.io{link}"
+
+            hackathons.append({'title': title, 'date': date, 'link': link})
+        except:
+            continue
+    return hackathons
+
+
+def parse_hackathon_com(html, backend=None):
+    b = get_backend(backend)
+    select = b.selectors('Hackathon.com')
+    hackathons = []
+    for card in b.items(html, 'Hackathon.com'):
+        try:
+            title_tag = b.first(card, select['title'])
+            if title_tag is None:
+                continue
+
+            title = b.text(title_tag)
+            link = b.attr(title_tag, 'href')
+
+            # Build date string
+            date_parts = []
+            for date_div in b.all(card, select['dates']):
+                try:
+                    title_elem = b.first(date_div, select['date_title'])
+                    day_elem = b.first(date_div, select['date_day'])
+                    month_elem = b.first(date_div, select['date_month'])
+
+                    if all(e is not None for e in (title_elem, day_elem, month_elem)):
+                        date_parts.append(f"{b.text(title_elem)} {b.text(day_elem)} {b.text(month_elem)}")
+                except:
+                    continue
+
+            date = ' '.join(date_parts)
+
+            if link and link.startswith('/'):
+                link = f"https://www.hackathon.com{link}"
+
+            hackathons.append({'title': title, 'date': date, 'link': link})
+        except:
+            continue
+    return hackathons
+
+
+PARSERS = {
+    'Devpost': parse_devpost,
+    'Devfolio': parse_devfolio,
+    'MLH': parse_mlh,
+    'Hackathon.com': parse_hackathon_com,
+}
+
+
+def parse_listing(html, source, backend=None):
+    """Parse a listing page for `source` into title/date/link records."""
+    return PARSERS[source](html, backend)
@@ -0,0 +1,298 @@
+"""Local stand-in for the scraped sites.
+
+`ReplayServer` serves saved pages from a directory laid out as
+`<host>/<path>.html` (see `scraper_flask/fixtures/`), so the fetch engine and
+parsers can run without touching live sites:
+
+    with ReplayServer(FIXTURES_DIR) as server:
+        os.environ['SCRAPER_REPLAY_URL'] = server.url
+        fetch_all_hackathons()
+
+With `SCRAPER_REPLAY_URL` set, `https://devpost.com/hackathons` is requested
+as `<replay url>/devpost.com/hackathons`. Responses carry ETag and
+Last-Modified validators, honour conditional requests and are gzipped when
+the client asks for it. Devpost's paginated `/api/hackathons` endpoint is
+emulated from `devpost.com/api/hackathons.all.json`, and
+`lazy_devpost_route()` serves an infinite-scroll listing on top of it for the
+browser path. `detail_page_fallback()` answers any other path with an event
+page rendered from `detail.html`, for the detail-page crawler.
+"""
+import gzip
+import hashlib
+import html
+import json
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .http_fetch import DEVPOST_LINK_SUFFIX
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.json': 'application/json',
+    '.js': 'application/javascript',
+    '.css': 'text/css',
+}
+
+
+def devpost_api_route(items, per_page=9):
+    """Paginate `items` the way Devpost's `/api/hackathons?page=N` does."""
+    def route(query):
+        try:
+            page = max(1, int(query.get('page', ['1'])[0]))
+        except ValueError:
+            page = 1
+        start = (page - 1) * per_page
+        body = json.dumps({
+            'hackathons': items[start:start + per_page],
+            'meta': {'total_count': len(items), 'per_page': per_page},
+        }).encode('utf-8')
+        return 200, {'Content-Type': 'application/json'}, body
+    return route
+
+
+_LAZY_DEVPOST_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Devpost (lazy replay)</title>
+<style>.hackathon-tile { min-height: 120px; }</style></head>
+<body>
+<div class="challenges-list" id="list">%(tiles)s</div>
+<script>
+(function () {
+  var page = 1, loading = false, done = false, delay = %(delay)d;
+  function esc(s) {
+    return String(s).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/"/g, '&quot;');
+  }
+  function tile(h) {
+    return '<div class="hackathon-tile clearfix open mb-5"><a class="flex-row tile-anchor" href="' +
+      esc(h.url + '%(suffix)s') + '"><div class="main-content"><div class="content"><h3 class="mb-4">' +
+      esc(h.title) + '</h3></div></div><div class="side-info"><div class="submission-period">' +
+      esc(h.submission_period_dates) + '</div></div></a></div>';
+  }
+  function more() {
+    if (loading || done) return;
+    if (window.innerHeight + window.pageYOffset < document.body.scrollHeight - 300) return;
+    loading = true;
+    setTimeout(function () {
+      fetch('api/hackathons?page=' + (page + 1)).then(function (r) { return r.json(); }).then(function (data) {
+        var items = data.hackathons || [];
+        document.getElementById('list').insertAdjacentHTML('beforeend', items.map(tile).join(''));
+        page += 1;
+        done = items.length < data.meta.per_page;
+        loading = false;
+        more();  // keep filling until the viewport is covered
+      });
+    }, delay);
+  }
+  window.addEventListener('scroll', more);
+  more();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def lazy_devpost_route(items, per_page=9, delay_ms=150):
+    """Devpost listing that renders one page of tiles and appends more on scroll.
+
+    Further tiles are fetched from the emulated `/api/hackathons` endpoint
+    `delay_ms` after the page is scrolled near the bottom, like the real
+    infinite-scroll listing.
+    """
+    tiles = ''.join(
+        '<div class="hackathon-tile clearfix open mb-5"><a class="flex-row tile-anchor" href="%s">'
+        '<div class="main-content"><div class="content"><h3 class="mb-4">%s</h3></div></div>'
+        '<div class="side-info"><div class="submission-period">%s</div></div></a></div>'
+        % (html.escape(item['url'] + DEVPOST_LINK_SUFFIX), html.escape(item['title']),
+           html.escape(item['submission_period_dates']))
+        for item in items[:per_page]
+    )
+    body = (_LAZY_DEVPOST_PAGE % {'tiles': tiles, 'delay': delay_ms, 'suffix': DEVPOST_LINK_SUFFIX}).encode('utf-8')
+
+    def route(query):
+        return 200, {'Content-Type': 'text/html; charset=utf-8'}, body
+    return route
+
+
+def load_devpost_api_items(root=FIXTURES_DIR):
+    """Saved Devpost API items, or an empty list if the fixture is missing."""
+    path = os.path.join(root, 'devpost.com', 'api', 'hackathons.all.json')
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['hackathons']
+
+
+def detail_page_fallback(root=FIXTURES_DIR):
+    """Render `detail.html` for any path, with details derived from the path.
+
+    Every hackathon link then has a detail page, and the same path always gets
+    the same prize, themes, location and deadline.
+    """
+    with open(os.path.join(root, 'detail.html'), encoding='utf-8') as f:
+        template = f.read()
+    themes = ['AI', 'Web', 'Fintech', 'Health', 'Climate', 'Education', 'Blockchain', 'Open Ended']
+    cities = ['Berlin, Germany', 'Bangalore, India', 'San Francisco, CA', 'London, UK']
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+    def fallback(path):
+        n = int(hashlib.sha1(path.encode('utf-8')).hexdigest()[:8], 16)
+        online = n % 3 != 0
+        location = 'Online' if online else cities[n % len(cities)]
+        picked = [themes[(n >> 3) % len(themes)], themes[(n >> 7) % len(themes)]]
+        picked = list(dict.fromkeys(picked))
+        values = {
+            'title': html.escape(path.strip('/').rsplit('/', 1)[-1].replace('-', ' ').title() or 'Hackathon'),
+            'mode': 'Online' if online else 'Offline',
+            'location': location,
+            'location_ld': json.dumps({'@type': 'VirtualLocation', 'url': path} if online
+                                      else {'@type': 'Place', 'name': location}),
+            'prize': f'${(n % 50 + 1) * 1000:,}',
+            'deadline': f'{months[n % 12]} {n % 28 + 1}, 2026',
+            'themes': ', '.join(picked),
+            'theme_items': ''.join(f'<li>{t}</li>' for t in picked),
+        }
+        return 200, {'Content-Type': CONTENT_TYPES['.html']}, (template % values).encode('utf-8')
+    return fallback
+
+
+def default_routes(root=FIXTURES_DIR):
+    """Dynamic endpoints backed by the fixtures in `root`."""
+    routes = {}
+    api_items = load_devpost_api_items(root)
+    if api_items:
+        routes['/devpost.com/api/hackathons'] = devpost_api_route(api_items)
+    return routes
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so pooled clients reuse sockets
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server.replay
+        parts = urlsplit(self.path)
+        if server.delay:
+            time.sleep(server.delay)
+
+        route = server.routes.get(parts.path)
+        if route is not None:
+            status, headers, body = route(parse_qs(parts.query))
+            mtime = None
+        else:
+            found = server.resolve(parts.path)
+            if found is not None:
+                path, content_type = found
+                with open(path, 'rb') as f:
+                    body = f.read()
+                status, headers = 200, {'Content-Type': content_type}
+                mtime = os.path.getmtime(path)
+            elif server.fallback is not None:
+                status, headers, body = server.fallback(parts.path)
+                mtime = None
+            else:
+                self._send(404, {'Content-Type': 'text/plain'}, b'not found')
+                return
+
+        if status == 200:
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+            headers['ETag'] = etag
+            if mtime is not None:
+                headers['Last-Modified'] = formatdate(mtime, usegmt=True)
+            if self._not_modified(etag, mtime):
+                self._send(304, {'ETag': etag}, b'')
+                return
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body)
+                headers['Content-Encoding'] = 'gzip'
+        self._send(status, headers, body)
+
+    def _not_modified(self, etag, mtime):
+        inm = self.headers.get('If-None-Match')
+        if inm is not None:
+            return etag in [t.strip() for t in inm.split(',')]
+        ims = self.headers.get('If-Modified-Since')
+        if ims and mtime is not None:
+            try:
+                return int(mtime) <= parsedate_to_datetime(ims).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send(self, status, headers, body):
+        self.server.replay.record(self.path, status)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ReplayServer:
+    """Threaded HTTP server replaying saved pages on 127.0.0.1.
+
+    `routes` maps a request path to a callable taking the parsed query string
+    and returning `(status, headers, body_bytes)`, for endpoints that need
+    more than a static file; it defaults to `default_routes(root)`.
+    `fallback`, a callable taking the path, answers requests that match
+    neither a route nor a file (see `detail_page_fallback()`). `delay` adds
+    latency to every response.
+    """
+
+    def __init__(self, root=FIXTURES_DIR, routes=None, delay=0.0, port=0, fallback=None):
+        self.root = root
+        self.routes = default_routes(root) if routes is None else dict(routes)
+        self.fallback = fallback
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.replay = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def resolve(self, path):
+        """Map a request path onto a fixture file, returning (file, content type)."""
+        rel = os.path.normpath(path.lstrip('/'))
+        if rel.startswith('..'):
+            return None
+        base = os.path.join(self.root, rel)
+        for candidate in (base, base + '.html', os.path.join(base, 'index.html')):
+            if os.path.isfile(candidate):
+                ext = os.path.splitext(candidate)[1]
+                return candidate, CONTENT_TYPES.get(ext, 'application/octet-stream')
+        return None
+
+    def record(self, path, status):
+        with self._lock:
+            self.requests.append((path, status))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='replay-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,166 @@
+"""Re-scrape each source only when it is likely to have changed.
+
+The scheduler keeps a state file (`data/source_state.json`) with, per source,
+the last records, a fingerprint of what they were built from, and an adaptive
+refresh interval:
+
+    records        last good records from the source
+    fingerprint    hash of the listing HTML / API response, or of the records
+    interval       seconds to wait between checks
+    last_checked   when the source was last fetched
+    last_changed   when its fingerprint last changed
+
+A run scrapes only the sources whose interval has elapsed. While a source is
+being scraped, `content_unchanged()` lets its scraper compare the fetched
+content with the stored fingerprint and raise `Unchanged` before parsing.
+A source that changed gets its interval halved; one that did not gets it
+stretched by half, within `MIN_INTERVAL`/`MAX_INTERVAL`. Fresh records
+are merged with the cached records of the sources that were skipped or
+unchanged, and when nothing changed at all the previous output stands.
+"""
+import contextvars
+import hashlib
+import json
+import os
+import time
+
+from .orchestrator import Unchanged
+
+STATE_VERSION = 1
+MIN_INTERVAL = int(os.getenv('SCRAPER_MIN_INTERVAL', str(60 * 60)))
+MAX_INTERVAL = int(os.getenv('SCRAPER_MAX_INTERVAL', str(7 * 24 * 60 * 60)))
+DEFAULT_INTERVAL = int(os.getenv('SCRAPER_DEFAULT_INTERVAL', str(6 * 60 * 60)))
+SHRINK = 0.5
+GROW = 1.5
+
+# {source: {'known': fingerprint or None, 'seen': fingerprint}} for the
+# sources being scraped by the current scheduler run.
+_fingerprints = contextvars.ContextVar('source_fingerprints', default=None)
+
+
+def fingerprint(content):
+    """Short, stable hash of HTML/JSON text or of a list of records."""
+    if not isinstance(content, (str, bytes)):
+        content = json.dumps(content, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def content_unchanged(source, content):
+    """Record `content`'s fingerprint; raise `Unchanged` if it matches the last run's.
+
+    Outside a scheduler run this only returns.
+    """
+    fingerprints = _fingerprints.get()
+    if fingerprints is None or source not in fingerprints:
+        return
+    entry = fingerprints[source]
+    entry['seen'] = fingerprint(content)
+    if entry['known'] and entry['known'] == entry['seen']:
+        raise Unchanged(source)
+
+
+class SourceScheduler:
+    """Per-source refresh state, loaded from and saved to `path`."""
+
+    def __init__(self, path, sources):
+        self.path = path
+        self.sources = list(sources)
+        self.state = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'version': STATE_VERSION, 'sources': {}}
+
+    def save(self):
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+    def _entry(self, name):
+        return self.state['sources'].setdefault(name, {
+            'records': None,
+            'fingerprint': None,
+            'interval': DEFAULT_INTERVAL,
+            'last_checked': None,
+            'last_changed': None,
+        })
+
+    def due(self, now=None, force=False):
+        """Sources whose interval has elapsed (or that have no records yet)."""
+        now = time.time() if now is None else now
+        due = []
+        for name in self.sources:
+            entry = self._entry(name)
+            if force or entry['records'] is None or entry['last_checked'] is None \
+                    or now - entry['last_checked'] >= entry['interval']:
+                due.append(name)
+        return due
+
+    def run(self, scrape, merge, force=False, now=None):
+        """Scrape the due sources and merge them with the cached ones.
+
+        `scrape(names)` returns `({name: records}, {name: status})` and is
+        called with the fingerprints in context; `merge(records)` turns the
+        combined per-source records into the final list. Returns
+        `(merged or None when nothing changed, statuses)`.
+        """
+        now = time.time() if now is None else now
+        due = self.due(now, force)
+        fingerprints = {name: {'known': self._entry(name)['fingerprint'], 'seen': None} for name in due}
+        statuses = {name: {'state': 'skipped', 'next_check_in': round(self._entry(name)['interval']
+                                                                       - (now - self._entry(name)['last_checked']))}
+                    for name in self.sources if name not in due}
+        print(f"Scheduler: scraping {due or 'nothing'}; skipping {[n for n in self.sources if n not in due]}")
+
+        changed = False
+        if due:
+            token = _fingerprints.set(fingerprints)
+            try:
+                results, scraped = scrape(due)
+            finally:
+                _fingerprints.reset(token)
+            statuses.update(scraped)
+            for name in due:
+                changed |= self._update(name, results.get(name), scraped.get(name, {}),
+                                        fingerprints[name]['seen'], now)
+        self.save()
+
+        if not changed and all(self._entry(n)['records'] is not None for n in self.sources) \
+                and not force:
+            print('Scheduler: no source changed')
+            return None, statuses
+        combined = []
+        for name in self.sources:
+            combined.extend(dict(r) for r in self._entry(name)['records'] or [])
+        return merge(combined), statuses
+
+    def _update(self, name, records, status, seen, now):
+        """Fold one source's result into its state; True if its data changed."""
+        entry = self._entry(name)
+        state = status.get('state')
+        if state == 'unchanged':
+            changed = False
+        elif state == 'ok' and records:
+            seen = seen or fingerprint(records)
+            changed = seen != entry['fingerprint'] or entry['records'] is None
+            if changed:
+                entry['records'] = records
+                entry['fingerprint'] = seen
+                entry['last_changed'] = now
+        else:
+            # Failed, timed out or empty: check again next run, keep the old records.
+            return False
+        entry['last_checked'] = now
+        factor = SHRINK if changed else GROW
+        entry['interval'] = int(min(MAX_INTERVAL, max(MIN_INTERVAL, entry['interval'] * factor)))
+        status['interval'] = entry['interval']
+        return changed
@@ -1,17 +1,157 @@
+import json
 import time 
 import threading 
 import os 
+import re
 import concurrent.futures 
-from selenium import webdriver 
-from selenium.webdriver.chrome.service import Service 
-from selenium.webdriver.common.by import By 
-from selenium.webdriver.chrome.options import Options 
-from selenium.webdriver.support.ui import WebDriverWait 
-from selenium.webdriver.support import expected_conditions as EC 
-from webdriver_manager.chrome import ChromeDriverManager 
-from bs4 import BeautifulSoup 
+from functools import lru_cache, partial
+
+# Selenium and webdriver-manager are imported where a browser is started, so
+# HTTP-only runs and anything that only imports this module never load them.
+
+from .dates import normalize_dates
+from .dedupe import dedupe
+from .driver_pool import get_pool
+from .http_fetch import DEVPOST_LINK_SUFFIX, USER_AGENT, HttpFetcher, replay_url
+from .metrics import METRICS
+from .orchestrator import SourceTask, Unchanged, check_cancelled, run_sources
+from .parsers import parse_listing
+from .scheduler import content_unchanged
+from .waits import wait_for_count
+
+# Browser pool sizing; override through the environment for CI or small hosts.
+POOL_SIZE = int(os.getenv('SCRAPER_POOL_SIZE', '3'))
+DRIVER_MAX_USES = int(os.getenv('SCRAPER_DRIVER_MAX_USES', '20'))
+DRIVER_MAX_RSS_MB = int(os.getenv('SCRAPER_DRIVER_MAX_RSS_MB', '1024'))
+
+# How each source is fetched. `needs_js` sources always go through the browser;
+# the rest are fetched over HTTP with at most `max_connections` sockets per
+# host and only fall back to the browser when that yields no listings.
+# `item_selector` matches one listing entry and drives the browser waits.
+# `block` lists the resource groups (see BLOCKED_RESOURCES) the browser skips
+# for the source; none of them carry listing text.
+SOURCES = {
+    'Devpost': {
+        'url': 'https://devpost.com/hackathons',
+        'api_url': 'https://devpost.com/api/hackathons',
+        'needs_js': True,
+        'max_connections': 4,
+        'item_selector': '.hackathon-tile',
+        # Tiles are positioned with CSS while scrolling; keep stylesheets.
+        'block': ('images', 'media', 'fonts', 'trackers'),
+    },
+    'Devfolio': {
+        'url': 'https://devfolio.co/hackathons',
+        'needs_js': False,
+        'max_connections': 2,
+        'item_selector': 'div.sc-bczRLJ',
+        'block': ('images', 'media', 'fonts', 'trackers', 'css'),
+    },
+    'MLH': {
+        'url': 'https://mlh.io/seasons/2025/events',
+        'needs_js': False,
+        'max_connections': 2,
+        'item_selector': 'div.event',
+        'block': ('images', 'media', 'fonts', 'trackers', 'css'),
+    },
+    'Hackathon.com': {
+        'url': 'https://www.hackathon.com/online',
+        'needs_js': False,
+        'max_connections': 2,
+        'item_selector': 'div.ht-eb-card',
+        'block': ('images', 'media', 'fonts', 'trackers', 'css'),
+    },
+}
+
+# URL patterns for `Network.setBlockedURLs`, by resource group.
+BLOCKED_RESOURCES = {
+    'images': ('*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*'),
+    'media': ('*.mp4*', '*.webm*', '*.mp3*', '*.m3u8*', '*youtube.com/embed*', '*player.vimeo.com*'),
+    'fonts': ('*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.gstatic.com*'),
+    'css': ('*.css*',),
+    'trackers': (
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+        '*connect.facebook.net*', '*hotjar.com*', '*segment.io*', '*cdn.segment.com*', '*mixpanel.com*',
+        '*intercom.io*', '*intercomcdn.com*', '*fullstory.com*', '*clarity.ms*', '*sentry.io*',
+        '*hs-scripts.com*', '*hs-analytics.net*', '*amplitude.com*', '*heap.io*', '*linkedin.com/px*',
+    ),
+}
+
+# Trimmed browser profile: no extensions or background traffic, and a cap on
+# each renderer's JS heap. SCRAPER_LITE_BROWSER=0 restores stock Chrome flags.
+LITE_BROWSER = os.getenv('SCRAPER_LITE_BROWSER', '1') != '0'
+RENDERER_MAX_HEAP_MB = int(os.getenv('SCRAPER_RENDERER_MAX_HEAP_MB', '512'))
+
+# 'api' reads Devpost's paginated JSON endpoint and only scrolls the listing in
+# a browser if that fails; 'browser' always scrolls.
+DEVPOST_MODE = os.getenv('SCRAPER_DEVPOST_MODE', 'api')
+DEVPOST_API_FANOUT = int(os.getenv('SCRAPER_DEVPOST_FANOUT', '4'))
+DEVPOST_API_MAX_PAGES = 200
+# Browser fallback: per-scroll wait deadline and quiet period (seconds).
+DEVPOST_MAX_SCROLLS = 100
+DEVPOST_SCROLL_TIMEOUT = float(os.getenv('SCRAPER_SCROLL_TIMEOUT', '6'))
+DEVPOST_SCROLL_IDLE = float(os.getenv('SCRAPER_SCROLL_IDLE', '1.5'))
+# Read tiles as they are appended instead of parsing the final page source.
+DEVPOST_INCREMENTAL = os.getenv('SCRAPER_DEVPOST_INCREMENTAL', '1') != '0'
+
+# Orchestration: the whole run's deadline, each source's deadline, retries
+# after a failure, and how many sources of each resource class run at once.
+RUN_DEADLINE = float(os.getenv('SCRAPER_DEADLINE', '180'))
+SOURCE_TIMEOUT = float(os.getenv('SCRAPER_SOURCE_TIMEOUT', '120'))
+SOURCE_RETRIES = int(os.getenv('SCRAPER_RETRIES', '1'))
+RETRY_BACKOFF = float(os.getenv('SCRAPER_RETRY_BACKOFF', '2'))
+CONCURRENCY = {
+    'browser': int(os.getenv('SCRAPER_BROWSER_CONCURRENCY', str(POOL_SIZE))),
+    'http': int(os.getenv('SCRAPER_HTTP_CONCURRENCY', '4')),
+}
+
+# Season year of sources whose listing is one season's page (MLH's /seasons/2025/),
+# used to date events shown without a year.
+SEASONS = {name: int(m.group(1)) for name, source in SOURCES.items()
+           if (m := re.search(r'/seasons/(\d{4})\b', source['url']))}
+
+# Leave events that have already ended out of the results instead of flagging them.
+DROP_PAST_EVENTS = os.getenv('SCRAPER_DROP_PAST', '0') == '1'
+
+_http_fetcher = None
+_http_lock = threading.Lock()
+
+
+def _http_get(name, url, **kwargs):
+    """GET through the shared client, timed as `name`'s http_fetch stage."""
+    with METRICS.timed('http_fetch', name):
+        result = _http().get(url, max_connections=SOURCES[name]['max_connections'], **kwargs)
+    if result.not_modified:
+        METRICS.inc('not_modified', source=name)
+    return result
+
+
+def _http():
+    """Shared HTTP client, so keep-alive connections and validators survive across runs."""
+    global _http_fetcher
+    with _http_lock:
+        if _http_fetcher is None:
+            _http_fetcher = HttpFetcher(cache_dir=os.getenv('SCRAPER_HTTP_CACHE_DIR') or None)
+        return _http_fetcher
+
+
+@lru_cache(maxsize=None)
+def _chromedriver_path():
+    """Resolve the chromedriver binary once per process."""
+    # On GitHub runners the chromedriver path is standard
+    if os.getenv('GITHUB_ACTIONS') == 'true' and os.path.exists('/usr/bin/chromedriver'):
+        return '/usr/bin/chromedriver'
+    # Local dev: let webdriver-manager handle driver install if needed
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
 def _make_headless_driver():
     """Create a headless Chrome/Chromium driver that works both locally and in GitHub Actions."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     opts = Options()
     opts.add_argument('--headless=new')
     opts.add_argument('--no-sandbox')
@@ -19,21 +159,23 @@ def _make_headless_driver():
     opts.add_argument('--disable-gpu')
     opts.add_argument('--disable-software-rasterizer')
     opts.add_argument('--window-size=1920,1080')
-    opts.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36')
+    if LITE_BROWSER:
+        for flag in ('--disable-extensions', '--disable-background-networking', '--disable-component-update',
+                     '--disable-default-apps', '--disable-sync', '--no-first-run', '--mute-audio',
+                     '--disable-features=Translate,MediaRouter,OptimizationHints'):
+            opts.add_argument(flag)
+        opts.add_argument(f'--js-flags=--max-old-space-size={RENDERER_MAX_HEAP_MB}')
+    opts.add_argument(f'--user-agent={USER_AGENT}')
     opts.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
     opts.add_experimental_option('useAutomationExtension', False)
 
-    # Use system Chrome/Chromium on GitHub Actions
-    if os.getenv('GITHUB_ACTIONS') == 'true':
-        # On GitHub runners the Chrome binary and chromedriver paths are standard
-        try:
-            service = Service('/usr/bin/chromedriver')
-            driver = webdriver.Chrome(service=service, options=opts)
-        except Exception:
-            # Fallback to webdriver-manager if direct service fails
-            driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    else:
-        # Local dev: let webdriver-manager handle driver install if needed
+    try:
+        driver = webdriver.Chrome(service=Service(_chromedriver_path()), options=opts)
+    except Exception:
+        if os.getenv('GITHUB_ACTIONS') != 'true':
+            raise
+        # Fallback to webdriver-manager if the system chromedriver fails
+        from webdriver_manager.chrome import ChromeDriverManager
         driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
 
     # Reasonable timeouts for CI and local runs
@@ -42,297 +184,396 @@ def _make_headless_driver():
     return driver
 
 
-def _fast_scroll_devpost(driver):
-    """Optimized scrolling for Devpost with faster timing and smarter detection"""
-    print('Starting optimized Devpost scrolling...')
+def _driver_pool():
+    """Shared pool of warm browsers, reused across scrapers and `fetch_all_hackathons()` runs."""
+    return get_pool(
+        _make_headless_driver,
+        max_size=POOL_SIZE,
+        max_uses=DRIVER_MAX_USES,
+        max_rss_mb=DRIVER_MAX_RSS_MB,
+    )
+
+
+def _block_resources(driver, name):
+    """Apply the source's resource policy to a checked-out browser.
+
+    Pooled browsers move between sources, so the blocklist is replaced on
+    every checkout rather than set once at startup.
+    """
+    patterns = [p for group in SOURCES[name].get('block', ()) for p in BLOCKED_RESOURCES[group]]
     try:
-        WebDriverWait(driver, 6).until(
-            EC.presence_of_element_located((By.CLASS_NAME, 'hackathon-tile'))
-        )
-        time.sleep(1)
-    except Exception:
-        print('No initial hackathon tiles found')
-        return 0
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        print(f'{name}: could not set blocked URLs ({e})')
 
-    initial_tiles = len(driver.find_elements(By.CLASS_NAME, 'hackathon-tile'))
-    print(f'Initial tiles: {initial_tiles}')
 
-    last_count = initial_tiles
-    stagnant_attempts = 0
-    max_stagnant = 5
-    max_scrolls = 100
-
-    viewport_height = driver.execute_script('return window.innerHeight')
-    scroll_increment = viewport_height * 0.8
-
-    for attempt in range(max_scrolls):
-        scroll_data = driver.execute_script("""
-            return {
-                tiles: document.querySelectorAll('.hackathon-tile').length,
-                height: document.body.scrollHeight,
-                scroll: window.pageYOffset,
-                viewport: window.innerHeight
-            };
-        """)
-
-        current_tiles = scroll_data['tiles']
-        current_height = scroll_data['height']
-        current_scroll = scroll_data['scroll']
-        viewport_height = scroll_data['viewport']
-
-        if current_scroll + viewport_height >= current_height - 500:
-            driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-        else:
-            new_pos = current_scroll + scroll_increment
-            driver.execute_script(f'window.scrollTo(0, {new_pos});')
-
-        time.sleep(0.8)
-
-        quick_check = driver.execute_script("""
-            return {
-                tiles: document.querySelectorAll('.hackathon-tile').length,
-                height: document.body.scrollHeight
-            };
-        """)
-
-        new_tiles = quick_check['tiles']
-        new_height = quick_check['height']
-
-        if new_tiles > current_tiles or new_height > current_height:
-            gained = new_tiles - current_tiles
-            last_count = new_tiles
-            stagnant_attempts = 0
-            if gained > 0:
-                print(f'  Scroll {attempt + 1}: +{gained} tiles (total: {new_tiles})')
-            time.sleep(0.5)
-        else:
-            stagnant_attempts += 1
-            print(f'  Scroll {attempt + 1}: No new content ({stagnant_attempts}/{max_stagnant})')
-
-        if stagnant_attempts == 2 and attempt < max_scrolls - 10:
-            try:
-                button = driver.find_element(By.XPATH, "//button[contains(translate(text(), 'ML', 'ml'), 'more')] | //a[contains(translate(text(), 'ML', 'ml'), 'more')]")
-                if button.is_displayed() and button.is_enabled():
-                    print(f'  → Clicking: {button.text[:20]}')
-                    driver.execute_script('arguments[0].click();', button)
-                    time.sleep(1.5)
-                    stagnant_attempts = 0
-            except Exception:
-                pass
-
-        if stagnant_attempts >= max_stagnant:
-            print(f'  → Stopping after {attempt+1} scrolls: {stagnant_attempts} stagnant attempts')
-            break
+def _open_listing(driver, name, url):
+    """Load a listing page in a pooled browser with the source's blocklist."""
+    _block_resources(driver, name)
+    with METRICS.timed('page_load', name):
+        driver.get(url)
 
-        if attempt % 15 == 0 and attempt > 0:
-            print(f'  → Scroll checkpoint {attempt}: {current_tiles} tiles')
 
-    final_count = len(driver.find_elements(By.CLASS_NAME, 'hackathon-tile'))
-    print(f'Devpost scrolling complete: {initial_tiles} → {final_count} (+{final_count - initial_tiles})')
-    return final_count
+def _click_load_more(driver):
+    """Click a visible "load more" control if the page has one."""
+    from selenium.webdriver.common.by import By
 
+    try:
+        button = driver.find_element(By.XPATH, "//button[contains(translate(text(), 'ML', 'ml'), 'more')] | //a[contains(translate(text(), 'ML', 'ml'), 'more')]")
+        if button.is_displayed() and button.is_enabled():
+            print(f'  → Clicking: {button.text[:20]}')
+            driver.execute_script('arguments[0].click();', button)
+            return True
+    except Exception:
+        pass
+    return False
 
-def _parse_devpost(soup):
-    """Optimized parsing with batch processing"""
-    hackathons = []
-    tiles = soup.find_all('div', class_='hackathon-tile')
-    if not tiles:
-        return hackathons
 
-    print(f'Parsing {len(tiles)} tiles...')
-    parsed_count = 0
+def _devpost_scroll_batches(driver):
+    """Scroll Devpost's lazy-loading listing until new tiles stop arriving.
 
-    for tile in tiles:
-        try:
-            title_tag = tile.find('h3', class_='mb-4')
-            date_tag = tile.find('div', class_='submission-period')
-            link_tag = tile.find('a', class_='flex-row')
+    Yields the tile count after the initial load and after every scroll that
+    attached more tiles. Each scroll is followed by an event-driven wait that
+    returns as soon as more tiles are attached, or once the page goes quiet.
+    The first scroll that brings nothing gets one "load more" click; if that
+    brings nothing either, the listing is exhausted.
+    """
+    print('Starting optimized Devpost scrolling...')
+    selector = SOURCES['Devpost']['item_selector']
+    initial_tiles, _ = wait_for_count(driver, selector, 0, timeout=8, idle=3)
+    if not initial_tiles:
+        print('No initial hackathon tiles found')
+        return
+    print(f'Initial tiles: {initial_tiles}')
+    yield initial_tiles
+
+    current_tiles = initial_tiles
+    for attempt in range(DEVPOST_MAX_SCROLLS):
+        check_cancelled()
+        driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+        new_tiles, reason = wait_for_count(driver, selector, current_tiles, timeout=DEVPOST_SCROLL_TIMEOUT,
+                                           idle=DEVPOST_SCROLL_IDLE, stage='scroll')
+        if new_tiles <= current_tiles and _click_load_more(driver):
+            new_tiles, reason = wait_for_count(driver, selector, current_tiles, timeout=DEVPOST_SCROLL_TIMEOUT,
+                                               idle=DEVPOST_SCROLL_IDLE, stage='scroll')
+        if new_tiles <= current_tiles:
+            print(f'  → Stopping after {attempt + 1} scrolls: no new tiles ({reason})')
+            break
+        print(f'  Scroll {attempt + 1}: +{new_tiles - current_tiles} tiles (total: {new_tiles})')
+        current_tiles = new_tiles
+        yield current_tiles
 
-            if all([title_tag, date_tag, link_tag]):
-                title = title_tag.get_text(strip=True)
-                date = date_tag.get_text(strip=True)
-                link = link_tag.get('href')
+    print(f'Devpost scrolling complete: {initial_tiles} → {current_tiles} (+{current_tiles - initial_tiles})')
 
-                if link and link.startswith('/'):
-                    link = f'https://devpost.com{link}'
 
-                hackathons.append({'title': title, 'date': date, 'link': link})
-                parsed_count += 1
-        except Exception:
-            continue
+def _fast_scroll_devpost(driver):
+    """Scroll the whole listing into the DOM and return the final tile count."""
+    final_count = 0
+    for final_count in _devpost_scroll_batches(driver):
+        pass
+    return final_count
 
-    print(f'Successfully parsed: {parsed_count}/{len(tiles)}')
+
+# Reads the tiles appended since the last call, marking them as seen. Text is
+# gathered the way BeautifulSoup's get_text(strip=True) does: each text node
+# stripped, empty ones dropped, the rest joined without separators.
+_NEW_DEVPOST_TILES_SCRIPT = """
+var tiles = document.querySelectorAll(arguments[0] + ':not([data-hs-seen])');
+function text(el) {
+  var parts = [], walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT), node;
+  while ((node = walker.nextNode())) {
+    var t = node.nodeValue.trim();
+    if (t) parts.push(t);
+  }
+  return parts.join('');
+}
+var out = [];
+for (var i = 0; i < tiles.length; i++) {
+  var tile = tiles[i];
+  tile.setAttribute('data-hs-seen', '1');
+  var title = tile.querySelector('h3.mb-4'),
+      date = tile.querySelector('div.submission-period'),
+      link = tile.querySelector('a.flex-row');
+  if (!title || !date || !link) continue;
+  out.push({title: text(title), date: text(date), link: link.getAttribute('href')});
+}
+return out;
+"""
+
+
+def iter_devpost_tiles(driver):
+    """Yield Devpost records while the listing is still being scrolled.
+
+    After each scroll batch only the newly appended tiles are read, through a
+    single `execute_script` call, so the page is never serialized or parsed as
+    a whole. Records are deduplicated as they arrive.
+    """
+    selector = SOURCES['Devpost']['item_selector']
+    seen = set()
+    for _ in _devpost_scroll_batches(driver):
+        with METRICS.timed('dom_serialize'):
+            batch = driver.execute_script(_NEW_DEVPOST_TILES_SCRIPT, selector) or []
+        for record in batch:
+            link = record.get('link')
+            if not link:
+                continue
+            if link.startswith('/'):
+                link = f'https://devpost.com{link}'
+            key = (record['title'], link)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield {'title': record['title'], 'date': record['date'], 'link': link}
+
+
+def stream_devpost():
+    """Scroll Devpost in a pooled browser, yielding records as tiles load."""
+    with _driver_pool().driver() as driver:
+        _open_listing(driver, 'Devpost', replay_url(SOURCES['Devpost']['url']))
+        yield from iter_devpost_tiles(driver)
+
+
+def _devpost_api_page(page):
+    url = replay_url(f"{SOURCES['Devpost']['api_url']}?page={page}")
+    result = _http_get('Devpost', url, headers={'Accept': 'application/json'})
+    return json.loads(result.text)
+
+
+def _devpost_api_record(item):
+    """Map an API item onto the record `parse_devpost()` builds from its tile."""
+    link = item.get('url')
+    if not (item.get('title') and item.get('submission_period_dates') and link):
+        return None
+    if link.startswith('/'):
+        link = f'https://devpost.com{link}'
+    if '?' not in link:
+        link = f'{link}{DEVPOST_LINK_SUFFIX}'
+    return {'title': item['title'].strip(), 'date': item['submission_period_dates'].strip(), 'link': link}
+
+
+def _fetch_devpost_api():
+    """Read every listing page from Devpost's paginated endpoint.
+
+    Page 1 gives the page size and, through `meta.total_count`, the last
+    page; later pages are requested `DEVPOST_API_FANOUT` at a time and the
+    crawl stops at the first page that comes back short. Without a total the
+    batch holding the short page is the only one requested past the end.
+    """
+    first = _devpost_api_page(1)
+    items = list(first.get('hackathons') or [])
+    meta = first.get('meta') or {}
+    per_page = meta.get('per_page') or len(items)
+    last_page = DEVPOST_API_MAX_PAGES
+    if meta.get('total_count') and per_page:
+        last_page = min(last_page, -(-int(meta['total_count']) // per_page))
+
+    if items and len(items) >= per_page:
+        page = 2
+        done = False
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DEVPOST_API_FANOUT) as executor:
+            while not done and page <= last_page:
+                check_cancelled()
+                batch = range(page, min(page + DEVPOST_API_FANOUT, last_page + 1))
+                for data in executor.map(_devpost_api_page, batch):
+                    got = data.get('hackathons') or []
+                    items.extend(got)
+                    if len(got) < per_page:
+                        done = True
+                        break
+                page += len(batch)
+
+    content_unchanged('Devpost', items)
+    with METRICS.timed('parse', 'Devpost'):
+        hackathons = []
+        seen = set()
+        for item in items:
+            record = _devpost_api_record(item)
+            if record and record['link'] not in seen:
+                seen.add(record['link'])
+                hackathons.append(record)
     return hackathons
 
 
 def scrape_devpost():
     """Optimized Devpost scraping"""
     print('Starting optimized Devpost scraping...')
-    driver = _make_headless_driver()
-    try:
-        driver.get('https://devpost.com/hackathons')
-        time.sleep(1.5)
+    if DEVPOST_MODE == 'api':
+        try:
+            hackathons = _fetch_devpost_api()
+            if hackathons:
+                print(f'Devpost API: {len(hackathons)} hackathons')
+                return hackathons
+            print('Devpost API returned no hackathons, falling back to browser')
+        except Unchanged:
+            raise
+        except Exception as e:
+            print(f'Devpost API failed ({e}), falling back to browser')
+
+    if DEVPOST_INCREMENTAL:
+        hackathons = list(stream_devpost())
+        print(f'Devpost: extracted {len(hackathons)} hackathons while scrolling')
+        return hackathons
 
+    with _driver_pool().driver() as driver:
+        _open_listing(driver, 'Devpost', replay_url(SOURCES['Devpost']['url']))
         final_count = _fast_scroll_devpost(driver)
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-    finally:
-        driver.quit()
+        with METRICS.timed('dom_serialize'):
+            html = driver.page_source
+
+    content_unchanged('Devpost', html)
+    with METRICS.timed('parse'):
+        return parse_listing(html, 'Devpost')
+
+def _load_listing(name):
+    """Fetch and parse a source's listing page, HTTP first and browser second.
+
+    Sources whose markup is in the server response are fetched through the
+    pooled `HttpFetcher`. The headless browser is only used when the source is
+    declared `needs_js`, or when the HTTP path fails or parses to nothing.
+    """
+    source = SOURCES[name]
+    url = replay_url(source['url'])
+    if not source['needs_js']:
+        try:
+            result = _http_get(name, url)
+            # A 304 hands back the cached body, so it matches here too.
+            content_unchanged(name, result.text)
+            with METRICS.timed('parse', name):
+                hackathons = parse_listing(result.text, name)
+            if hackathons:
+                return hackathons
+            print(f'{name}: no listings in HTTP response, falling back to browser')
+        except Unchanged:
+            raise
+        except Exception as e:
+            print(f'{name}: HTTP fetch failed ({e}), falling back to browser')
+        METRICS.inc('browser_fallback', source=name)
+        check_cancelled()
+
+    with _driver_pool().driver() as driver:
+        _open_listing(driver, name, url)
+        wait_for_count(driver, source['item_selector'], 0, timeout=10, idle=2)
+        with METRICS.timed('dom_serialize', name):
+            html = driver.page_source
+    content_unchanged(name, html)
+    with METRICS.timed('parse', name):
+        return parse_listing(html, name)
 
-    return _parse_devpost(soup)
 
 def scrape_devfolio():
     """Optimized Devfolio scraping"""
-    driver = _make_headless_driver()
-    try:
-        driver.get('https://devfolio.co/hackathons')
-        time.sleep(1.5)  # Reduced from 3
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-    finally:
-        driver.quit()
-
-    hackathons = []
-    for hackathon in soup.find_all('div', class_='sc-bczRLJ'):
-        try:
-            title = hackathon.find('h3', class_='sc-hKMtZM').get_text(strip=True)
-            date = hackathon.find('p', class_='sc-hKMtZM').get_text(strip=True)
-            link = hackathon.find('a', class_='bnxtME').get('href')
-            
-            if link.startswith('/'):
-                link = f"https://devfolio.com{link}"
-            
-            hackathons.append({'title': title, 'date': date, 'link': link})
-        except:
-            continue
-    
+    hackathons = _load_listing('Devfolio')
     print(f"Devfolio: Found {len(hackathons)} hackathons")
     return hackathons
 
 
 def scrape_mlh():
     """Optimized MLH scraping"""
-    driver = _make_headless_driver()
-    try:
-        driver.get('https://mlh.io/seasons/2025/events')
-        time.sleep(1.5)  # Reduced from 3
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-    finally:
-        driver.quit()
-
-    hackathons = []
-    for event in soup.find_all('div', class_='event'):
-        try:
-            title = event.find('h3', class_='event-name').get_text(strip=True)
-            date = event.find('p', class_='event-date').get_text(strip=True)
-            link = event.find('a', class_='event-link').get('href')
-            
-            if link.startswith('/'):
-                link = f"https://mlh.io{link}"
-            
-            hackathons.append({'title': title, 'date': date, 'link': link})
-        except:
-            continue
-    
+    hackathons = _load_listing('MLH')
     print(f"MLH: Found {len(hackathons)} hackathons")
     return hackathons
 
 
 def scrape_hackathon_com():
     """Optimized Hackathon.com scraping"""
-    driver = _make_headless_driver()
-    try:
-        driver.get('https://www.hackathon.com/online')
-        time.sleep(1.5)  # Reduced from 3
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-    finally:
-        driver.quit()
-
-    hackathons = []
-    for card in soup.find_all('div', class_='ht-eb-card'):
-        try:
-            title_tag = card.find('a', class_='ht-eb-card__title')
-            if not title_tag:
-                continue
-                
-            title = title_tag.get_text(strip=True)
-            link = title_tag.get('href')
-            
-            # Build date string
-            date_parts = []
-            for date_div in card.find_all('div', class_=['date--start', 'date--end']):
-                try:
-                    title_elem = date_div.find('div', class_='date__title')
-                    day_elem = date_div.find('div', class_='date__day')  
-                    month_elem = date_div.find('div', class_='date__month')
-                    
-                    if all([title_elem, day_elem, month_elem]):
-                        date_parts.append(f"{title_elem.get_text(strip=True)} {day_elem.get_text(strip=True)} {month_elem.get_text(strip=True)}")
-                except:
-                    continue
-            
-            date = ' '.join(date_parts)
-            
-            if link and link.startswith('/'):
-                link = f"https://www.hackathon.com{link}"
-            
-            hackathons.append({'title': title, 'date': date, 'link': link})
-        except:
-            continue
-    
+    hackathons = _load_listing('Hackathon.com')
     print(f"Hackathon.com: Found {len(hackathons)} hackathons")
     return hackathons
 
 
-def fetch_all_hackathons():
-    """Optimized multi-threaded scraping with improved concurrency"""
-    print("Starting optimized multi-threaded hackathon scraping...")
-    start_time = time.time()
-    
-    scrapers = [
-        ("Devpost", scrape_devpost),
-        ("Devfolio", scrape_devfolio), 
-        ("MLH", scrape_mlh),
-        ("Hackathon.com", scrape_hackathon_com)
+def _run_scraper(name, scraper_func):
+    """Run one scraper with its stages attributed to `name`."""
+    with METRICS.source(name):
+        try:
+            with METRICS.timed('scrape'):
+                hackathons = scraper_func()
+        except Unchanged:
+            METRICS.inc('unchanged')
+            raise
+        except Exception:
+            METRICS.inc('failures')
+            raise
+        METRICS.inc('records', len(hackathons))
+    for h in hackathons:
+        h.setdefault('source', name)
+    return hackathons
+
+
+def _resource_class(name):
+    """'browser' for sources that always need Chrome, 'http' for the rest."""
+    if name == 'Devpost':
+        return 'http' if DEVPOST_MODE == 'api' else 'browser'
+    return 'browser' if SOURCES[name]['needs_js'] else 'http'
+
+
+SCRAPERS = [
+    ('Devpost', scrape_devpost),
+    ('Devfolio', scrape_devfolio),
+    ('MLH', scrape_mlh),
+    ('Hackathon.com', scrape_hackathon_com),
+]
+
+
+def scrape_sources(names=None):
+    """Scrape the named sources (all by default) under the run deadline.
+
+    Returns `({name: records}, {name: status})`. Sources run concurrently
+    through the orchestrator; one that fails, misses its deadline or reports
+    `Unchanged` is missing from the records and says why in its status.
+    """
+    names = set(names or [name for name, _ in SCRAPERS])
+    tasks = [
+        SourceTask(name, partial(_run_scraper, name, func), resource=_resource_class(name),
+                   timeout=SOURCE_TIMEOUT, retries=SOURCE_RETRIES)
+        for name, func in SCRAPERS if name in names
     ]
-    
-    results = []
-    
-    # Optimized ThreadPoolExecutor with reduced workers for better resource usage
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:  # Reduced from 4
-        future_to_scraper = {executor.submit(scraper_func): name 
-                           for name, scraper_func in scrapers}
-        
-        for future in concurrent.futures.as_completed(future_to_scraper):
-            scraper_name = future_to_scraper[future]
-            try:
-                scraper_results = future.result(timeout=180)  # Reduced from 300
-                results.extend(scraper_results)
-                elapsed = time.time() - start_time
-                print(f"{scraper_name}: {len(scraper_results)} hackathons ({elapsed:.1f}s)")
-            except Exception as e:
-                print(f"{scraper_name} failed: {e}")
-    
-    # Ultra-fast deduplication using dict
-    seen = {}
-    unique = []
-    duplicates = 0
-    
-    for h in results:
-        key = f"{h.get('title', '')}{h.get('link', '')}"  # String concatenation is faster
-        if key not in seen:
-            seen[key] = True
-            unique.append(h)
+    by_source, statuses = run_sources(tasks, dict(CONCURRENCY), deadline=RUN_DEADLINE, backoff=RETRY_BACKOFF)
+    for name, _ in SCRAPERS:
+        if name not in names:
+            continue
+        status = statuses.get(name, {})
+        if name in by_source:
+            print(f"{name}: {len(by_source[name])} hackathons ({status.get('seconds', 0):.1f}s)")
+        elif status.get('state') == 'unchanged':
+            print(f"{name}: unchanged since the last run")
         else:
-            duplicates += 1
-    
-    total_time = time.time() - start_time
-    print(f"\nOptimized scraping complete!")
+            print(f"{name} {status.get('state', 'failed')}: {status.get('error')}")
+    return by_source, statuses
+
+
+def merge_hackathons(results):
+    """Parse dates and merge duplicates across all sources' records."""
+    # Before dedupe, which uses the parsed ranges to confirm near-duplicates.
+    with METRICS.timed('dates', 'all'):
+        results, past = normalize_dates(results, drop_past=DROP_PAST_EVENTS, seasons=SEASONS)
+    with METRICS.timed('dedupe', 'all'):
+        unique, duplicates = dedupe(results)
     print(f"Total: {len(unique)} unique hackathons ({duplicates} duplicates)")
-    print(f"Runtime: {total_time:.1f}s ({len(unique)/total_time:.1f} hackathons/sec)")
-    
     return unique
 
 
+def fetch_all_with_status():
+    """Scrape every source under the run deadline; returns `(hackathons, statuses)`."""
+    print("Starting hackathon scraping...")
+    start_time = time.time()
+    by_source, statuses = scrape_sources()
+    results = []
+    for name, _ in SCRAPERS:
+        results.extend(by_source.get(name, []))
+    unique = merge_hackathons(results)
+
+    total_time = time.time() - start_time
+    print(f"\nScraping complete!")
+    print(f"Runtime: {total_time:.1f}s ({len(unique)/max(total_time, 1e-6):.1f} hackathons/sec)")
+    return unique, statuses
+
+
+def fetch_all_hackathons():
+    """Scrape every source and return the merged hackathon list."""
+    return fetch_all_with_status()[0]
+
+
 # Additional utility function for testing single scrapers
 def test_single_scraper(scraper_name):
     """Test a single scraper for debugging"""
@@ -0,0 +1,151 @@
+"""In-memory search over the current snapshot for `/api/hackathons`.
+
+`SearchIndex` is built once per snapshot version:
+
+    postings   token -> set of record ids, for title, date and source words
+    vocabulary sorted tokens, so a prefix is a `bisect` range instead of a scan
+    orders     record ids for every sort, precomputed with their ranks
+    ends       (sort_end, id) pairs, so "not yet ended" is a `bisect` cut
+
+A query intersects the (prefix-expanded) postings of each word, smallest set
+first, and orders the hits by the precomputed rank, so its cost follows the
+number of hits rather than the size of the dataset. `IndexCache` rebuilds the
+index only when the snapshot version changes.
+"""
+import bisect
+import re
+import threading
+
+_TOKEN_RE = re.compile(r'\w+')
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.casefold()) if text else []
+
+
+def _sort_orders(records):
+    ids = range(len(records))
+    dated = [i for i in ids if records[i].get('sort_start')]
+    undated = [i for i in ids if not records[i].get('sort_start')]
+    by_start = sorted(dated, key=lambda i: records[i]['sort_start'])
+    return {
+        # By start date; records without a parsed date go last, in scrape order.
+        'newest': by_start[::-1] + undated,
+        'oldest': by_start + undated,
+        'alpha': sorted(ids, key=lambda i: (records[i].get('title') or '').casefold()),
+    }
+
+
+class SearchIndex:
+    """Token/prefix index and sort orders for one list of records."""
+
+    def __init__(self, records, version=None):
+        self.records = records
+        self.version = version
+        postings = {}
+        by_source = {}
+        for i, h in enumerate(records):
+            sources = h.get('sources') or [h.get('source') or '']
+            text = ' '.join([h.get('title') or '', h.get('date') or ''] + sources)
+            for token in set(tokenize(text)):
+                postings.setdefault(token, set()).add(i)
+            for source in sources:
+                if source:
+                    by_source.setdefault(source.casefold(), set()).add(i)
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+        self.by_source = by_source
+        self.orders = _sort_orders(records)
+        self.ranks = {name: {i: rank for rank, i in enumerate(order)} for name, order in self.orders.items()}
+        self.ends = sorted((h['sort_end'], i) for i, h in enumerate(records) if h.get('sort_end'))
+        self._prefix_cache = {}
+        self._upcoming_cache = {}
+
+    def _prefix(self, token):
+        """Ids of records with any token starting with `token`."""
+        hits = self._prefix_cache.get(token)
+        if hits is None:
+            hits = set()
+            vocabulary = self.vocabulary
+            i = bisect.bisect_left(vocabulary, token)
+            while i < len(vocabulary) and vocabulary[i].startswith(token):
+                hits |= self.postings[vocabulary[i]]
+                i += 1
+            if len(self._prefix_cache) > 1024:
+                self._prefix_cache.clear()
+            self._prefix_cache[token] = hits
+        return hits
+
+    def _upcoming(self, today):
+        """Ids of records ending on or after `today` (YYYYMMDD)."""
+        hits = self._upcoming_cache.get(today)
+        if hits is None:
+            start = bisect.bisect_left(self.ends, (today, -1))
+            hits = self._upcoming_cache[today] = {i for _, i in self.ends[start:]}
+        return hits
+
+    def _match(self, q, source, upcoming=None):
+        """Set of matching ids, or None when nothing filters the records."""
+        sets = [self._prefix(token) for token in tokenize(q)]
+        if source:
+            sets.append(self.by_source.get(source.casefold(), set()))
+        if upcoming:
+            sets.append(self._upcoming(upcoming))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        hits = set(sets[0])
+        for other in sets[1:]:
+            if not hits:
+                break
+            hits &= other
+        return hits
+
+    def search(self, q='', sort='newest', source=None, page=1, page_size=DEFAULT_PAGE_SIZE, upcoming=None):
+        """One page of matching records plus the totals needed to page through them.
+
+        `upcoming` is a YYYYMMDD integer; when given, only events that have not
+        ended by that day are returned.
+        """
+        if sort not in self.orders:
+            sort = 'newest'
+        page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+        page = max(1, int(page))
+        order = self.orders[sort]
+        hits = self._match(q, source, upcoming)
+        if hits is None:
+            ids = order
+        elif len(hits) * 8 < len(order):
+            ids = sorted(hits, key=self.ranks[sort].__getitem__)
+        else:
+            ids = [i for i in order if i in hits]
+        start = (page - 1) * page_size
+        return {
+            'version': self.version,
+            'total': len(ids),
+            'page': page,
+            'page_size': page_size,
+            'pages': -(-len(ids) // page_size),
+            'sort': sort,
+            'items': [self.records[i] for i in ids[start:start + page_size]],
+        }
+
+
+class IndexCache:
+    """Holds the index for the latest snapshot version, rebuilding on change."""
+
+    def __init__(self):
+        self._index = None
+        self._lock = threading.Lock()
+
+    def get(self, records, version):
+        index = self._index
+        if index is not None and index.version == version:
+            return index
+        with self._lock:
+            if self._index is None or self._index.version != version:
+                self._index = SearchIndex(records, version)
+            return self._index
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+
+
+class SnapshotCache:
+    """Last-good hackathon list with stale-while-revalidate refreshes.
+
+    `get()` never scrapes on the caller's thread: it returns whatever snapshot
+    is in memory (seeded from the JSON file written by `scripts/run_scraper.py`)
+    and, once the snapshot is older than `ttl` seconds, starts a single
+    background refresh. The refresh lock makes concurrent misses collapse into
+    one `fetcher()` call.
+
+    A refresh that fails or returns nothing is not retried until
+    `retry_after` seconds (at most `ttl`) have passed, so a broken source does
+    not turn every request into another scrape.
+
+    With a `store` (`db.HackathonStore`), the snapshot is seeded from the
+    latest run in the database, falling back to the JSON file, and every
+    successful refresh is saved back to it, unless `save_refreshes` is off
+    because the fetcher writes the store itself.
+    """
+
+    def __init__(self, fetcher, path=None, ttl=3600, auto_refresh=True, store=None, retry_after=300,
+                 save_refreshes=True):
+        self.fetcher = fetcher
+        self.save_refreshes = save_refreshes
+        self.retry_after = min(retry_after, ttl)
+        self._attempted_at = None
+        self.path = path
+        self.store = store
+        self.ttl = ttl
+        self.auto_refresh = auto_refresh
+        self._data = None
+        self._fetched_at = None
+        self._last_error = None
+        self._state_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._thread = None
+
+    def _load_file(self):
+        """Seed the snapshot from the JSON file, using its mtime as the fetch time."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            fetched_at = os.path.getmtime(self.path)
+        except (OSError, ValueError) as e:
+            print(f'Snapshot: could not load {self.path}: {e}')
+            return
+        if isinstance(data, list):
+            self._data = data
+            self._fetched_at = fetched_at
+
+    def _load_store(self):
+        """Seed the snapshot from the latest run saved in the store."""
+        try:
+            data, fetched_at = self.store.load()
+        except Exception as e:
+            print(f'Snapshot: could not load from the database: {e}')
+            return
+        if data:
+            self._data = data
+            self._fetched_at = fetched_at
+
+    def _ensure_loaded(self):
+        with self._state_lock:
+            if self._data is None and self.store is not None:
+                self._load_store()
+            if self._data is None:
+                self._load_file()
+            if self._data is None:
+                self._data = []
+
+    def age(self):
+        """Seconds since the current snapshot was fetched, or None if never fetched."""
+        if self._fetched_at is None:
+            return None
+        return max(0.0, time.time() - self._fetched_at)
+
+    def is_stale(self):
+        age = self.age()
+        return age is None or age > self.ttl
+
+    def _should_refresh(self):
+        """Stale, and no failed attempt within the retry backoff."""
+        if not self.auto_refresh or not self.is_stale():
+            return False
+        attempted = self._attempted_at
+        return self._last_error is None or attempted is None or time.time() - attempted >= self.retry_after
+
+    def is_refreshing(self):
+        return self._refresh_lock.locked()
+
+    def get(self):
+        """Return the current snapshot, kicking off a background refresh if stale."""
+        self._ensure_loaded()
+        if self._should_refresh():
+            self.refresh_async()
+        return self._data
+
+    def get_versioned(self):
+        """Like `get()`, but returns `(data, version)` read together."""
+        self._ensure_loaded()
+        if self._should_refresh():
+            self.refresh_async()
+        with self._state_lock:
+            return self._data, self._version()
+
+    def version(self):
+        """Opaque id that changes whenever the snapshot data changes."""
+        self._ensure_loaded()
+        with self._state_lock:
+            return self._version()
+
+    def _version(self):
+        return '%x-%d' % (int((self._fetched_at or 0) * 1000), len(self._data))
+
+    def refresh_async(self):
+        """Start a background refresh unless one is already running."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        self._thread = threading.Thread(target=self._run_refresh, name='snapshot-refresh', daemon=True)
+        self._thread.start()
+        return True
+
+    def refresh(self):
+        """Refresh on the calling thread, or wait for the refresh already in flight."""
+        if not self._refresh_lock.acquire(blocking=False):
+            with self._refresh_lock:
+                return self._data
+        self._run_refresh()
+        return self._data
+
+    def _run_refresh(self):
+        try:
+            start = self._attempted_at = time.time()
+            data = self.fetcher()
+            if data:
+                with self._state_lock:
+                    self._data = data
+                    self._fetched_at = time.time()
+                    self._last_error = None
+                print(f'Snapshot: refreshed {len(data)} hackathons in {time.time() - start:.1f}s')
+                self._save(data)
+            else:
+                # Keep serving the last good result rather than an empty page.
+                self._last_error = 'fetcher returned no results'
+                print('Snapshot: refresh returned no results, keeping previous snapshot')
+        except Exception as e:
+            self._last_error = str(e)
+            print(f'Snapshot: refresh failed: {e}')
+        finally:
+            self._refresh_lock.release()
+
+    def _save(self, data):
+        if self.store is None or not self.save_refreshes:
+            return
+        try:
+            self.store.save(data, seen_at=self._fetched_at)
+        except Exception as e:
+            print(f'Snapshot: could not save to the database: {e}')
+
+    def status(self):
+        """Summary of the snapshot for the status route."""
+        self._ensure_loaded()
+        age = self.age()
+        return {
+            'count': len(self._data),
+            'version': self.version(),
+            'fetched_at': self._fetched_at,
+            'age_seconds': None if age is None else round(age, 1),
+            'ttl_seconds': self.ttl,
+            'stale': self.is_stale(),
+            'refreshing': self.is_refreshing(),
+            'last_error': self._last_error,
+            'last_attempt_at': self._attempted_at,
+        }
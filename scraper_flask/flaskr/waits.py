@@ -0,0 +1,70 @@
+"""Event-driven waits for the browser scraping path.
+
+Instead of sleeping a fixed time after `driver.get()` or a scroll, the
+scrapers call `wait_for_count()`, which runs a MutationObserver inside the
+page through `execute_async_script` and returns as soon as more than
+`baseline` elements match the source's item selector (and the DOM has settled
+briefly), when the page goes quiet, or at the deadline. Every wait is timed
+in the scraper metrics, with a counter per outcome, so both end up in
+`/metrics` and `run_report.json`.
+"""
+import time
+
+from .metrics import METRICS
+
+_GROWTH_SCRIPT = """
+var selector = arguments[0], baseline = arguments[1], timeoutMs = arguments[2],
+    idleMs = arguments[3], settleMs = arguments[4];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), lastActivity = start, grewAt = null, finished = false;
+var observer = null, timer = null;
+function count() { return document.querySelectorAll(selector).length; }
+function resources() { return performance.getEntriesByType('resource').length; }
+var lastResources = resources();
+function finish(reason) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  if (timer) clearInterval(timer);
+  done({count: count(), reason: reason, elapsed: performance.now() - start});
+}
+observer = new MutationObserver(function () {
+  lastActivity = performance.now();
+  if (grewAt === null && count() > baseline) grewAt = lastActivity;
+});
+observer.observe(document.documentElement || document, {childList: true, subtree: true});
+timer = setInterval(function () {
+  var now = performance.now();
+  var r = resources();
+  if (r !== lastResources) { lastResources = r; lastActivity = now; }
+  if (grewAt === null && count() > baseline) grewAt = now;
+  if (grewAt !== null && now - lastActivity >= settleMs) finish('grew');
+  else if (now - start >= timeoutMs) finish(grewAt !== null ? 'grew' : 'timeout');
+  else if (grewAt === null && idleMs > 0 && now - lastActivity >= idleMs) finish('idle');
+}, 50);
+"""
+
+def wait_for_count(driver, selector, baseline=0, timeout=10, idle=None, settle=0.2, stage='wait'):
+    """Wait until more than `baseline` elements match `selector`.
+
+    Returns `(count, reason)` where reason is 'grew', 'idle' (no DOM mutations
+    or new network resources for `idle` seconds), 'timeout', or 'error' if the
+    script could not run. After growth the wait lasts until the DOM has been
+    quiet for `settle` seconds, so a batch of tiles is picked up whole. The
+    duration is recorded as `stage` and the outcome as a `<stage>_<reason>`
+    counter in the scraper metrics.
+    """
+    start = time.time()
+    try:
+        driver.set_script_timeout(timeout + 5)
+        result = driver.execute_async_script(
+            _GROWTH_SCRIPT, selector, baseline,
+            int(timeout * 1000), int((idle or 0) * 1000), int(settle * 1000),
+        )
+        count, reason = result['count'], result['reason']
+    except Exception:
+        count, reason = baseline, 'error'
+    elapsed = time.time() - start
+    METRICS.observe(stage, elapsed)
+    METRICS.inc(f'{stage}_{reason}')
+    return count, reason
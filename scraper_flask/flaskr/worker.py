@@ -0,0 +1,68 @@
+"""Scrape in a separate process and hand the result to the web app.
+
+With `SCRAPER_MODE=worker` the web app never imports the scraper stack
+(Selenium, webdriver-manager, BeautifulSoup); a snapshot refresh runs
+
+    python -m flaskr.worker --database <path> [--json <path>]
+
+instead, which scrapes, saves the run to the SQLite store and exits, taking
+its browsers and their memory with it. The web process then reloads the
+snapshot from the store without saving it again, and leaves the tracked
+`data/` files to `scripts/run_scraper.py`. The same command can run from
+cron or a separate container, with the web app only ever reading the store.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from .db import HackathonStore
+
+# Seconds a refresh waits for the worker process before giving up on it.
+WORKER_TIMEOUT = int(os.getenv('SCRAPER_WORKER_TIMEOUT', '900'))
+
+
+def run_worker(database, json_path=None, timeout=WORKER_TIMEOUT):
+    """Run one scrape in a child process; returns `(records, fetched_at)` from the store."""
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, '-m', 'flaskr.worker', '--database', database]
+    if json_path:
+        command += ['--json', json_path]
+    start = time.time()
+    completed = subprocess.run(command, cwd=package_root, timeout=timeout)
+    if completed.returncode != 0:
+        raise RuntimeError(f'scraper worker exited with status {completed.returncode}')
+    print(f'Worker: scrape finished in {time.time() - start:.1f}s')
+    return HackathonStore(database).load()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Scrape every source once and save the result.')
+    parser.add_argument('--database', required=True, help='SQLite store the web app reads')
+    parser.add_argument('--json', help='also write the records to this JSON file')
+    args = parser.parse_args(argv)
+
+    from .driver_pool import shutdown_pool
+    from .scraping import fetch_all_hackathons
+
+    try:
+        records = fetch_all_hackathons()
+    finally:
+        shutdown_pool()
+    if not records:
+        print('Worker: no results, keeping the previous run')
+        return 1
+    HackathonStore(args.database).save(records)
+    if args.json:
+        tmp = f'{args.json}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, args.json)
+    print(f'Worker: saved {len(records)} hackathons to {args.database}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
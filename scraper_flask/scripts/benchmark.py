@@ -0,0 +1,374 @@
+"""
+Offline benchmarks for the scraping pipeline.
+
+Everything runs against the saved pages in scraper_flask/fixtures/ and a
+local ReplayServer, never the live sites:
+
+- parse:   records/sec and MB/sec for every listing parser and backend
+- dedupe:  throughput on synthetic records (1k, 10k, 100k), dated and
+           undated, with titles drawn from a small vocabulary so the LSH
+           buckets and pairwise checks do real work
+- e2e:     fetch_all_hackathons() against the replay server, plus the
+           browser path on a simulated lazy-loading Devpost listing
+           (skipped when no Chrome is available)
+- flask:   index() latency with N concurrent clients
+- startup: import time and RSS of a fresh web process (`import flaskr` plus
+           create_app()), and which heavy scraper modules it loaded; the
+           scraper stack is measured alongside for comparison
+
+Results are written as JSON; pass --compare with an earlier results file to
+print the relative change of every timing.
+
+Usage: python scripts/benchmark.py [--out bench.json] [--compare old.json]
+                                   [--only parse,dedupe,e2e,flask,startup] [--quick]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from flaskr import parsers
+from flaskr.replay import FIXTURES_DIR, ReplayServer, default_routes, lazy_devpost_route, load_devpost_api_items
+
+LISTING_FIXTURES = {
+    'Devpost': 'devpost.com/hackathons.html',
+    'Devfolio': 'devfolio.co/hackathons.html',
+    'MLH': 'mlh.io/seasons/2025/events.html',
+    'Hackathon.com': 'www.hackathon.com/online.html',
+}
+
+SECTIONS = ['parse', 'dedupe', 'e2e', 'flask', 'startup']
+
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'bs4', 'soupsieve', 'lxml', 'requests')
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the scrapers' progress prints while timing them."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def _best_of(fn, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times), result
+
+
+def bench_parse(repeat):
+    backends = ['html.parser'] + (['lxml'] if parsers.lxml is not None else [])
+    results = {}
+    for source, rel in LISTING_FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, rel), encoding='utf-8') as f:
+            html = f.read()
+        size_mb = len(html.encode('utf-8')) / 1e6
+        for backend in backends:
+            with _quiet():
+                parsers.parse_listing(html, source, backend)  # warm up selector compilation
+                best, median, records = _best_of(lambda: parsers.parse_listing(html, source, backend), repeat)
+            results[f'{source}/{backend}'] = {
+                'records': len(records),
+                'seconds': round(best, 5),
+                'median_seconds': round(median, 5),
+                'records_per_sec': round(len(records) / best, 1) if best else None,
+                'mb_per_sec': round(size_mb / best, 2) if best else None,
+            }
+    return results
+
+
+_PREFIXES = ['Global', 'Online', 'Open', 'Student', 'Women in', 'Build', 'Hack', 'Code', 'Future', 'Green',
+             'Smart', 'Data', 'Cloud', 'Quantum', 'Civic', 'Campus', 'Winter', 'Summer', 'Spring', 'Fall']
+_TOPICS = ['AI', 'Web3', 'Fintech', 'Health', 'Climate', 'Education', 'Gaming', 'Robotics', 'Security', 'Mobility',
+           'Space', 'Music', 'Agritech', 'IoT', 'AR/VR', 'Open Source', 'Accessibility', 'Energy', 'Retail',
+           'Biotech', 'Logistics', 'Media', 'Legal', 'Travel', 'Sports', 'Food', 'Cities', 'Ocean', 'Kids', 'Art']
+_KINDS = ['Hackathon', 'Hack', 'Challenge', 'Buildathon', 'Jam', 'Sprint']
+_CITIES = ['', '', '', 'Berlin', 'Bangalore', 'Lagos', 'Toronto', 'London', 'Delhi', 'Austin', 'Paris', 'Tokyo',
+           'Sydney', 'Nairobi', 'Madrid']
+_SYLLABLES = ['ka', 'zo', 'ri', 'ven', 'tor', 'lu', 'mi', 'dex', 'ar', 'no', 'qua', 'sel', 'bri', 'fy', 'om',
+              'tek', 'ura', 'vo', 'xi', 'pel', 'gan', 'sho', 'bel', 'cy', 'dra', 'eo', 'fin', 'hal', 'jun', 'ly']
+
+
+def _event_title(rng):
+    """Most events have a name of their own ("Zovenri Climate Jam Lagos"); a
+    quarter only have a generic title ("Global AI Hackathon") that many
+    events share, the way real listings do."""
+    topic, kind = rng.choice(_TOPICS), rng.choice(_KINDS)
+    if rng.random() < 0.25:
+        return f'{rng.choice(_PREFIXES)} {topic} {kind}'
+    name = ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(3, 4))).capitalize()
+    return f'{name} {topic} {kind} {rng.choice(_CITIES)}'.strip()
+
+
+def _synthetic_records(n, duplicate_ratio=0.1, dated=True, seed=1):
+    """Listing-like records: `n * (1 - duplicate_ratio)` events, several sharing
+    a generic title, plus cross-source copies of some events with slightly
+    different titles. Every record has its own link."""
+    rng = random.Random(seed)
+    unique = int(n * (1 - duplicate_ratio))
+    sources = ['Devpost', 'Devfolio', 'MLH', 'Hackathon.com']
+    base = []
+    for i in range(unique):
+        month, day = rng.randint(1, 12), rng.randint(1, 26)
+        base.append({
+            'title': _event_title(rng),
+            'date': f'2026-{month:02d}-{day:02d}',
+            'start': f'2026-{month:02d}-{day:02d}' if dated else None,
+            'end': f'2026-{month:02d}-{day + 2:02d}' if dated else None,
+            'link': f'https://event-{i}.devpost.com/?ref_feature=challenge&ref_medium=discover',
+            'source': sources[i % len(sources)],
+        })
+    # Duplicates are the same event listed again by another source, under its own
+    # link and with the title written a little differently.
+    copies = []
+    for i in range(n - unique):
+        original = rng.choice(base)
+        title = original['title'] + rng.choice(['', ' 2026', ' Edition', '!'])
+        source = rng.choice([s for s in sources if s != original['source']])
+        copies.append(dict(original, title=title, source=source, link=f'https://listing.example/{source}/{i}'))
+    records = base + copies
+    rng.shuffle(records)
+    return records, unique
+
+
+def bench_dedupe(sizes, repeat):
+    from flaskr.dedupe import dedupe
+    results = {}
+    for n, dated in [(n, dated) for n in sizes for dated in (True, False)]:
+        records, events = _synthetic_records(n, dated=dated)
+        best, median, (unique, duplicates) = _best_of(lambda: dedupe(records), repeat)
+        results[f'{n}' if dated else f'{n}_undated'] = {
+            'records': n,
+            'events': events,
+            'unique': len(unique),
+            'seconds': round(best, 5),
+            'median_seconds': round(median, 5),
+            'records_per_sec': round(n / best, 1) if best else None,
+        }
+    return results
+
+
+@contextlib.contextmanager
+def _replaying(server):
+    previous = os.environ.get('SCRAPER_REPLAY_URL')
+    os.environ['SCRAPER_REPLAY_URL'] = server.url
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop('SCRAPER_REPLAY_URL', None)
+        else:
+            os.environ['SCRAPER_REPLAY_URL'] = previous
+
+
+def bench_e2e(repeat):
+    from flaskr import scraping
+    results = {}
+
+    with ReplayServer() as server, _replaying(server), _quiet():
+        best, median, records = _best_of(scraping.fetch_all_hackathons, repeat)
+        # One more run once every page has validators: all of it should be 304s.
+        cold = len(server.requests)
+        start = time.perf_counter()
+        scraping.fetch_all_hackathons()
+        warm = time.perf_counter() - start
+    revalidated = server.requests[cold:]
+    results['http'] = {
+        'records': len(records),
+        'seconds': round(best, 4),
+        'median_seconds': round(median, 4),
+        'requests': cold,
+    }
+    results['http_revalidate'] = {
+        'seconds': round(warm, 4),
+        'requests': len(revalidated),
+        'not_modified': sum(1 for _, status in revalidated if status == 304),
+    }
+
+    # Browser path: Devpost served as an infinite-scroll page fed by the API stand-in.
+    routes = default_routes()
+    routes['/devpost.com/hackathons'] = lazy_devpost_route(load_devpost_api_items())
+    mode = scraping.DEVPOST_MODE
+    scraping.DEVPOST_MODE = 'browser'
+    try:
+        with ReplayServer(routes=routes) as server, _replaying(server):
+            start = time.perf_counter()
+            with _quiet():
+                records = scraping.scrape_devpost()
+            elapsed = time.perf_counter() - start
+        results['devpost_lazy_browser'] = {
+            'records': len(records),
+            'seconds': round(elapsed, 4),
+            'requests': len(server.requests),
+        }
+    except Exception as e:
+        results['devpost_lazy_browser'] = {'skipped': f'{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ""}'}
+    finally:
+        scraping.DEVPOST_MODE = mode
+    return results
+
+
+def bench_flask(client_counts, requests_per_client):
+    from flaskr import create_app
+    app = create_app({'TESTING': True, 'SNAPSHOT_AUTO_REFRESH': False})
+    with app.test_client() as client:
+        client.get('/')  # warm up template compilation and snapshot load
+
+    results = {}
+    for clients in client_counts:
+        latencies = []
+        lock = threading.Lock()
+
+        def worker():
+            local = []
+            with app.test_client() as client:
+                for _ in range(requests_per_client):
+                    start = time.perf_counter()
+                    response = client.get('/')
+                    response.get_data()
+                    local.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(clients)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - start
+        latencies.sort()
+        results[str(clients)] = {
+            'requests': len(latencies),
+            'p50_ms': round(latencies[len(latencies) // 2] * 1000, 2),
+            'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+            'max_ms': round(latencies[-1] * 1000, 2),
+            'requests_per_sec': round(len(latencies) / wall, 1),
+        }
+    return results
+
+
+_STARTUP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+rss_kb = None
+try:
+    with open('/proc/self/status') as f:
+        rss_kb = next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+except (OSError, StopIteration):
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+heavy = sorted({m.split('.')[0] for m in sys.modules} & set(%r))
+print(json.dumps({'seconds': elapsed, 'rss_kb': rss_kb, 'heavy_modules': heavy}))
+"""
+
+STARTUP_TARGETS = {
+    'web': "import flaskr\nflaskr.create_app({'TESTING': True, 'SNAPSHOT_AUTO_REFRESH': False})",
+    'scraper': 'import flaskr.scraping',
+}
+
+
+def bench_startup(repeat):
+    """Cold import time and RSS of a web process versus the scraper stack, each in a fresh interpreter."""
+    results = {}
+    for name, code in STARTUP_TARGETS.items():
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, '-c', _STARTUP_PROBE % (code, HEAVY_MODULES)],
+                                 cwd=str(root), capture_output=True, text=True, check=True)
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        times = sorted(r['seconds'] for r in runs)
+        results[name] = {
+            'seconds': round(times[0], 4),
+            'median_seconds': round(statistics.median(times), 4),
+            'rss_mb': round(min(r['rss_kb'] for r in runs) / 1024, 1),
+            'heavy_modules': runs[-1]['heavy_modules'],
+        }
+    return results
+
+
+def _timings(results, prefix=''):
+    """Flatten every `seconds`/`rss_mb`/`*_ms` value into {path: value}."""
+    flat = {}
+    for key, value in results.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(_timings(value, path + '.'))
+        elif key in ('seconds', 'rss_mb') or key.endswith('_ms'):
+            flat[path] = value
+    return flat
+
+
+def compare(current, previous):
+    old = _timings(previous.get('results', {}))
+    for path, value in sorted(_timings(current['results']).items()):
+        before = old.get(path)
+        if before:
+            print(f'{path:55} {before:>10} -> {value:>10}  ({(value - before) / before * 100:+.1f}%)')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    parser.add_argument('--only', default=','.join(SECTIONS), help='comma-separated sections to run')
+    parser.add_argument('--quick', action='store_true', help='fewer repeats and smaller inputs')
+    args = parser.parse_args(argv)
+
+    sections = [s.strip() for s in args.only.split(',') if s.strip()]
+    repeat = 2 if args.quick else 5
+    results = {}
+    for section in sections:
+        print(f'Running {section} benchmarks...')
+        if section == 'parse':
+            results['parse'] = bench_parse(repeat)
+        elif section == 'dedupe':
+            sizes = [1000, 10000] if args.quick else [1000, 10000, 100000]
+            results['dedupe'] = bench_dedupe(sizes, repeat)
+        elif section == 'e2e':
+            results['e2e'] = bench_e2e(1 if args.quick else 3)
+        elif section == 'flask':
+            results['flask'] = bench_flask([1, 8] if args.quick else [1, 8, 32], 5 if args.quick else 20)
+        elif section == 'startup':
+            results['startup'] = bench_startup(3 if args.quick else 7)
+        else:
+            parser.error(f'unknown section: {section}')
+
+    report = {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parser_backend': parsers.PARSER_BACKEND,
+        'results': results,
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(results, indent=2))
+    print(f'Wrote {args.out}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Check that every parser backend returns the same records on the saved pages.
+
+Parses each listing fixture under scraper_flask/fixtures/ with the stdlib
+`html.parser` backend and with every other available backend, and exits
+non-zero if any of them disagree.
+
+Usage: python scripts/check_parsers.py
+"""
+import contextlib
+import io
+import os
+import sys
+from pathlib import Path
+
+root = Path(__file__).resolve().parents[1]
+if str(root) not in sys.path:
+    sys.path.insert(0, str(root))
+
+from flaskr import parsers
+from flaskr.replay import FIXTURES_DIR
+
+LISTING_FIXTURES = {
+    'Devpost': 'devpost.com/hackathons.html',
+    'Devfolio': 'devfolio.co/hackathons.html',
+    'MLH': 'mlh.io/seasons/2025/events.html',
+    'Hackathon.com': 'www.hackathon.com/online.html',
+}
+
+
+def main():
+    backends = ['html.parser'] + (['lxml'] if parsers.lxml is not None else [])
+    failures = 0
+    for source, rel in LISTING_FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, rel), encoding='utf-8') as f:
+            html = f.read()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = {backend: parsers.parse_listing(html, source, backend) for backend in backends}
+        reference = results['html.parser']
+        for backend, records in results.items():
+            ok = records == reference
+            failures += not ok
+            print(f"{source:14} {backend:12} {len(records):4} records {'ok' if ok else 'MISMATCH'}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,26 @@
 """
 Runner script used by GitHub Actions (or local runs).
-- Imports fetch_all_hackathons from flaskr.scraping
-- Writes output to scraper_flask/data/hackathons.json
+- Scrapes only the sources that are due according to the per-source
+  scheduler state in scraper_flask/data/source_state.json (flaskr/scheduler.py);
+  pass --all to scrape every source
+- Writes output to scraper_flask/data/hackathons.json, plus content-hashed,
+  precompressed copies, a delta from recent versions and manifest.json
+  (see flaskr/artifacts.py)
+- With --enrich (or SCRAPER_ENRICH=1), adds prize, location, themes and
+  deadline from each hackathon's detail page (flaskr/enrich.py), cached in
+  scraper_flask/cache/details
+- Upserts the run into the SQLite store the Flask app reads
+  (scraper_flask/instance/flaskr.sqlite, or $SCRAPER_DATABASE)
+- Writes per-source, per-stage timings to scraper_flask/data/run_report.json
 - Prints debug info to stdout (kept intentionally)
 
-Usage: python scripts/run_scraper.py
+Usage: python scripts/run_scraper.py [--all] [--enrich]
 """
+import argparse
 import json
 import os
 import sys
+import time
 import traceback
 from pathlib import Path
 
@@ -17,26 +29,71 @@ root = Path(__file__).resolve().parents[1]
 if str(root) not in sys.path:
     sys.path.insert(0, str(root))
 
-from flaskr.scraping import fetch_all_hackathons
+from flaskr.artifacts import write_artifacts
+from flaskr.db import HackathonStore
+from flaskr.driver_pool import shutdown_pool
+from flaskr.enrich import enrich_hackathons
+from flaskr.metrics import METRICS
+from flaskr.scheduler import SourceScheduler
+from flaskr.scraping import SCRAPERS, merge_hackathons, scrape_sources
 
 OUT_DIR = root / 'data'
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 OUT_FILE = OUT_DIR / 'hackathons.json'
+REPORT_FILE = OUT_DIR / 'run_report.json'
+STATE_FILE = OUT_DIR / 'source_state.json'
+DB_FILE = Path(os.environ.get('SCRAPER_DATABASE') or root / 'instance' / 'flaskr.sqlite')
 
 
-def main():
+def write_report(started_at, count, error=None, statuses=None):
+    """Dump the run's stage timings so slow sources and stages can be spotted."""
+    report = {
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(started_at)),
+        'duration_seconds': round(time.time() - started_at, 3),
+        'count': count,
+        'error': error,
+        'status': statuses or {},
+        'sources': METRICS.snapshot(),
+    }
+    with REPORT_FILE.open('w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f'Run report written to {REPORT_FILE}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--all', action='store_true', help='scrape every source, due or not')
+    parser.add_argument('--enrich', action='store_true', default=os.environ.get('SCRAPER_ENRICH') == '1',
+                        help='add details from each hackathon page')
+    args = parser.parse_args(argv)
+
+    started_at = time.time()
     try:
-        print("Running fetch_all_hackathons()...")
-        hacks = fetch_all_hackathons()
+        scheduler = SourceScheduler(str(STATE_FILE), [name for name, _ in SCRAPERS])
+        hacks, statuses = scheduler.run(scrape_sources, merge_hackathons, force=args.all)
+        if hacks is None:
+            print('No source changed; keeping the current data files')
+            write_report(started_at, 0, statuses=statuses)
+            return 0
+        if args.enrich and hacks:
+            enrich_hackathons(hacks)
         print(f"Fetched {len(hacks)} hackathons. Writing to {OUT_FILE}")
-        with OUT_FILE.open('w', encoding='utf-8') as f:
-            json.dump(hacks, f, ensure_ascii=False, indent=2)
+        write_artifacts(hacks, OUT_DIR)
+        if hacks:
+            DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+            HackathonStore(str(DB_FILE)).save(hacks)
+            print(f'Saved {len(hacks)} hackathons to {DB_FILE}')
+        write_report(started_at, len(hacks), statuses=statuses)
         print('Done')
         return 0
-    except Exception:
+    except Exception as e:
         print('Scraper failed:')
         traceback.print_exc()
+        write_report(started_at, 0, error=str(e))
         return 2
+    finally:
+        # Quit the pooled browsers now rather than relying on interpreter exit.
+        shutdown_pool()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,42 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Tests run from scraper_flask/ or the repository root; import flaskr from here.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from flaskr import create_app  # noqa: E402
+
+
+@pytest.fixture
+def records():
+    return [
+        {'title': 'AI Hackathon', 'date': 'Oct 24 - 25, 2026', 'link': 'https://ai.devpost.com/', 'source': 'Devpost',
+         'start': '2026-10-24', 'end': '2026-10-25', 'sort_start': 20261024, 'sort_end': 20261025},
+        {'title': 'Climate Jam', 'date': 'Mar 8th - 10th', 'link': 'https://mlh.io/e/climate', 'source': 'MLH',
+         'start': '2026-03-08', 'end': '2026-03-10', 'sort_start': 20260308, 'sort_end': 20260310},
+        {'title': 'Web3 Sprint', 'date': 'Starts 06/08/26', 'link': 'https://devfolio.co/w3', 'source': 'Devfolio',
+         'start': None, 'end': None, 'sort_start': None, 'sort_end': None},
+    ]
+
+
+@pytest.fixture
+def app(tmp_path, records):
+    snapshot = tmp_path / 'hackathons.json'
+    snapshot.write_text(json.dumps(records), encoding='utf-8')
+    app = create_app({
+        'TESTING': True,
+        'DATABASE': str(tmp_path / 'flaskr.sqlite'),
+        'SNAPSHOT_PATH': str(snapshot),
+        'SNAPSHOT_AUTO_REFRESH': False,
+    })
+    yield app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
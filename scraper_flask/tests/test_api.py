@@ -0,0 +1,49 @@
+import gzip
+import json
+
+
+def test_api_revalidates_with_304(client):
+    first = client.get('/api/hackathons?q=ai')
+    assert first.status_code == 200
+    assert [h['title'] for h in first.get_json()['items']] == ['AI Hackathon']
+    etag = first.headers['ETag'].strip('"')
+
+    again = client.get('/api/hackathons?q=ai', headers={'If-None-Match': f'"{etag}"'})
+    assert again.status_code == 304
+    assert again.data == b''
+
+    other = client.get('/api/hackathons?q=climate', headers={'If-None-Match': f'"{etag}"'})
+    assert other.status_code == 200
+
+
+def test_api_accepts_the_gzip_etag(client):
+    first = client.get('/api/hackathons?page_size=100', headers={'Accept-Encoding': 'gzip'})
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    if first.headers.get('Content-Encoding') == 'gzip':
+        assert etag.endswith('-gzip"')
+        assert json.loads(gzip.decompress(first.data))['total'] == 3
+
+    again = client.get('/api/hackathons?page_size=100',
+                       headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert again.status_code == 304
+
+
+def test_api_rejects_bad_paging(client):
+    response = client.get('/api/hackathons?page=two')
+    assert response.status_code == 400
+
+
+def test_page_and_dataset_revalidate(client):
+    for path in ('/', '/hackathons.json'):
+        first = client.get(path, headers={'Accept-Encoding': 'gzip'})
+        assert first.status_code == 200
+        assert first.headers['Content-Encoding'] == 'gzip'
+        assert first.headers['ETag'].endswith('-gzip"')
+        gzip.decompress(first.get_data())
+
+        again = client.get(path, headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+        assert again.status_code == 304
+
+    data = client.get('/hackathons.json').get_json()
+    assert len(data) == 3
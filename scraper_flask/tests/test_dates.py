@@ -0,0 +1,55 @@
+import datetime
+
+from flaskr.dates import normalize_dates, parse_date_range, year_hint
+
+TODAY = datetime.date(2026, 10, 17)
+
+
+def test_explicit_years():
+    assert parse_date_range('May 19 - Aug 17, 2026', today=TODAY) == (
+        datetime.date(2026, 5, 19), datetime.date(2026, 8, 17))
+    assert parse_date_range('Dec 20, 2025 - Jan 05, 2026', today=TODAY) == (
+        datetime.date(2025, 12, 20), datetime.date(2026, 1, 5))
+    assert parse_date_range('Starts 06/08/26', today=TODAY) == (datetime.date(2026, 8, 6), datetime.date(2026, 8, 6))
+
+
+def test_no_year_without_hint_is_nearest_to_today():
+    start, end = parse_date_range('start 21 Oct end 23 Oct', today=TODAY)
+    assert (start, end) == (datetime.date(2026, 10, 21), datetime.date(2026, 10, 23))
+
+
+def test_no_year_uses_title_year():
+    start, _ = parse_date_range('Mar 8th - 10th', today=TODAY, hint=year_hint('DevSummit 2026 #3'))
+    assert start == datetime.date(2026, 3, 8)
+
+
+def test_no_year_uses_season():
+    hint = year_hint('PixelJam India #4', season=2025)
+    assert parse_date_range('Mar 8th - 10th', today=TODAY, hint=hint)[0] == datetime.date(2025, 3, 8)
+    # The 2025 season starts in August 2024.
+    assert parse_date_range('Oct 7th - 9th', today=TODAY, hint=hint)[0] == datetime.date(2024, 10, 7)
+
+
+def test_ambiguous_title_years_give_no_hint():
+    assert year_hint('From 2025 to 2026') is None
+
+
+def test_month_rollover_without_year():
+    start, end = parse_date_range('Oct 30th - 2nd', today=TODAY, hint=('year', 2026))
+    assert (start, end) == (datetime.date(2026, 10, 30), datetime.date(2026, 11, 2))
+
+
+def test_normalize_dates_marks_season_events_past():
+    records = [
+        {'title': 'Hack the Spring', 'date': 'Mar 8th - 10th', 'source': 'MLH'},
+        {'title': 'DevSummit 2026 #3', 'date': 'Mar 8th - 10th', 'source': 'MLH'},
+        {'title': 'Later', 'date': 'Dec 31, 2026', 'source': 'Devpost'},
+    ]
+    records, past = normalize_dates(records, today=TODAY, seasons={'MLH': 2025})
+    assert [r['start'] for r in records] == ['2025-03-08', '2026-03-08', '2026-12-31']
+    assert [r['past'] for r in records] == [True, True, False]
+    assert past == 2
+    assert records[1]['sort_start'] == 20260308
+
+    kept, _ = normalize_dates([dict(r) for r in records], today=TODAY, drop_past=True, seasons={'MLH': 2025})
+    assert [r['title'] for r in kept] == ['Later']
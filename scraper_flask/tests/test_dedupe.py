@@ -0,0 +1,87 @@
+from flaskr.dedupe import canonical_url, dedupe, url_key
+
+
+def test_canonical_url_drops_tracking_and_normalizes():
+    url = 'HTTP://WWW.Example.com:443/event/?utm_source=x&b=2&ref=feed&a=1#top'
+    assert canonical_url(url) == 'https://www.example.com/event?a=1&b=2'
+    assert url_key(url) == 'example.com/event?a=1&b=2'
+
+
+def test_canonical_url_keeps_identifying_query():
+    assert canonical_url('https://www.hackathon.com/event?id=1') != canonical_url('https://www.hackathon.com/event?id=2')
+
+
+def test_same_link_with_tracking_params_merges():
+    unique, dupes = dedupe([
+        {'title': 'Hack A', 'link': 'https://a.devpost.com/?ref_feature=challenge', 'source': 'Devpost'},
+        {'title': 'Hack A', 'link': 'https://a.devpost.com', 'source': 'Devpost'},
+    ])
+    assert dupes == 1
+    assert unique[0]['link'] == 'https://a.devpost.com'
+
+
+def test_cross_source_near_duplicates_merge():
+    unique, dupes = dedupe([
+        {'title': 'Global AI Hackathon 2026', 'link': 'https://ai.devpost.com', 'source': 'Devpost',
+         'start': '2026-10-24', 'end': '2026-10-25'},
+        {'title': 'Global AI Hackathon', 'link': 'https://mlh.io/e/ai', 'source': 'MLH',
+         'start': '2026-10-24', 'end': '2026-10-26'},
+    ])
+    assert dupes == 1
+    assert unique[0]['sources'] == ['Devpost', 'MLH']
+
+
+def test_merges_are_not_transitive_within_a_source():
+    dates = {'start': '2026-05-01', 'end': '2026-05-02'}
+    unique, dupes = dedupe([
+        {'title': 'AI Hackathon', 'link': 'https://a.devpost.com', 'source': 'Devpost', **dates},
+        {'title': 'AI Hackathon', 'link': 'https://mlh.io/e/ai', 'source': 'MLH', **dates},
+        {'title': 'AI Hackathon', 'link': 'https://b.devpost.com', 'source': 'Devpost', **dates},
+    ])
+    links = {r['link'] for r in unique}
+    assert dupes == 1
+    assert {'https://a.devpost.com', 'https://b.devpost.com'} <= links
+
+
+def test_undated_generic_titles_stay_apart():
+    unique, dupes = dedupe([
+        {'title': 'Global AI Hackathon', 'link': 'https://ai.devpost.com', 'source': 'Devpost'},
+        {'title': 'Global AI Hackathon', 'link': 'https://mlh.io/e/ai', 'source': 'MLH'},
+        {'title': 'Global AI Jam', 'link': 'https://devfolio.co/e/ai', 'source': 'Devfolio'},
+    ])
+    assert dupes == 0
+    assert len(unique) == 3
+
+
+def test_undated_distinctive_titles_merge():
+    unique, dupes = dedupe([
+        {'title': 'Zovenri Climate Jam Lagos', 'link': 'https://zovenri.devpost.com', 'source': 'Devpost'},
+        {'title': 'Zovenri Climate Jam Lagos 2026', 'link': 'https://mlh.io/e/zovenri', 'source': 'MLH'},
+    ])
+    assert dupes == 1
+    assert unique[0]['sources'] == ['Devpost', 'MLH']
+
+
+def test_title_reused_within_a_source_needs_dates():
+    unique, dupes = dedupe([
+        {'title': 'Zovenri Climate Jam Lagos', 'link': 'https://a.devpost.com', 'source': 'Devpost'},
+        {'title': 'Zovenri Climate Jam Lagos', 'link': 'https://b.devpost.com', 'source': 'Devpost',
+         'start': '2026-05-01', 'end': '2026-05-02'},
+        {'title': 'Zovenri Climate Jam Lagos', 'link': 'https://mlh.io/e/zovenri', 'source': 'MLH',
+         'start': '2026-05-02', 'end': '2026-05-03'},
+    ])
+    links = {r['link'] for r in unique}
+    assert dupes == 1
+    assert {'https://a.devpost.com', 'https://b.devpost.com'} <= links
+
+
+def test_conflicting_years_and_dates_stay_apart():
+    unique, _ = dedupe([
+        {'title': 'DevSummit 2025', 'link': 'https://a.devpost.com', 'source': 'Devpost'},
+        {'title': 'DevSummit 2026', 'link': 'https://mlh.io/e/ds', 'source': 'MLH'},
+        {'title': 'Climate Jam', 'link': 'https://c.devpost.com', 'source': 'Devpost',
+         'start': '2026-03-01', 'end': '2026-03-02'},
+        {'title': 'Climate Jam', 'link': 'https://mlh.io/e/cj', 'source': 'MLH',
+         'start': '2026-09-01', 'end': '2026-09-02'},
+    ])
+    assert len(unique) == 4
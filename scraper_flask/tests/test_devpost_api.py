@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from flaskr import scraping
+from flaskr.replay import ReplayServer, devpost_api_route
+
+API_PATH = '/devpost.com/api/hackathons'
+
+
+def items(n):
+    return [{'title': f'Hack {i}', 'submission_period_dates': 'Nov 01 - 03, 2026',
+             'url': f'https://hack{i}.devpost.com/'} for i in range(n)]
+
+
+def without_total(route):
+    """The same pages without `meta.total_count`, so only a short page ends the crawl."""
+    def wrapped(query):
+        status, headers, body = route(query)
+        data = json.loads(body)
+        data['meta'].pop('total_count')
+        return status, headers, json.dumps(data).encode('utf-8')
+    return wrapped
+
+
+def requested_pages(server):
+    return sorted(int(path.rsplit('=', 1)[1]) for path, _ in server.requests if path.startswith(API_PATH))
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    monkeypatch.setattr(scraping, 'DEVPOST_API_FANOUT', 4)
+    servers = []
+
+    def serve(route):
+        server = ReplayServer(routes={API_PATH: route})
+        server.start()
+        servers.append(server)
+        monkeypatch.setenv('SCRAPER_REPLAY_URL', server.url)
+        return server
+    yield serve
+    for server in servers:
+        server.stop()
+
+
+def test_reads_every_page_and_no_more(serve):
+    server = serve(devpost_api_route(items(20), per_page=3))
+    records = scraping._fetch_devpost_api()
+    assert len(records) == 20
+    assert records[0]['link'] == 'https://hack0.devpost.com/' + scraping.DEVPOST_LINK_SUFFIX
+    assert requested_pages(server) == list(range(1, 8))
+
+
+def test_stops_at_the_first_short_page(serve):
+    server = serve(without_total(devpost_api_route(items(20), per_page=3)))
+    assert len(scraping._fetch_devpost_api()) == 20
+    # Page 7 is short; only the rest of its batch (pages 8 and 9) went out with it.
+    assert requested_pages(server) == list(range(1, 10))
+
+
+def test_max_pages_caps_the_crawl(serve, monkeypatch):
+    monkeypatch.setattr(scraping, 'DEVPOST_API_MAX_PAGES', 3)
+    server = serve(without_total(devpost_api_route(items(100), per_page=3)))
+    assert len(scraping._fetch_devpost_api()) == 9
+    assert requested_pages(server) == [1, 2, 3]
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from flaskr.enrich import Enricher, extract_details, site_key
+from flaskr.replay import ReplayServer, detail_page_fallback
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    with ReplayServer(fallback=detail_page_fallback()) as server:
+        monkeypatch.setenv('SCRAPER_REPLAY_URL', server.url)
+        yield server
+
+
+def test_site_key_groups_subdomains():
+    assert site_key('xprize.devpost.com') == site_key('devpost.com') == 'devpost.com'
+    assert site_key('events.example.co.uk') == 'example.co.uk'
+    assert site_key('a.b.mlh.io') == 'mlh.io'
+    assert site_key('127.0.0.1:8000') == '127.0.0.1:8000'
+
+
+def test_extract_details_from_text():
+    html = ('<html><body><p>Join us in-person at MIT. Over $25k in prizes! '
+            'Registration closes Nov 3rd, 2026.</p><span class="theme-label">AI</span></body></html>')
+    assert extract_details(html) == {
+        'prize': '$25k', 'location': None, 'online': False, 'themes': ['AI'], 'deadline': '2026-11-03'}
+
+
+def test_devpost_subdomains_share_one_politeness_gate(replay, tmp_path):
+    records = [{'title': f'H{i}', 'link': f'https://h{i}.devpost.com/'} for i in range(5)]
+    enricher = Enricher(str(tmp_path), workers=5, per_host=1, delay=0.05)
+    start = time.monotonic()
+    enricher.enrich(records)
+    assert time.monotonic() - start >= 0.2
+    assert enricher.stats['fetched'] == 5
+    assert all(r['prize'] and r['themes'] for r in records)
+
+
+def test_cache_is_fresh_then_revalidated(replay, tmp_path):
+    records = [{'title': 'H', 'link': 'https://h.devpost.com/?utm_source=x'}]
+    Enricher(str(tmp_path), delay=0).enrich(records)
+
+    fresh = Enricher(str(tmp_path), delay=0)
+    fresh.enrich([dict(records[0])])
+    assert fresh.stats['fresh'] == 1
+
+    stale = Enricher(str(tmp_path), delay=0, ttl=0)
+    again = [dict(title='H', link='https://h.devpost.com/')]
+    stale.enrich(again)
+    assert stale.stats['revalidated'] == 1
+    assert again[0]['prize'] == records[0]['prize']
+    assert replay.requests[-1][1] == 304
+
+
+def test_cache_evicts_least_recently_used(replay, tmp_path):
+    records = [{'title': f'H{i}', 'link': f'https://h{i}.devpost.com/'} for i in range(6)]
+    enricher = Enricher(str(tmp_path), delay=0, max_entries=4)
+    enricher.enrich(records)
+    assert sum(1 for p in tmp_path.rglob('*.json')) == 4
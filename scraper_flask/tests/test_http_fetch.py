@@ -0,0 +1,39 @@
+import pytest
+
+from flaskr.http_fetch import HttpFetcher, replay_url
+from flaskr.replay import ReplayServer
+
+LISTING = 'https://mlh.io/seasons/2025/events'
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    with ReplayServer() as server:
+        monkeypatch.setenv('SCRAPER_REPLAY_URL', server.url)
+        yield server
+
+
+def test_replay_url_keeps_host_path_and_query(monkeypatch):
+    monkeypatch.setenv('SCRAPER_REPLAY_URL', 'http://127.0.0.1:9/')
+    assert replay_url('https://devpost.com/api/hackathons?page=2') == \
+        'http://127.0.0.1:9/devpost.com/api/hackathons?page=2'
+    monkeypatch.delenv('SCRAPER_REPLAY_URL')
+    assert replay_url(LISTING) == LISTING
+
+
+def test_second_fetch_is_a_conditional_get(replay):
+    fetcher = HttpFetcher()
+    first = fetcher.get(replay_url(LISTING))
+    again = fetcher.get(replay_url(LISTING))
+
+    assert (first.status, first.not_modified) == (200, False)
+    assert (again.status, again.not_modified) == (304, True)
+    assert again.text == first.text
+    assert replay.requests == [('/mlh.io/seasons/2025/events', 200), ('/mlh.io/seasons/2025/events', 304)]
+
+
+def test_validators_survive_in_the_cache_dir(replay, tmp_path):
+    HttpFetcher(cache_dir=str(tmp_path)).get(replay_url(LISTING))
+    result = HttpFetcher(cache_dir=str(tmp_path)).get(replay_url(LISTING))
+    assert result.not_modified
+    assert replay.requests[-1][1] == 304
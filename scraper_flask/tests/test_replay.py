@@ -0,0 +1,29 @@
+import pytest
+
+from flaskr import scraping
+from flaskr.dedupe import url_key
+from flaskr.replay import ReplayServer
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    with ReplayServer() as server:
+        monkeypatch.setenv('SCRAPER_REPLAY_URL', server.url)
+        yield server
+
+
+def test_scrape_and_merge_against_saved_pages(replay, monkeypatch):
+    # The saved pages need no browser with the Devpost API.
+    monkeypatch.setattr(scraping, 'DEVPOST_MODE', 'api')
+    by_source, statuses = scraping.scrape_sources()
+    assert {name: status['state'] for name, status in statuses.items()} == {
+        name: 'ok' for name, _ in scraping.SCRAPERS}
+    assert all(by_source.values())
+
+    scraped = [r for records in by_source.values() for r in records]
+    hackathons = scraping.merge_hackathons(scraped)
+    assert 0 < len(hackathons) <= len(scraped)
+    keys = [url_key(h['link']) for h in hackathons if h.get('link')]
+    assert len(keys) == len(set(keys))
+    assert all(h['title'] for h in hackathons)
+    assert replay.requests
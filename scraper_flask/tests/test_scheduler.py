@@ -0,0 +1,97 @@
+import pytest
+
+from flaskr import scheduler
+from flaskr.orchestrator import Unchanged
+from flaskr.scheduler import SourceScheduler, content_unchanged
+
+HOUR = 60 * 60
+
+
+class FakeSource:
+    """A scrape callable serving fixed listing HTML per source."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, names):
+        self.calls.append(list(names))
+        results, statuses = {}, {}
+        for name in names:
+            try:
+                content_unchanged(name, self.pages[name])
+            except Unchanged:
+                statuses[name] = {'state': 'unchanged'}
+                continue
+            results[name] = [{'title': f'{name} {self.pages[name]}', 'source': name}]
+            statuses[name] = {'state': 'ok'}
+        return results, statuses
+
+
+@pytest.fixture(autouse=True)
+def intervals(monkeypatch):
+    monkeypatch.setattr(scheduler, 'MIN_INTERVAL', HOUR)
+    monkeypatch.setattr(scheduler, 'MAX_INTERVAL', 16 * HOUR)
+    monkeypatch.setattr(scheduler, 'DEFAULT_INTERVAL', 4 * HOUR)
+
+
+def merge(records):
+    return sorted(r['title'] for r in records)
+
+
+def test_changed_then_unchanged_then_skipped(tmp_path):
+    path = str(tmp_path / 'state.json')
+    source = FakeSource({'A': 'v1', 'B': 'v1'})
+
+    merged, statuses = SourceScheduler(path, ['A', 'B']).run(source, merge, now=0)
+    assert merged == ['A v1', 'B v1']
+    assert {s['interval'] for s in statuses.values()} == {2 * HOUR}
+
+    merged, statuses = SourceScheduler(path, ['A', 'B']).run(source, merge, now=2 * HOUR)
+    assert merged is None
+    assert statuses['A'] == {'state': 'unchanged', 'interval': 3 * HOUR}
+
+    merged, statuses = SourceScheduler(path, ['A', 'B']).run(source, merge, now=3 * HOUR)
+    assert merged is None
+    assert statuses['A']['state'] == 'skipped'
+    assert source.calls == [['A', 'B'], ['A', 'B']]
+
+
+def test_one_changed_source_is_merged_with_the_cached_rest(tmp_path):
+    path = str(tmp_path / 'state.json')
+    source = FakeSource({'A': 'v1', 'B': 'v1'})
+    SourceScheduler(path, ['A', 'B']).run(source, merge, now=0)
+
+    source.pages['B'] = 'v2'
+    merged, statuses = SourceScheduler(path, ['A', 'B']).run(source, merge, now=2 * HOUR)
+    assert merged == ['A v1', 'B v2']
+    assert statuses['A']['interval'] == 3 * HOUR
+    assert statuses['B']['interval'] == HOUR
+
+
+def test_interval_stays_within_bounds(tmp_path):
+    path = str(tmp_path / 'state.json')
+    source = FakeSource({'A': 'v0'})
+    now = 0
+    for n in range(4):
+        source.pages['A'] = f'v{n}'
+        SourceScheduler(path, ['A']).run(source, merge, now=now)
+        now += HOUR
+    assert SourceScheduler(path, ['A']).state['sources']['A']['interval'] == HOUR
+
+    for _ in range(10):
+        SourceScheduler(path, ['A']).run(source, merge, force=True, now=now)
+        now += 16 * HOUR
+    assert SourceScheduler(path, ['A']).state['sources']['A']['interval'] == 16 * HOUR
+
+
+def test_failed_source_keeps_records_and_is_retried(tmp_path):
+    path = str(tmp_path / 'state.json')
+    SourceScheduler(path, ['A']).run(FakeSource({'A': 'v1'}), merge, now=0)
+
+    def failing(names):
+        return {}, {name: {'state': 'failed', 'error': 'boom'} for name in names}
+
+    merged, _ = SourceScheduler(path, ['A']).run(failing, merge, now=2 * HOUR)
+    assert merged is None
+    assert SourceScheduler(path, ['A']).due(now=2 * HOUR) == ['A']
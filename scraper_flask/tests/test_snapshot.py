@@ -0,0 +1,45 @@
+import time
+
+from flaskr.snapshot import SnapshotCache
+
+
+def _wait(cache):
+    while cache.is_refreshing():
+        time.sleep(0.001)
+
+
+def test_failed_refresh_backs_off():
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        raise RuntimeError('source down')
+
+    cache = SnapshotCache(fetcher, ttl=3600, retry_after=60)
+    deadline = time.time() + 0.2
+    while time.time() < deadline:
+        cache.get()
+        _wait(cache)
+    assert len(calls) == 1
+    assert cache.status()['last_error'] == 'source down'
+
+    cache._attempted_at -= 61
+    cache.get()
+    _wait(cache)
+    assert len(calls) == 2
+
+
+def test_empty_refresh_keeps_data_and_backs_off():
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        return [{'title': 'A'}] if len(calls) == 1 else []
+
+    cache = SnapshotCache(fetcher, ttl=10, retry_after=60)
+    assert cache.refresh() == [{'title': 'A'}]
+    cache._fetched_at -= 11
+    for _ in range(20):
+        assert cache.get() == [{'title': 'A'}]
+        _wait(cache)
+    assert len(calls) == 2
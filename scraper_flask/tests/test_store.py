@@ -0,0 +1,107 @@
+from flaskr import artifacts, db
+from flaskr.artifacts import compute_delta, record_key, write_artifacts
+from flaskr.db import HackathonStore
+
+
+def _records():
+    return [
+        {'title': 'Event One', 'link': 'https://www.hackathon.com/event?id=1', 'source': 'Hackathon.com'},
+        {'title': 'Event Two', 'link': 'https://www.hackathon.com/event?id=2', 'source': 'Hackathon.com'},
+        {'title': 'AI Hack', 'link': 'https://ai.devpost.com', 'source': 'Devpost', 'sources': ['Devpost', 'MLH']},
+    ]
+
+
+def test_record_key_matches_dedupe_identity():
+    assert record_key({'link': 'https://www.hackathon.com/event?id=1&utm_source=x'}) == 'hackathon.com/event?id=1'
+    assert record_key({'link': 'https://www.hackathon.com/event?id=2'}) == 'hackathon.com/event?id=2'
+    assert record_key({'title': 'No link'}) == 'No link'
+
+
+def test_store_keeps_records_that_differ_by_query(tmp_path):
+    store = HackathonStore(str(tmp_path / 'db.sqlite'))
+    store.save(_records(), seen_at=100.0)
+    loaded, fetched_at = store.load()
+    assert [r['title'] for r in loaded] == ['Event One', 'Event Two', 'AI Hack']
+    assert fetched_at == 100.0
+
+
+def test_store_upserts_and_drops_unseen(tmp_path):
+    store = HackathonStore(str(tmp_path / 'db.sqlite'))
+    store.save(_records(), seen_at=100.0)
+    store.save([dict(_records()[1], title='Event Two (renamed)')], seen_at=200.0)
+    loaded, _ = store.load()
+    assert [r['title'] for r in loaded] == ['Event Two (renamed)']
+
+
+def test_delta_keeps_records_that_differ_by_query():
+    old = _records()[:1]
+    new = _records()
+    delta = compute_delta(old, new)
+    assert [r['title'] for r in delta['added']] == ['Event Two', 'AI Hack']
+    assert delta['removed'] == [] and delta['changed'] == []
+
+
+def test_committed_artifacts_are_plain_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, 'DELTA_HISTORY', 2)
+    monkeypatch.setattr(artifacts, 'PRECOMPRESS', False)
+    first = write_artifacts([{'title': 'A', 'link': 'https://a.io'}], str(tmp_path))
+    manifest = write_artifacts([{'title': 'B', 'link': 'https://b.io'}], str(tmp_path))
+    delta = manifest['deltas'][first['version']]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([
+        first['data'], manifest['data'], delta, 'hackathons.json', 'manifest.json'])
+
+
+def apply_delta(records, delta):
+    """What docs/script.js applyDelta() does."""
+    removed = set(delta['removed'])
+    changed = {record_key(r): r for r in delta['changed']}
+    out = [changed.get(record_key(r), r) for r in records if record_key(r) not in removed]
+    if 'order' in delta:
+        by_key = {record_key(r): r for r in out + delta['added']}
+        return [by_key[k] for k in delta['order']]
+    for at, record in zip(delta['added_at'], delta['added']):
+        out.insert(at, record)
+    return out
+
+
+def test_delta_rebuilds_the_new_order():
+    old = [{'title': t, 'link': f'https://{t}.io'} for t in 'abcde']
+    new = [old[0], {'title': 'x', 'link': 'https://x.io'}, old[2], dict(old[3], date='May 1'),
+           {'title': 'y', 'link': 'https://y.io'}]
+    delta = compute_delta(old, new)
+    assert 'order' not in delta
+    assert delta['added_at'] == [1, 4]
+    assert apply_delta(old, delta) == new
+
+    moved = [new[3], new[1], new[0], new[4], new[2]]
+    delta = compute_delta(old, moved)
+    assert delta['order']
+    assert apply_delta(old, delta) == moved
+
+
+def test_resaving_unchanged_titles_leaves_the_fts_index_alone():
+    records = [{'title': 'Climate Jam', 'link': 'https://a.io'}, {'title': 'AI Hack', 'link': 'https://b.io'}]
+
+    def resave_changes(conn):
+        db.save_hackathons(conn, records, seen_at=1)
+        before = conn.total_changes
+        db.save_hackathons(conn, records, seen_at=2)
+        return conn.total_changes - before
+
+    plain = db.connect(':memory:')
+    plain.executescript(db.SCHEMA)
+    conn = db.connect(':memory:')
+    db.init_schema(conn)
+    # The triggers write nothing, so a re-save costs what it does without FTS.
+    assert resave_changes(conn) == resave_changes(plain)
+
+    db.save_hackathons(conn, [dict(records[0], title='Ocean Jam'), records[1]], seen_at=3)
+    assert [r['title'] for r in db.search_titles(conn, 'jam')] == ['Ocean Jam']
+    assert db.search_titles(conn, 'climate') == []
+
+
+def test_search_db_command(app, records):
+    HackathonStore(app.config['DATABASE']).save(records)
+    result = app.test_cli_runner().invoke(args=['search-db', 'clim'])
+    assert result.exit_code == 0
+    assert result.output.startswith('Climate Jam\t')
@@ -0,0 +1,25 @@
+from flaskr.metrics import METRICS
+from flaskr.waits import wait_for_count
+
+
+class FakeDriver:
+    def __init__(self, result):
+        self.result = result
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_wait_outcomes_are_counted_per_source():
+    METRICS.reset()
+    with METRICS.source('Devpost'):
+        assert wait_for_count(FakeDriver({'count': 12, 'reason': 'grew'}), '.tile', 3, stage='scroll') == (12, 'grew')
+        assert wait_for_count(FakeDriver(RuntimeError('gone')), '.tile', 3, stage='scroll') == (3, 'error')
+    devpost = METRICS.snapshot()['Devpost']
+    assert devpost['stages']['scroll']['count'] == 2
+    assert devpost['counters'] == {'scroll_error': 1, 'scroll_grew': 1}
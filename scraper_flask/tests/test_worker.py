@@ -0,0 +1,27 @@
+import flaskr
+from flaskr import create_app, db
+
+
+def test_worker_mode_does_not_resave_or_write_snapshot_file(tmp_path, monkeypatch, records):
+    database = str(tmp_path / 'flaskr.sqlite')
+    snapshot_file = tmp_path / 'hackathons.json'
+    calls = []
+
+    def fake_run_worker(path, *args, **kwargs):
+        # Stands in for the child process: it saves the run to the store itself.
+        calls.append((path, args, kwargs))
+        store = db.HackathonStore(path)
+        store.save(records, seen_at=100.0)
+        return store.load()
+
+    monkeypatch.setattr(flaskr, 'run_worker', fake_run_worker)
+    app = create_app({'TESTING': True, 'DATABASE': database, 'SNAPSHOT_PATH': str(snapshot_file),
+                      'SNAPSHOT_AUTO_REFRESH': False, 'SCRAPER_MODE': 'worker'})
+    snapshot = app.extensions['snapshot']
+    assert [r['title'] for r in snapshot.refresh()] == [r['title'] for r in records]
+
+    assert calls == [(database, (), {})]
+    assert not snapshot_file.exists()
+    conn = db.connect(database)
+    assert conn.execute('SELECT COUNT(*) FROM runs').fetchone()[0] == 1
+    conn.close()